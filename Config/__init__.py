@@ -9,6 +9,21 @@ CONFIG_PATH = path.dirname(path.abspath(__file__))
 LOG_PATH = path.join(PROJECT_PATH, '.log')
 
 DEBUG = getenv('DEBUG', 'false').lower() not in ('false', '0')  # булевый флаг
+# DEBUG-записи теста в кольцевом буфере: выводятся только при падении теста (Utils.logging.TailLogBuffer)
+LOG_TAIL_ON_FAILURE = getenv('LOG_TAIL_ON_FAILURE', 'false').lower() not in ('false', '0')  # булевый флаг
+LOG_TAIL_CAPACITY = int(getenv('LOG_TAIL_CAPACITY', '5000'))  # записей на тест
+# Allure-вложения запросов строятся фоновым потоком (Utils.report.AttachmentPipeline)
+ALLURE_ATTACH_ASYNC = getenv('ALLURE_ATTACH_ASYNC', 'true').lower() not in ('false', '0')  # булевый флаг
+ALLURE_ATTACH_MAX_SIZE = int(getenv('ALLURE_ATTACH_MAX_SIZE', str(1 << 16)))  # байт на вложение
+ALLURE_ATTACH_TEST_BUDGET = int(getenv('ALLURE_ATTACH_TEST_BUDGET', str(1 << 20)))  # байт вложений на тест
+ALLURE_ATTACH_SAMPLE_AFTER = int(getenv('ALLURE_ATTACH_SAMPLE_AFTER', '20'))  # запросов теста без семплирования
+ALLURE_ATTACH_SAMPLE_EVERY = int(getenv('ALLURE_ATTACH_SAMPLE_EVERY', '10'))  # затем каждый N-й запрос
+# Случайные данные теста воспроизводимы: seed = базовый seed + nodeid теста (Utils.RandomData.RandomData)
+RANDOM_SEED = getenv('RANDOM_SEED')  # по умолчанию - случайный на сессию
+RANDOM_POOL_SIZE = int(getenv('RANDOM_POOL_SIZE', '256'))  # значений в пакете пула RandomData
+# ID тестовых сущностей резервируются блоками в общем счетчике воркеров (Utils.IdAllocator.IdAllocator)
+ID_STATE_PATH = getenv('ID_STATE_PATH', path.join(LOG_PATH, 'test_ids.state'))  # файл общего счетчика
+ID_BLOCK_SIZE = int(getenv('ID_BLOCK_SIZE', '100'))  # ID в блоке воркера
 
 
 class Config(DotDict, metaclass=Singleton):
@@ -18,6 +18,27 @@ LINE_SEPARATOR = make_text_ansi_bold("-" * 80)
 LINE_SET_UP = make_text_ansi_bold(make_text_wrapped("SETUP IS DONE! STARTING TEST SESSION..."))
 LINE_TEAR_DOWN = make_text_ansi_bold(make_text_wrapped("TEST SESSION IS DONE! STARTING TEARDOWN..."))
 
+# Потоковая запись данных тестовой сессии в JSONL (log/test_results.jsonl) вместо JSON в конце сессии
+SESSION_DATA_STREAMING = bool(str2bool(environ.get("SESSION_DATA_STREAMING", "False")))
+SESSION_DATA_FSYNC_EVERY = 100  # тестов
+SESSION_DATA_FSYNC_INTERVAL = 5.0  # секунд
+
+# SQLite-база истории таймингов: каждый сохраненный файл сессии загружается в нее (пусто - не вести историю)
+SESSION_HISTORY_DB = environ.get("SESSION_HISTORY_DB", "")
+
+# Планирование тестов pytest-xdist по исторической длительности (LPT-first), см. tests/scheduling_hook.py
+TEST_SCHEDULING_LPT = bool(str2bool(environ.get("TEST_SCHEDULING_LPT", "False")))
+TEST_SCHEDULING_SCOPE = "class"  # единица планирования: test | class (функции вне класса - по одной) | module
+TEST_SCHEDULING_PERCENTILE = 50  # перцентиль длительности из истории
+
+# Сравнение длительностей тестов и запросов с базовой линией (median/MAD), см. Helpers/perf_regression.py
+PERF_BASELINE_FILE = environ.get("PERF_BASELINE_FILE", "")  # пусто - сравнение отключено
+PERF_BASELINE_UPDATE = bool(str2bool(environ.get("PERF_BASELINE_UPDATE", "False")))  # дописать прогон в базу
+PERF_REGRESSION_Z = 3.5  # порог robust z-score
+PERF_REGRESSION_MIN_DELTA = 0.5  # секунд
+PERF_REGRESSION_MIN_RATIO = 1.2
+PERF_REGRESSION_BUDGET = float(environ["PERF_REGRESSION_BUDGET"]) if environ.get("PERF_REGRESSION_BUDGET") else None
+
 REQUEST_TIMEOUT_CONN = 3
 REQUEST_TIMEOUT_READ = 3
 REQUEST_RETRY_COUNT = 1
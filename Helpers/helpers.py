@@ -1,12 +1,12 @@
 """helpers"""
 
-import inspect
 import logging
+import sys
 from collections.abc import Callable
 from datetime import datetime
+from functools import lru_cache
 from os import getenv, linesep
 from pathlib import Path
-from types import FrameType, MethodType
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -24,17 +24,71 @@ def get_debug_flag() -> bool:
     return str2bool(getenv("DEBUG", "False"))
 
 
+LOCAL_TIMEZONE = ZoneInfo("Europe/Moscow")
+
+
 def get_local_time() -> datetime:
     """:return: local time: datetime(timezone)"""
-    return datetime.now(ZoneInfo("Europe/Moscow"))
+    return datetime.now(LOCAL_TIMEZONE)
+
+
+def format_local_time(timestamp: float, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
+    """
+    Форматирует epoch timestamp в строку локального времени (для отложенного форматирования при экспорте)
+
+    :param timestamp: Время в секундах от epoch (Ex: `time.time()`)
+    :param fmt: Формат strftime
+    :return: str: Ex: "2025-01-31 12:00:00"
+    """
+    return datetime.fromtimestamp(timestamp, LOCAL_TIMEZONE).strftime(fmt)
+
+
+def get_xdist_worker_id(config: Any) -> str | None:
+    """
+    :param config: pytest config
+    :return: ID воркера pytest-xdist (Ex: "gw0") или None вне воркера (контроллер или запуск без xdist)
+    """
+    workerinput = getattr(config, "workerinput", None)
+    return workerinput.get("workerid") if workerinput is not None else None
+
+
+def is_xdist_controller(config: Any) -> bool:
+    """
+    :param config: pytest config
+    :return: True - процесс-контроллер pytest-xdist с воркерами (тесты выполняются в воркерах)
+        - False для запуска без воркеров (Ex: `--dist load -n 0`): тесты выполняются в текущем процессе
+    """
+    if hasattr(config, "workerinput") or getattr(config.option, "dist", "no") == "no":
+        return False
+    # Шлюзы воркеров: `-n N` разворачивается pytest-xdist в N элементов `--tx popen`
+    return bool(getattr(config.option, "tx", None) or getattr(config.option, "numprocesses", None))
+
+
+def get_worker_file_path(file_path: str | Path, worker_id: str) -> Path:
+    """
+    Путь к файлу воркера pytest-xdist рядом с основным файлом
+
+    Ex: get_worker_file_path("log/test_results.json", "gw0") -> Path("log/test_results.gw0.json")
+    """
+    file_path = Path(file_path)
+    return file_path.with_name(f'{file_path.stem}.{worker_id}{file_path.suffix}')
+
+
+@lru_cache(maxsize=None)
+def _intern_module_name(module_path: str) -> str:
+    """Имя модуля без .py по пути из nodeid (одна строка на модуль для всех его тестов)"""
+    return sys.intern(Path(module_path).stem)
 
 
 def parse_pytest_nodeid(nodeid: str) -> tuple[str, str, str] | tuple[str, None, str] | None:
-    """Разбирает pytest nodeid на компоненты"""
+    """
+    Разбирает pytest nodeid на компоненты
+        - Имена модулей и классов интернируются: тесты одного модуля/класса ссылаются на одни и те же строки
+    """
     parts = nodeid.split("::")
     module_path = parts[0]
     # Получаем имя модуля без .py
-    module = Path(module_path).stem
+    module = _intern_module_name(module_path)
 
     if len(parts) == 2:
         # Формат: tests/test_file.py::test_function
@@ -43,7 +97,7 @@ def parse_pytest_nodeid(nodeid: str) -> tuple[str, str, str] | tuple[str, None,
     elif len(parts) >= 3:
         # Формат: tests/test_file.py::TestClass::test_method
         # Игнорируем возможные вложенные классы (parts[2:] при необходимости)
-        return module, parts[1], parts[2]
+        return module, sys.intern(parts[1]), parts[2]
 
     else:
         log_and_raise(
@@ -55,114 +109,6 @@ def parse_pytest_nodeid(nodeid: str) -> tuple[str, str, str] | tuple[str, None,
         return None
 
 
-def get_method_name(instance: object, max_depth: int = 5) -> str | None:
-    """
-    Функция: определяет имя оригинального метода, учитывая декораторы
-
-    :param instance: Экземпляр класса (self)
-    :param max_depth: Максимальная глубина поиска в стеке вызовов
-    """
-    frame: FrameType = inspect.currentframe()
-    class_methods = [m for m in dir(instance) if callable(getattr(instance, m)) and not m.startswith("__")]
-
-    try:
-        for _ in range(max_depth):
-            frame = frame.f_back  # type: ignore
-            if not frame:
-                break
-
-            # Проверяем, есть ли имя функции в списке методов класса
-            method_name = frame.f_code.co_name
-            if method_name in class_methods:
-                return method_name
-
-    finally:
-        # Очищаем ссылки на фреймы для избежания утечек памяти
-        del frame
-
-    log_and_raise(
-        RuntimeError,
-        "Original method name not found in call stack",
-        logger_name=__name__,
-        log_level="error",
-    )
-
-
-def process_kwargs_timeout(method: MethodType, local_vars: dict[str, Any]) -> dict[str, Any]:
-    """
-    Функция: обрабатывает аргументы метода класса, подставляя значения по умолчанию из экземпляра
-        - Конвертирует позиционные и именованные аргументы в плоский словарь `kwargs`
-        - Явно переданные аргументы имеют приоритет над значениями по умолчанию из экземпляра
-        - Добавляет `_request_timeout` из экземпляра класса, если он не задан в аргументах метода
-    ВАЖНО:
-        - В `excluded_keys` должны быть указаны служебные переменные (Ex: `self`),
-          которые не являются аргументами целевого метода и могут вызвать ошибки
-
-    :param method: Метод класса (должен быть привязан к экземпляру, Ex: `self.method`)
-    :param local_vars: Локальные переменные метода, включая аргументы полученные через `locals()`
-    :return: Плоский словарь `kwargs` с обработанными аргументами
-    :raises ValueError: Если `method` не является `bound method` (не привязан к экземпляру класса)
-    """
-    if not inspect.ismethod(method):
-        log_and_raise(
-            ValueError,
-            "Метод должен быть связан с экземпляром класса",
-            logger_name=__name__,
-            log_level="error",
-        )
-
-    instance = method.__self__
-    logger = get_log(f'{method.__self__.__class__.__name__}.{method.__name__}')
-    # Очищаем kwargs от служебных переменных
-    excluded_keys = {"self", "local_vars"}
-    raw_kwargs = {key: value for key, value in local_vars.items() if key not in excluded_keys}
-    # Извлекаем вложенный kwargs
-    nested_kwargs = raw_kwargs.pop("kwargs", {})
-    # Собираем плоский словарь kwargs
-    kwargs = {**raw_kwargs, **nested_kwargs}
-    # Получаем значения из экземпляра
-    instance_timeout = getattr(instance, "_request_timeout", None) or getattr(instance, "request_timeout", None)
-    # Обогащаем kwargs при отсутствии значения при вызове
-    kwargs["_request_timeout"] = kwargs.pop("_request_timeout", instance_timeout)
-    logger.debug(f'Параметры запроса в API: {{"kwargs": {kwargs}}}')
-    return kwargs
-
-
-def get_error_source(instance: object) -> str:
-    """
-    Функция: определяет источник ошибки с приоритетом:
-    1. Фикстуры pytest (по имени)
-    2. Методы класса
-    3. Внешние вызовы
-
-    :param instance: Экземпляр класса (self)
-    :return: str: имя источника ошибки
-    """
-    try:
-        frames = inspect.getouterframes(inspect.currentframe().f_back.f_back.f_back)
-        class_methods = [m for m in dir(instance) if callable(getattr(instance, m)) and not m.startswith("__")]
-
-        # 1. Поиск фикстур pytest
-        for frame_info in frames:
-            if "fixture" in frame_info.function.lower() and "pytest" not in frame_info.filename:
-                return frame_info.function.split()[0]  # Возвращаем имя фикстуры из декоратора
-
-        # 2. Поиск методов класса
-        for frame_info in frames:
-            if frame_info.function in class_methods:
-                return f"{instance.__class__.__name__}.{frame_info.function}"
-
-        # 3. Первый не-pytest фрейм
-        for frame_info in frames:
-            if "pytest/" not in frame_info.filename and not frame_info.function.startswith("_"):
-                return frame_info.function
-
-    except Exception as e:  # pylint: disable=broad-exception-caught
-        LOG.error(f'Error source detection failed: {str(e)}')
-
-    return "unknown_source"
-
-
 def log_and_raise(error_type: type[Exception], message: str, from_exception: Exception | None = None, **kwargs):
     """
     Универсальный хелпер для логирования и вызова исключений
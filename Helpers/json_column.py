@@ -0,0 +1,147 @@
+"""json_column.py"""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+class JsonColumn:
+    """
+    Колонка значений wildcard-пути в dotted.notation (Ex: `dags.[*].dag_id`, `task_instances.[*].state`):
+        - Значения извлекаются за один обход JSON-объекта (`Checker.get_columns()`)
+        - В колонку попадают и `null`-значения (в т.ч. отсутствующие ключи) - с сохранением позиций элементов
+        - Проверки выполняются встроенными операциями над всей колонкой (`list.count`, `set`, `Counter`, `map`),
+          работающими на уровне C, без поэлементного цикла в Python
+        - Позиция проблемного элемента вычисляется только при обнаружении ошибки
+
+    Ex:
+        column = Checker.get_column(json_data, "task_instances.[*].state")
+        column.count("failed")      → количество задач в состоянии `failed`
+        column.not_in({"success"})  → множество недопустимых значений
+    """
+
+    __slots__ = ("key_path", "values")
+
+    def __init__(self, key_path: str, values: list[Any] | None = None):
+        self.key_path: str = key_path
+        self.values: list[Any] = values if values is not None else []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.key_path}", size={len(self.values)})'
+
+    # ------------------------------ null ---------------------------------
+
+    @property
+    def null_count(self) -> int:
+        """Количество `null`-значений (или отсутствующих ключей) в колонке"""
+        return self.values.count(None)
+
+    def first_null(self) -> int | None:
+        """:return: Индекс первого `null`-значения или None"""
+        return self.values.index(None) if None in self.values else None
+
+    # ------------------------------ типы ---------------------------------
+
+    def type_counts(self) -> Counter[type]:
+        """:return: Counter - распределение значений колонки по типам"""
+        return Counter(map(type, self.values))
+
+    def first_type_mismatch(self, allowed_types: tuple[type, ...]) -> tuple[int, Any] | None:
+        """
+        Поиск первого значения с несоответствием типа
+            - Типы значений колонки сверяются один раз по уникальным типам (`type_counts()`)
+            - Поэлементный поиск выполняется только если несоответствие найдено
+
+        :param allowed_types: Допустимые типы (Ex: (str, type(None)))
+        :return: (индекс, значение) первого несоответствия или None
+        """
+        wrong_types = {value_type for value_type in self.type_counts() if not issubclass(value_type, allowed_types)}
+        if not wrong_types:
+            return None
+        return next((idx, value) for idx, value in enumerate(self.values) if type(value) in wrong_types)
+
+    # ----------------------- уникальность и состав -----------------------
+
+    def is_unique(self) -> bool:
+        """Проверка уникальности значений колонки (dict/list-значения сравниваются без хеширования)"""
+        try:
+            return len(set(self.values)) == len(self.values)
+        except TypeError:
+            return all(count == 1 for _, count in self._counts_by_equality())
+
+    def duplicates(self) -> dict[Any, int] | list[tuple[Any, int]]:
+        """
+        :return: dict {значение: количество} для повторяющихся значений
+            или list [(значение, количество)], если в колонке есть unhashable значения (dict/list)
+        """
+        try:
+            return {value: count for value, count in Counter(self.values).items() if count > 1}
+        except TypeError:
+            return [(value, count) for value, count in self._counts_by_equality() if count > 1]
+
+    def not_in(self, allowed_values: Iterable[Any]) -> set[Any] | list[Any]:
+        """
+        :return: Множество значений колонки, не входящих в `allowed_values`,
+            или list различных таких значений, если значения unhashable (dict/list)
+        """
+        allowed_values = list(allowed_values)
+        try:
+            return set(self.values).difference(allowed_values)
+        except TypeError:
+            unexpected: list[Any] = []
+            for value in self.values:
+                if value not in allowed_values and value not in unexpected:
+                    unexpected.append(value)
+            return unexpected
+
+    def _counts_by_equality(self) -> list[tuple[Any, int]]:
+        """
+        Подсчет различных значений через `==` (O(n*k), только для unhashable значений)
+
+        :return: list [(значение, количество)] в порядке первого появления
+        """
+        counts: list[list[Any]] = []
+        for value in self.values:
+            for entry in counts:
+                if entry[0] == value:
+                    entry[1] += 1
+                    break
+            else:
+                counts.append([value, 1])
+        return [(value, count) for value, count in counts]
+
+    # ---------------------------- агрегаты -------------------------------
+
+    def count(self, value: Any) -> int:
+        """:return: Количество элементов колонки, равных `value` (Ex: count("failed"))"""
+        return self.values.count(value)
+
+    def value_counts(self) -> Counter:
+        """:return: Counter - распределение значений колонки"""
+        return Counter(self.values)
+
+    def as_array(self) -> array | list[Any]:
+        """
+        Компактное типизированное представление колонки:
+            - только int (без bool) → array("q")
+            - только int/float (без bool) → array("d")
+            - иначе → list без изменений
+
+        :return: array | list
+        """
+        types = self.type_counts().keys()
+        if types and types <= {int}:
+            try:
+                return array("q", self.values)
+            except OverflowError:
+                return array("d", self.values)
+        if types and types <= {int, float}:
+            return array("d", self.values)
+        return self.values
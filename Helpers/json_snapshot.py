@@ -0,0 +1,358 @@
+"""json_snapshot.py"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from os import linesep, makedirs, path as os_path
+from typing import Any
+
+from libs import get_log
+from libs.api.airflow.checker import Checker, PathTrie
+
+LOG = get_log(__name__)
+
+
+class _NoValue:
+    """Отсутствующее значение (expected для added, actual для removed)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<нет значения>"
+
+
+_NO_VALUE = _NoValue()
+
+
+@dataclass(slots=True)
+class DiffEntry:
+    """Различие двух JSON-объектов по пути в dotted.notation"""
+    path: str
+    kind: str  # changed | added | removed | type
+    expected: Any = _NO_VALUE
+    actual: Any = _NO_VALUE
+
+    def __str__(self) -> str:
+        parts = [f'{self.kind.upper()}: "{self.path}"']
+        if self.expected is not _NO_VALUE:
+            parts.append(f'Ожидалось: {Checker.truncate(json.dumps(self.expected, ensure_ascii=False), 200)}')
+        if self.actual is not _NO_VALUE:
+            parts.append(f'Фактически: {Checker.truncate(json.dumps(self.actual, ensure_ascii=False), 200)}')
+        return " | ".join(parts)
+
+
+class _Index:
+    """Ключ элемента списка с `list_keys` без поля-идентификатора (или с повторным значением): индекс элемента"""
+
+    __slots__ = ("idx",)
+
+    def __init__(self, idx: int):
+        self.idx = idx
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is _Index and other.idx == self.idx
+
+    def __hash__(self) -> int:
+        return hash((_Index, self.idx))
+
+    def __repr__(self) -> str:
+        return f'#{self.idx}'
+
+
+class _Node:
+    """Узел дерева структурных хешей: digest поддерева, исходное значение и хеш-узлы потомков"""
+
+    __slots__ = ("digest", "value", "children", "key_field")
+
+    def __init__(self, digest: bytes, value: Any, children: dict | list | None = None, key_field: str | None = None):
+        self.digest = digest
+        self.value = value
+        self.children = children  # dict: ключ словаря / значение key_field → потомок; list: потомки по индексу
+        self.key_field = key_field  # поле-идентификатор элементов списка (см. `list_keys`)
+
+
+class JsonSnapshot:
+    """
+    Снимок JSON-объекта с деревом структурных (Merkle) хешей:
+        - Хеш поддерева вычисляется из хешей потомков: равные поддеревья имеют равный хеш независимо
+          от порядка ключей словарей
+        - Сравнение снимков спускается только в поддеревья с различающимся хешем: неизменные поддеревья
+          (Ex: DAG без изменений в ответе `get_dags`) пропускаются за одно сравнение хешей
+        - Различия адресуются путями в dotted.notation (Ex: `dags.[3].schedule_interval.value`)
+        - `ignore` - пути нестабильных значений, исключаемые из хеша и сравнения (поддерживается `[*]`)
+            Ex: ignore = ["dags.[*].last_parsed_time", "dag_runs.[*].run_id"]
+        - `list_keys` - списки, элементы которых сопоставляются по полю-идентификатору, а не по позиции:
+          порядок элементов не влияет на хеш, путь различия указывается фильтром (Ex: `dags.[?dag_id="etl"].is_paused`),
+          элементы без поля-идентификатора или с повторным значением сопоставляются по индексу (Ex: `dags.[3]`)
+        - Числа сравниваются по значению: 1 и 1.0 равны, True и 1 - нет
+            Ex: list_keys = {"dags": "dag_id", "dags.[*].tags": "name"}
+
+    Ex:
+        expected = JsonSnapshot(stage_json, ignore=["dags.[*].last_parsed_time"], list_keys={"dags": "dag_id"})
+        actual = JsonSnapshot(prod_json, ignore=["dags.[*].last_parsed_time"], list_keys={"dags": "dag_id"})
+        expected.digest == actual.digest  → True, если ответы совпадают
+        expected.diff(actual)             → [DiffEntry(path='dags.[?dag_id="etl"].is_paused', kind="changed", ...)]
+    """
+
+    def __init__(self, data: Any, ignore: list[str] | tuple[str, ...] = (), list_keys: dict[str, str] | None = None):
+        self.data = data
+        self.ignore: tuple[str, ...] = tuple(ignore)
+        self.list_keys: dict[str, str] = dict(list_keys or {})
+        for key_path in (*self.ignore, *self.list_keys):
+            Checker._validate_path_syntax(key_path)
+        self._rules = PathTrie([*self.ignore, *self.list_keys])
+        self.root: _Node | Any = self._build(data, (self._rules,) if self._rules.children else ())
+
+    @property
+    def digest(self) -> str:
+        """Структурный хеш снимка целиком (hex)"""
+        if type(self.root) is _Node:
+            return self.root.digest.hex()
+        return hashlib.blake2b(self._digest_part(self.root), digest_size=16).hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, JsonSnapshot) and self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    # ------------------------------ Хеши ---------------------------------
+
+    def _descend(self, rules: tuple, key: str | int) -> tuple | None:
+        """
+        Узлы правил для потомка по ключу словаря или индексу списка
+
+        :return: tuple узлов или None - если потомок исключен через `ignore`
+        """
+        if not rules:
+            return rules
+        nodes = []
+        for rule in rules:
+            for child in (rule.children.get(key), rule.children.get("[*]") if isinstance(key, int) else None):
+                if child is not None:
+                    if any(key_path in self.ignore for key_path in child.paths):
+                        return None
+                    nodes.append(child)
+        return tuple(nodes)
+
+    @staticmethod
+    def _digest_part(child: Any) -> bytes:
+        """
+        Вклад потомка в хеш родителя:
+            - Контейнер - digest его поддерева
+            - Скаляр - имя типа и значение с длиной (различает 1, True и "1"; хеш-узел для скаляров не строится)
+            - Целое float хешируется как int: 1.0 и 1 равны
+        """
+        if type(child) is _Node:
+            return child.digest
+        if type(child) is float and child.is_integer():
+            child = int(child)
+        text = f'{type(child).__name__}:{child!r}'
+        return f'{len(text)}|{text}'.encode()
+
+    def _build(self, value: Any, rules: tuple) -> Any:
+        """Рекурсивное построение дерева хешей (один обход JSON-объекта): _Node для контейнеров, скаляр - как есть"""
+        if isinstance(value, dict):
+            children = {}
+            for key, item in value.items():
+                sub_rules = self._descend(rules, key)
+                if sub_rules is not None:
+                    children[key] = self._build(item, sub_rules)
+            digest = hashlib.blake2b(b"{", digest_size=16)
+            for key in sorted(children):
+                digest.update(self._digest_part(key))
+                digest.update(self._digest_part(children[key]))
+            return _Node(digest.digest(), value, children)
+
+        if isinstance(value, list):
+            key_field = next((self.list_keys[key_path] for rule in rules for key_path in rule.paths
+                              if key_path in self.list_keys), None)
+            items = []
+            for idx, item in enumerate(value):
+                sub_rules = self._descend(rules, idx)
+                if sub_rules is not None:
+                    items.append((idx, self._build(item, sub_rules)))
+            if key_field is None:
+                digest = hashlib.blake2b(b"[", digest_size=16)
+                for _, item in items:
+                    digest.update(self._digest_part(item))
+                return _Node(digest.digest(), value, [item for _, item in items])
+
+            # Сопоставление элементов по полю-идентификатору: порядок элементов не влияет на хеш,
+            # элементы без идентификатора (или с повторным) - по индексу: ключ `_Index`
+            keyed = {}
+            for idx, item in items:
+                item_key = item.value.get(key_field) if type(item) is _Node and isinstance(item.value, dict) else None
+                keyed[item_key if item_key is not None and item_key not in keyed else _Index(idx)] = item
+            digest = hashlib.blake2b(b"[?", digest_size=16)
+            for item_key in sorted(keyed, key=repr):
+                digest.update(self._digest_part(item_key))
+                digest.update(self._digest_part(keyed[item_key]))
+            return _Node(digest.digest(), value, keyed, key_field)
+
+        return value
+
+    # ------------------------------ Сравнение ----------------------------
+
+    def diff(self, other: "JsonSnapshot | Any", max_entries: int = 100) -> list[DiffEntry]:
+        """
+        Сравнивает снимок (ожидаемый) с другим снимком или JSON-объектом (фактический)
+
+        :param other: JsonSnapshot или JSON-объект (снимок строится с теми же `ignore` и `list_keys`)
+        :param max_entries: Ограничение количества различий в результате
+        :return: list[DiffEntry] - пустой список, если структурные хеши совпадают
+        """
+        if not isinstance(other, JsonSnapshot):
+            other = JsonSnapshot(other, self.ignore, self.list_keys)
+        entries: list[DiffEntry] = []
+        self._diff(self.root, other.root, [], entries, max_entries)
+        return entries
+
+    def _diff(self, expected: Any, actual: Any, path: list[str], entries: list, max_entries: int) -> None:
+        if len(entries) >= max_entries:
+            return
+        expected_node, actual_node = type(expected) is _Node, type(actual) is _Node
+        if expected_node and actual_node and expected.digest == actual.digest:
+            return
+        if not expected_node and not actual_node:
+            if not self._scalar_equal(expected, actual):
+                entries.append(DiffEntry(".".join(path) or "<root>", "changed", expected, actual))
+            return
+        if (expected_node != actual_node or type(expected.children) is not type(actual.children)
+                or expected.key_field != actual.key_field):
+            entries.append(DiffEntry(".".join(path) or "<root>", "type", self._value(expected), self._value(actual)))
+            return
+
+        if isinstance(expected.children, list):
+            common = min(len(expected.children), len(actual.children))
+            for idx in range(common):
+                self._diff(expected.children[idx], actual.children[idx], [*path, f'[{idx}]'], entries, max_entries)
+            for idx in range(common, len(expected.children)):
+                self._add_entry(entries, max_entries, [*path, f'[{idx}]'], "removed", expected.children[idx])
+            for idx in range(common, len(actual.children)):
+                self._add_entry(entries, max_entries, [*path, f'[{idx}]'], "added", actual=actual.children[idx])
+            return
+
+        field = expected.key_field
+        for key, child in expected.children.items():
+            segment = self._segment(field, key)
+            if key in actual.children:
+                self._diff(child, actual.children[key], [*path, segment], entries, max_entries)
+            else:
+                self._add_entry(entries, max_entries, [*path, segment], "removed", child)
+        for key, child in actual.children.items():
+            if key not in expected.children:
+                self._add_entry(entries, max_entries, [*path, self._segment(field, key)], "added", actual=child)
+
+    @staticmethod
+    def _scalar_equal(expected: Any, actual: Any) -> bool:
+        """Равенство скаляров с учетом типа: числа (кроме bool) сравниваются по значению"""
+        if type(expected) in (int, float) and type(actual) in (int, float):
+            return expected == actual
+        return type(expected) is type(actual) and expected == actual
+
+    @staticmethod
+    def _segment(field: str | None, key: Any) -> str:
+        """
+        Сегмент пути потомка для запроса через `Checker.get_value()`:
+            - ключ словаря → как есть
+            - элемент списка по полю-идентификатору → фильтр, строки в кавычках: `[?dag_id="123"]`, `[?id=123]`
+            - элемент списка без идентификатора → индекс `[3]`
+        """
+        if not field:
+            return key
+        if type(key) is _Index:
+            return f'[{key.idx}]'
+        if isinstance(key, str):
+            return f"[?{field}='{key}']" if '"' in key else f'[?{field}="{key}"]'
+        return f'[?{field}={json.dumps(key)}]'
+
+    @staticmethod
+    def _value(child: Any) -> Any:
+        """Исходное значение потомка (_Node или скаляр)"""
+        return child.value if type(child) is _Node else child
+
+    @staticmethod
+    def _add_entry(entries: list, max_entries: int, path: list[str], kind: str,
+                   expected: Any = _NO_VALUE, actual: Any = _NO_VALUE) -> None:
+        if len(entries) < max_entries:
+            entries.append(DiffEntry(
+                ".".join(path), kind,
+                JsonSnapshot._value(expected) if expected is not _NO_VALUE else _NO_VALUE,
+                JsonSnapshot._value(actual) if actual is not _NO_VALUE else _NO_VALUE,
+            ))
+
+    # ------------------------------ Файлы --------------------------------
+
+    def save(self, file_path: str) -> None:
+        """Сохраняет JSON-объект снимка в файл (эталон для golden-file тестов)"""
+        makedirs(os_path.dirname(os_path.abspath(file_path)), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.data, file, ensure_ascii=False, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, file_path: str, ignore: list[str] | tuple[str, ...] = (),
+             list_keys: dict[str, str] | None = None) -> "JsonSnapshot":
+        """Загружает снимок из файла эталона"""
+        with open(file_path, encoding="utf-8") as file:
+            return cls(json.load(file), ignore, list_keys)
+
+
+def diff_json(
+        expected: Any,
+        actual: Any,
+        ignore: list[str] | tuple[str, ...] = (),
+        list_keys: dict[str, str] | None = None,
+        max_entries: int = 100
+) -> list[DiffEntry]:
+    """
+    Сравнивает два JSON-объекта через деревья структурных хешей (см. `JsonSnapshot`)
+
+    :param expected: Ожидаемый JSON-объект (Ex: ответ стенда A)
+    :param actual: Фактический JSON-объект (Ex: ответ стенда B)
+    :param ignore: Пути нестабильных значений, исключаемые из сравнения
+    :param list_keys: Dict {путь списка: поле-идентификатор элементов}
+    :param max_entries: Ограничение количества различий в результате
+    :return: list[DiffEntry]
+
+    Usage:
+    >>> diff_json(stage_dags, prod_dags, ignore=["dags.[*].last_parsed_time"], list_keys={"dags": "dag_id"})
+    """
+    return JsonSnapshot(expected, ignore, list_keys).diff(actual, max_entries)
+
+
+def assert_snapshot(
+        actual: Any,
+        file_path: str,
+        ignore: list[str] | tuple[str, ...] = (),
+        list_keys: dict[str, str] | None = None,
+        update: bool = False,
+        max_entries: int = 20
+) -> None:
+    """
+    Golden-file проверка: сравнивает JSON-объект с эталоном из файла
+        - Если файл эталона отсутствует (или `update=True`) - эталон создается из `actual`
+        - Различия выводятся путями в dotted.notation
+
+    :param actual: Фактический JSON-объект
+    :param file_path: Путь к файлу эталона (Ex: "tests/snapshots/get_dags.json")
+    :param ignore: Пути нестабильных значений, исключаемые из сравнения
+    :param list_keys: Dict {путь списка: поле-идентификатор элементов}
+    :param update: Перезаписать эталон
+    :param max_entries: Ограничение количества различий в сообщении об ошибке
+
+    Usage:
+    >>> assert_snapshot(response.json(), "tests/snapshots/get_dags.json", list_keys={"dags": "dag_id"})
+    """
+    if update or not os_path.exists(file_path):
+        JsonSnapshot(actual, ignore, list_keys).save(file_path)
+        LOG.info(f'Эталон сохранен: "{file_path}"')
+        return
+
+    entries = JsonSnapshot.load(file_path, ignore, list_keys).diff(actual, max_entries)
+    if entries:
+        raise AssertionError(
+            f'Ответ не совпадает с эталоном "{file_path}" | Различий: {len(entries)}'
+            f'{" (показаны первые)" if len(entries) >= max_entries else ""}{linesep}'
+            + linesep.join(str(entry) for entry in entries)
+        )
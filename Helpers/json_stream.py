@@ -0,0 +1,287 @@
+"""json_stream.py"""
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRUCTURE = re.compile(r'[\[\]{}"]')  # границы вложенности и начало строк при пропуске значений
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+# Порог сдвига буфера: обработанная часть отбрасывается, когда превышает этот размер
+_COMPACT_THRESHOLD = 1 << 16
+
+
+class JsonStreamWalker:
+    """
+    Потоковый обход JSON-документа по дереву путей (`PathTrie`) без построения объекта целиком:
+        - Тело ответа читается по частям (`chunks`) и декодируется инкрементально (UTF-8)
+        - В памяти хранится только текущий фрагмент буфера и значения на концах путей дерева
+        - Значения вне путей дерева пропускаются без построения Python-объектов
+        - Для узла с потомками (Ex: `dags` для `dags.[*].dag_id`) в `visit` передается пустой контейнер
+          того же типа (`{}` или `[]`) - содержимое обрабатывается потоково
+        - Контейнеры на концах путей также заменяются пустыми (достаточно для проверок наличия и типа),
+          если не указан `materialize=True`
+        - Элементы массивов на путях дерева строятся по одному и обходятся `PathTrie.walk()`:
+          память ограничена размером одного элемента (Ex: одного DAG), а не всего ответа
+        - Срезы с неотрицательными границами и фильтры (`PathSelector.streamable`) применяются к элементам
+          по мере чтения, для проекций и отрицательных срезов значение строится целиком
+        - `visit(key_path, value)` вызывается по мере чтения (кроме null): исключение в `visit`
+          останавливает чтение - оставшаяся часть тела не загружается
+
+    Ex:
+        walker = JsonStreamWalker(response.stream(65536), PathTrie(["dags.[*].dag_id"]), visit)
+        walker.walk()
+    """
+
+    def __init__(self, chunks: Iterable[bytes | str], trie: Any, visit: Callable[[str, Any], None],
+                 materialize: bool = False, head_size: int = 1000):
+        self._chunks: Iterator[bytes | str] = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+        self._json = json.JSONDecoder()
+        self._trie = trie
+        self._visit = visit
+        self._materialize = materialize
+        self._buf: str = ""
+        self._pos: int = 0
+        self._eof: bool = False
+        self._head_size = head_size
+        self.head: str = ""  # начало документа для вывода в сообщениях об ошибках
+        self.bytes_read: int = 0
+
+    def walk(self) -> None:
+        """
+        Обходит документ целиком
+
+        :raises ValueError: Невалидный JSON (json.JSONDecodeError или UnicodeDecodeError)
+        """
+        self._walk((self._trie,))
+        self._skip_whitespace()
+        if self._pos < len(self._buf) or self._fill():
+            raise self._error("Extra data")
+
+    def read_head(self) -> str:
+        """Дочитывает начало документа для сообщений об ошибках (Ex: при неожиданном статус-коде)"""
+        while len(self.head) < self._head_size and self._fill():
+            pass
+        return self.head
+
+    # ------------------------------ Буфер --------------------------------
+
+    def _fill(self) -> bool:
+        """Читает следующую часть тела в буфер. :return: False - если тело прочитано полностью"""
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                self.bytes_read += len(chunk)
+                chunk = self._decoder.decode(chunk)
+            if not chunk:
+                continue
+            if len(self.head) < self._head_size:
+                self.head += chunk[:self._head_size - len(self.head)]
+            self._buf += chunk
+            return True
+        self._eof = True
+        tail = self._decoder.decode(b"", final=True)
+        self._buf += tail
+        return bool(tail)
+
+    def _fill_more(self) -> bool:
+        """
+        Дочитывает необработанную часть буфера вдвое (для значений, не поместившихся в буфер):
+        повторный разбор выполняется после удвоения, а не после каждой части - суммарно линейно
+
+        :return: False - если тело прочитано полностью и буфер не изменился
+        """
+        size = len(self._buf) - self._pos
+        while len(self._buf) - self._pos < max(2 * size, 1) and self._fill():
+            pass
+        return len(self._buf) - self._pos > size
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _peek(self) -> str:
+        """Следующий значимый символ (без сдвига позиции)"""
+        if self._pos < len(self._buf) and self._buf[self._pos] not in " \t\n\r":
+            return self._buf[self._pos]
+        self._skip_whitespace()
+        if self._pos >= len(self._buf):
+            raise self._error("Expecting value")
+        return self._buf[self._pos]
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(f'{message} (stream offset ~{self.bytes_read} bytes)', self._buf, self._pos)
+
+    # ------------------------------ Значения -----------------------------
+
+    def _decode_value(self) -> Any:
+        """Строит Python-объект для значения с текущей позиции (дочитывая буфер при необходимости)"""
+        if self._peek() not in '"[{':
+            # Число или литерал на границе буфера может продолжаться в следующей части
+            while _SCALAR_END.search(self._buf, self._pos) is None and self._fill():
+                pass
+        while True:
+            try:
+                value, self._pos = self._json.raw_decode(self._buf, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill_more():
+                    raise
+
+    def _decode_key(self) -> str:
+        """Ключ объекта с разделителем `:`"""
+        if self._peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        key = self._decode_value()
+        if self._peek() != ":":
+            raise self._error("Expecting ':' delimiter")
+        self._pos += 1
+        return key
+
+    def _skip_string(self) -> None:
+        while True:
+            match = _STRING.match(self._buf, self._pos)
+            if match:
+                self._pos = match.end()
+                return
+            if not self._fill_more():
+                raise self._error("Unterminated string")
+
+    def _skip_value(self) -> None:
+        """Пропускает значение с текущей позиции без построения Python-объекта"""
+        char = self._peek()
+        if char == '"':
+            self._skip_string()
+            return
+        if char not in "[{":
+            while True:
+                match = _SCALAR_END.search(self._buf, self._pos)
+                if match:
+                    self._pos = match.start()
+                    return
+                self._pos = len(self._buf)
+                if not self._fill():
+                    return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error("Unexpected end of data")
+                continue
+            self._pos = match.start()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            depth += 1 if char in "[{" else -1
+            if depth == 0:
+                return
+
+    # ------------------------------ Обход --------------------------------
+
+    def _walk(self, nodes: tuple) -> None:
+        """Обработка значения с текущей позиции для набора узлов дерева, соответствующих этой позиции"""
+        paths = [key_path for node in nodes for key_path in node.paths]
+        children = [node.children for node in nodes if node.children]
+        if not children:
+            if paths and not self._materialize and self._peek() in "[{":
+                placeholder = {} if self._buf[self._pos] == "{" else []
+                for key_path in paths:
+                    self._visit(key_path, placeholder)
+                self._skip_value()
+            elif paths:
+                value = self._decode_value()
+                if value is not None:
+                    for key_path in paths:
+                        self._visit(key_path, value)
+            else:
+                self._skip_value()
+            return
+
+        if any(not child.selector.streamable for node_children in children
+               for child in node_children.values() if child.selector is not None):
+            # Проекции и срезы с отрицательными границами требуют значения целиком
+            value = self._decode_value()
+            for node in nodes:
+                node.walk(value, self._visit)
+            return
+
+        char = self._peek()
+        if char == "{":
+            for key_path in paths:
+                self._visit(key_path, {})
+            self._walk_object(children)
+        elif char == "[":
+            for key_path in paths:
+                self._visit(key_path, [])
+            self._walk_array(children)
+        else:
+            value = self._decode_value()
+            if value is not None:
+                for key_path in paths:
+                    self._visit(key_path, value)
+
+    def _walk_object(self, children: list[dict]) -> None:
+        self._pos += 1
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_key()
+            nodes = tuple(child[key] for child in children
+                          if key in child and key != "[*]" and child[key].selector is None)
+            if nodes:
+                self._walk(nodes)
+            else:
+                self._skip_value()
+            if not self._next_item("}"):
+                return
+
+    def _walk_array(self, children: list[dict]) -> None:
+        self._pos += 1
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        wildcards = tuple(child["[*]"] for child in children if "[*]" in child)
+        selected = tuple(node for child in children for node in child.values() if node.selector is not None)
+        idx = 0
+        while True:
+            nodes = wildcards + tuple(child[idx] for child in children if idx in child)
+            if nodes or selected:
+                # Элемент массива строится целиком (на уровне C) и обходится по всем путям за один проход
+                item = self._decode_value()
+                for node in nodes:
+                    node.walk(item, self._visit)
+                for node in selected:
+                    if node.selector.matches(idx, item):
+                        node.walk(item, self._visit)
+            else:
+                self._skip_value()
+            if not self._next_item("]"):
+                return
+            idx += 1
+
+    def _next_item(self, closing: str) -> bool:
+        """Разделитель элементов контейнера. :return: False - если контейнер закрыт"""
+        char = self._peek()
+        self._pos += 1
+        if char == ",":
+            return True
+        if char == closing:
+            return False
+        raise self._error(f"Expecting ',' or '{closing}' delimiter")
@@ -0,0 +1,186 @@
+"""perf_regression.py"""
+
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from libs import get_log
+from libs.api.airflow.session_data import LatencySketch
+from libs.api.airflow.session_serializer import dumps, loads
+
+LOG = get_log(__name__)
+
+MAD_SCALE = 1.4826  # MAD -> оценка стандартного отклонения для нормального распределения
+
+
+def robust_stats(values: list[float]) -> tuple[float, float]:
+    """
+    Медиана и MAD (median absolute deviation) - устойчивы к единичным выбросам
+
+    :param values: Непустой список значений
+    :return: (median, mad)
+    """
+    median = statistics.median(values)
+    return median, statistics.median(abs(value - median) for value in values)
+
+
+@dataclass(slots=True)
+class Regression:
+    """Значимое замедление теста или эндпоинта относительно базовой линии"""
+    kind: str  # test | endpoint
+    name: str
+    baseline: float  # медиана базовой линии (с)
+    current: float  # значение текущего прогона (с); для эндпоинта - медиана запросов прогона
+    delta: float  # current - baseline (с)
+    ratio: float  # current / baseline
+    score: float  # robust z-score: delta / (MAD_SCALE * MAD)
+
+    def __str__(self) -> str:
+        return (
+            f'{self.kind}: {self.name} | {self.baseline:.3f}s -> {self.current:.3f}s '
+            f'(+{self.delta:.3f}s, x{self.ratio:.2f}, z={self.score:.1f})'
+        )
+
+
+@dataclass(slots=True)
+class PerfReport:
+    """
+    Отчет сравнения прогона с базовой линией
+        - `budget_exceeded` - суммарное замедление регрессий больше бюджета (`budget`, с)
+    """
+    regressions: list[Regression] = field(default_factory=list)
+    compared_tests: int = 0
+    compared_endpoints: int = 0
+    budget: float | None = None
+
+    @property
+    def total_delta(self) -> float:
+        """Суммарное замедление по всем регрессиям (с)"""
+        return round(sum(regression.delta for regression in self.regressions), 3)
+
+    @property
+    def budget_exceeded(self) -> bool:
+        """Превышен бюджет замедления"""
+        return self.budget is not None and self.total_delta > self.budget
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление для JSON-файла сессии (`SessionData.performance`)"""
+        return {
+            "compared_tests": self.compared_tests,
+            "compared_endpoints": self.compared_endpoints,
+            "total_delta": self.total_delta,
+            "budget": self.budget,
+            "budget_exceeded": self.budget_exceeded,
+            "regressions": [asdict(regression) for regression in self.regressions],
+        }
+
+
+class PerfBaseline:
+    """
+    Базовая линия производительности: скользящее окно значений последних прогонов
+        - `tests`: {nodeid: [длительность теста в прогоне, ...]}
+        - `endpoints`: {"GET get_dag_by_id": [медиана длительности запросов в прогоне, ...]}
+        - Сравнение по медиане и MAD окна: одиночные медленные прогоны не сдвигают базовую линию
+
+    Ex:
+        baseline = PerfBaseline.load("log/perf_baseline.json")
+        report = baseline.compare(collector.test_durations(), collector.data.latencies, budget=30)
+        baseline.update(collector.test_durations(), collector.data.latencies)
+        baseline.save("log/perf_baseline.json")
+    """
+
+    def __init__(
+            self,
+            tests: dict[str, list[float]] | None = None,
+            endpoints: dict[str, list[float]] | None = None,
+            window: int = 20,
+    ):
+        self.tests = tests or {}
+        self.endpoints = endpoints or {}
+        self.window = window
+
+    @classmethod
+    def load(cls, file_path: str | Path, window: int = 20) -> "PerfBaseline":
+        """Загрузка базовой линии из JSON-файла (пустая базовая линия, если файла нет)"""
+        file_path = Path(file_path)
+        if not file_path.exists():
+            LOG.warning(f'Файл базовой линии не найден: {file_path} | Сравнение пропущено')
+            return cls(window=window)
+        data = loads(file_path.read_bytes())
+        return cls(data.get("tests"), data.get("endpoints"), window)
+
+    def save(self, file_path: str | Path) -> None:
+        """Сохранение базовой линии в JSON-файл"""
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(dumps({"tests": self.tests, "endpoints": self.endpoints}, indent=True))
+
+    def update(self, durations: dict[str, float], latencies: dict[str, LatencySketch]) -> None:
+        """
+        Добавляет значения прогона в окно базовой линии
+
+        :param durations: Длительности тестов {nodeid: с}
+        :param latencies: Статистика длительностей запросов {endpoint: LatencySketch}
+        """
+        for nodeid, duration in durations.items():
+            self._append(self.tests, nodeid, duration)
+        for endpoint, sketch in latencies.items():
+            if sketch.count:
+                self._append(self.endpoints, endpoint, sketch.median)
+
+    def _append(self, series: dict[str, list[float]], key: str, value: float) -> None:
+        values = series.setdefault(key, [])
+        values.append(value)
+        del values[:-self.window]
+
+    def compare(
+            self,
+            durations: dict[str, float],
+            latencies: dict[str, LatencySketch],
+            threshold: float = 3.5,
+            min_delta: float = 0.5,
+            min_ratio: float = 1.2,
+            min_runs: int = 3,
+            budget: float | None = None,
+    ) -> PerfReport:
+        """
+        Поиск значимых замедлений: значение прогона считается регрессией, если одновременно
+            - robust z-score `(current - median) / (MAD_SCALE * MAD)` больше `threshold`
+            - абсолютное замедление не меньше `min_delta` (с) и относительное не меньше `min_ratio`
+        MAD окна ограничен снизу 5% медианы: стабильная базовая линия (MAD = 0) не дает бесконечный z-score
+
+        :param durations: Длительности тестов прогона {nodeid: с}
+        :param latencies: Статистика длительностей запросов прогона {endpoint: LatencySketch}
+        :param threshold: Порог robust z-score
+        :param min_delta: Минимальное абсолютное замедление (с); для эндпоинтов - в 10 раз меньше
+        :param min_ratio: Минимальное относительное замедление
+        :param min_runs: Минимальное количество прогонов в базовой линии
+        :param budget: Бюджет суммарного замедления (с), None - без ограничения
+        :return: PerfReport: регрессии по убыванию замедления
+        """
+        report = PerfReport(budget=budget)
+        current = [("test", self.tests, name, value, min_delta) for name, value in durations.items()]
+        current += [
+            ("endpoint", self.endpoints, name, sketch.median, min_delta / 10)
+            for name, sketch in latencies.items() if sketch.count
+        ]
+        for kind, series, name, value, kind_min_delta in current:
+            history = series.get(name)
+            if not history or len(history) < min_runs:
+                continue
+            if kind == "test":
+                report.compared_tests += 1
+            else:
+                report.compared_endpoints += 1
+            median, mad = robust_stats(history)
+            delta, ratio = value - median, value / max(median, 1e-3)
+            if delta < kind_min_delta or ratio < min_ratio:
+                continue
+            score = delta / (MAD_SCALE * max(mad, median * 0.05, 1e-3))
+            if score > threshold:
+                report.regressions.append(Regression(
+                    kind, name, round(median, 4), round(value, 4), round(delta, 4), round(ratio, 2), round(score, 1)
+                ))
+        report.regressions.sort(key=lambda regression: regression.delta, reverse=True)
+        return report
@@ -1,15 +1,22 @@
 """local_data_collector"""
 
-import json
 from os import linesep
 from pathlib import Path
-from typing import TextIO
 
 from libs import get_log
 from libs.api.airflow.exeptions import DataSerializationError, FileSaveError
 from libs.api.airflow.helpers import log_and_raise, make_text_ansi_bold, make_text_ansi_name, make_text_ansi_warning
-from libs.api.airflow.session_data import SessionData, TestData
-from libs.api.airflow.utils import UpdatableSingleton, convert_to_serializable
+from libs.api.airflow.session_data import LatencySketch, SessionData, TestData
+from libs.api.airflow.session_serializer import (
+    dump_session,
+    iter_jsonl,
+    latencies_to_dict,
+    load_session,
+    test_to_dict,
+    timing_to_dict,
+)
+from libs.api.airflow.session_writer import JsonlWriter
+from libs.api.airflow.utils import UpdatableSingleton
 
 LOG = get_log(__name__)
 
@@ -21,6 +28,8 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
         - Консистентное хранение данных в структурированном виде
         - Расширяемый кеш данных любого назначения
         - Сохранение данных сессии в JSON файл
+        - Потоковый режим: запись каждого теста строкой JSONL при завершении теста (`start_streaming()`)
+        - pytest-xdist: объединение файлов сессий воркеров на контроллере (`merge_worker_sessions()`)
 
     Attributes: @dataclass
         - data (SessionData): Корневой контейнер данных тестовой сессии
@@ -39,11 +48,21 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
         - Работа с тестами (dict-доступ):
             test_data = collector.mark_test_start(nodeid)
             collector.mark_test_stop(nodeid, "PASSED")
+        - Потоковый режим (память не зависит от количества тестов, данные переживают аварийное завершение):
+            collector.start_streaming("log/test_results.jsonl")
+        - pytest-xdist (контроллер):
+            collector.add_worker_file("gw0", "log/test_results.gw0.json")
+            collector.merge_worker_sessions()
+            collector.save_session_data("log/test_results.json")
     """
     _singleton_mode = "static"
 
     def __init__(self):
         self._data = SessionData()
+        self._writer: JsonlWriter | None = None
+        self._streamed: int = 0  # количество тестов, записанных в JSONL и удаленных из памяти
+        self._worker_files: dict[str, Path] = {}  # файлы сессий воркеров pytest-xdist (на контроллере)
+        self.session_file: Path | None = None  # последний сохраненный файл сессии
 
     @property
     def data(self) -> SessionData:
@@ -60,6 +79,37 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
             f'PytestDebug mode: {make_text_ansi_name(debug)}'
         )
 
+    def start_streaming(self, filename: str | Path, fsync_every: int = 100, fsync_interval: float = 5.0) -> None:
+        """
+        Включает потоковую запись данных сессии в JSONL-файл:
+            - Первая строка - данные сессии (`record: session_start`)
+            - Каждый завершенный тест записывается строкой (`record: test`) в `mark_test_stop()`
+              и удаляется из памяти
+            - Последняя строка - итоги сессии (`record: session`) в `save_session_data()`
+
+        :param filename: Полный путь к JSONL-файлу
+        :param fsync_every: Синхронизация с диском каждые N тестов
+        :param fsync_interval: Синхронизация с диском не реже, чем раз в N секунд
+        """
+        try:
+            self._writer = JsonlWriter(filename, fsync_every=fsync_every, fsync_interval=fsync_interval).open()
+            self._writer.write({
+                "record": "session_start",
+                "debug": self._data.debug,
+                "pytest_debug": self._data.pytest_debug,
+                "session": timing_to_dict(self._data.session),
+            })
+        except OSError as e:
+            log_and_raise(
+                error_type=FileSaveError,
+                message="Ошибка открытия JSONL-файла сессии",
+                from_exception=e,
+                filename=str(filename),
+                logger_name=self.__class__.__name__,
+                log_level="error",
+            )
+        LOG.debug(f'Потоковая запись данных сессии | Путь: {make_text_ansi_name(self._writer.file_path)}')
+
     def mark_test_start(self, nodeid: str) -> TestData:
         """Регистрация старта теста"""
         test_data = self._data.add_test(nodeid)
@@ -91,6 +141,11 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
                 f'Статус: {make_text_ansi_bold(status.upper())}{linesep}'
             )
 
+        if self._writer is not None:
+            self._writer.write({"record": "test", "nodeid": nodeid, **test_to_dict(test)})
+            del self._data.tests[nodeid]
+            self._streamed += 1
+
     def stop_session(self) -> None:
         """Завершение сессии"""
         self._data.session.stop()
@@ -98,15 +153,19 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
             f'Завершение тестовой сессии | '
             f'Время окончания: {make_text_ansi_name(self._data.session.end_time)} | '
             f'Общая длительность: {make_text_ansi_name(self._data.session.duration)} (с) | '
-            f'Количество тестов: {make_text_ansi_name(len(self._data.tests))}'
+            f'Количество тестов: {make_text_ansi_name(len(self._data.tests) + self._streamed)}'
         )
 
     def save_session_data(self, filename: str | Path | None) -> bool | None:
         """
-        Сохранение данных в JSON-файл с обработкой ошибок
+        Сохранение данных в JSON-файл с обработкой ошибок (`session_serializer.dump_session()`)
+            - В потоковом режиме данные уже записаны в JSONL-файл: дописываются итоги сессии, файл закрывается
         :param filename: Полный путь к файлу для сохранения (str, Path или None)
         :return: Статус операции
         """
+        if self._writer is not None:
+            return self._finish_streaming()
+
         if filename is not None and not isinstance(filename, (str, Path)):
             log_and_raise(TypeError,
                           f'Некорректное имя/путь к файлу: {type(filename)} '
@@ -128,20 +187,14 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
             file_path = Path(filename)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            serialized = convert_to_serializable(self._data)
-
-            with file_path.open("w", encoding="utf-8") as file:  # type: TextIO
-                json.dump(
-                    serialized,
-                    file,
-                    indent=2,
-                    ensure_ascii=False,
-                )
+            size = dump_session(self._data, file_path)
+            self.session_file = file_path
+            self._remove_worker_files()
 
             LOG.debug(
                 f'Данные сессии сохранены | '
                 f'Путь: {make_text_ansi_name(file_path)} | '
-                f'Размер: {make_text_ansi_name(file_path.stat().st_size)} байт'
+                f'Размер: {make_text_ansi_name(size)} байт'
             )
             return True
 
@@ -171,3 +224,114 @@ class SessionDataCollector(metaclass=UpdatableSingleton):
                 logger_name=self.__class__.__name__,
                 log_level="error",
             )
+
+    def _finish_streaming(self) -> bool:
+        """Запись итогов сессии (и незавершенных тестов) в JSONL-файл и его закрытие"""
+        writer, self._writer = self._writer, None
+        try:
+            for nodeid, test in self._data.tests.items():
+                writer.write({"record": "test", "nodeid": nodeid, **test_to_dict(test)})
+            record = {
+                "record": "session",
+                "session": timing_to_dict(self._data.session),
+                "tests_count": len(self._data.tests) + self._streamed,
+            }
+            if self._data.latencies:
+                record["latencies"] = latencies_to_dict(self._data.latencies)
+            if self._data.performance is not None:
+                record["performance"] = self._data.performance
+            writer.write(record)
+            writer.close()
+            self.session_file = writer.file_path
+        except OSError as e:
+            log_and_raise(
+                error_type=FileSaveError,
+                message="Ошибка записи в JSONL-файл сессии",
+                from_exception=e,
+                filename=str(writer.file_path),
+                logger_name=self.__class__.__name__,
+                log_level="error",
+            )
+
+        LOG.debug(
+            f'Данные сессии сохранены | '
+            f'Путь: {make_text_ansi_name(writer.file_path)} | '
+            f'Записей: {make_text_ansi_name(writer.records)} | '
+            f'Размер: {make_text_ansi_name(writer.file_path.stat().st_size)} байт'
+        )
+        return True
+
+    def add_worker_file(self, worker_id: str, filename: str | Path) -> None:
+        """
+        Регистрация файла данных сессии воркера pytest-xdist (на контроллере)
+
+        :param worker_id: ID воркера (Ex: "gw0")
+        :param filename: Путь к JSON/JSONL-файлу сессии воркера
+        """
+        self._worker_files[worker_id] = Path(filename)
+
+    def merge_worker_sessions(self) -> bool:
+        """
+        Объединение данных сессий воркеров pytest-xdist в данные сессии контроллера:
+            - Файлы воркеров (JSON или JSONL потокового режима) загружаются через `load_session()`
+            - Добавляется статистика каждого воркера (`workers`) и средняя загрузка (`utilization`)
+            - Файлы воркеров удаляются после успешного `save_session_data()`
+
+        :return: Статус операции
+        """
+        sessions: dict[str, SessionData] = {}
+        for worker_id, file_path in self._worker_files.items():
+            try:
+                sessions[worker_id] = load_session(file_path)
+            except (OSError, ValueError) as e:
+                LOG.warning(f'Данные воркера не загружены: {worker_id} | Путь: {file_path} | Ошибка: {e}')
+
+        if not sessions:
+            LOG.warning(f'Нет данных воркеров для объединения | {make_text_ansi_warning("Данные сессии пусты")}')
+            return False
+
+        self._data = SessionData.merge(sessions)
+        LOG.debug(
+            f'Объединение данных воркеров | '
+            f'Воркеров: {make_text_ansi_name(len(sessions))} | '
+            f'Тестов: {make_text_ansi_name(len(self._data.tests))} | '
+            f'Длительность: {make_text_ansi_name(self._data.session.duration)} (с) | '
+            f'Загрузка: {make_text_ansi_name(self._data.utilization)}'
+        )
+        return True
+
+    def _remove_worker_files(self) -> None:
+        """Удаление файлов воркеров, объединенных в сохраненный файл сессии"""
+        for file_path in self._worker_files.values():
+            file_path.unlink(missing_ok=True)
+        self._worker_files.clear()
+
+    def record_latency(self, endpoint: str, duration: float) -> None:
+        """
+        Регистрация длительности HTTP-запроса для сравнения с базовой линией (`perf_regression`)
+            - Хранится потоковая статистика эндпоинта (`LatencySketch`), а не список всех длительностей
+            - Используется как `latency_hook` клиента: Ex: `AirflowApiClient(latency_hook=sdc.record_latency)`
+
+        :param endpoint: Идентификатор эндпоинта: Ex: "GET get_dag_by_id"
+        :param duration: Длительность запроса (с)
+        """
+        sketch = self._data.latencies.get(endpoint)
+        if sketch is None:
+            sketch = self._data.latencies[endpoint] = LatencySketch()
+        sketch.add(duration)
+
+    def test_durations(self) -> dict[str, float]:
+        """
+        Длительности завершенных тестов сессии {nodeid: с}
+            - В потоковом режиме включают тесты, уже записанные в JSONL-файл
+        """
+        durations = {}
+        if self._writer is not None:
+            self._writer.sync()
+            for record in iter_jsonl(self._writer.file_path):
+                if record.get("record") == "test" and "end_timestamp" in record.get("timing", {}):
+                    durations[record["nodeid"]] = record["timing"]["duration"]
+        for nodeid, test in self._data.tests.items():
+            if test.timing.end_timestamp is not None:
+                durations[nodeid] = test.timing.duration
+        return durations
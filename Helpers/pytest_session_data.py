@@ -1,55 +1,101 @@
 """session_data.py"""
 
+import math
+import sys
+import time
 from dataclasses import dataclass, field
+from typing import Any
 
-from libs.api.airflow.helpers import get_local_time, parse_pytest_nodeid, get_debug_flag
+from libs.api.airflow.helpers import format_local_time, parse_pytest_nodeid, get_debug_flag
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseTiming:
-    """Базовый класс для работы с таймингами"""
-    start_time: str | None = None
+    """
+    Базовый класс для работы с таймингами
+        - Хранит только числа: epoch timestamp (для экспорта) и monotonic (для длительности)
+        - Строки времени (`start_time`, `end_time`) форматируются при обращении, а не при каждом старте/остановке
+    """
     start_timestamp: float | None = None
-    end_time: str | None = None
     end_timestamp: float | None = None
-    duration: float = 0.0
+    _start_monotonic: float | None = field(default=None, repr=False)
+    _end_monotonic: float | None = field(default=None, repr=False)
 
     def start(self) -> None:
         """Зафиксировать время начала"""
-        now = get_local_time()
-        self.start_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        self.start_timestamp = now.timestamp()
+        self.start_timestamp = time.time()
+        self._start_monotonic = time.monotonic()
 
     def stop(self) -> None:
-        """Зафиксировать время окончания и длительность"""
-        now = get_local_time()
-        self.end_time = now.strftime("%Y-%m-%d %H:%M:%S")
-        self.end_timestamp = now.timestamp()
-        if self.start_timestamp is not None:
-            self.duration = round(self.end_timestamp - self.start_timestamp, 2)
+        """Зафиксировать время окончания"""
+        self.end_timestamp = time.time()
+        self._end_monotonic = time.monotonic()
 
+    @property
+    def start_time(self) -> str | None:
+        """Время начала: Ex: "2025-01-31 12:00:00" """
+        return format_local_time(self.start_timestamp) if self.start_timestamp is not None else None
 
-@dataclass
+    @property
+    def end_time(self) -> str | None:
+        """Время окончания: Ex: "2025-01-31 12:00:05" """
+        return format_local_time(self.end_timestamp) if self.end_timestamp is not None else None
+
+    @property
+    def duration(self) -> float:
+        """Длительность (с) по монотонным часам"""
+        if self._start_monotonic is None or self._end_monotonic is None:
+            return 0.0
+        return round(self._end_monotonic - self._start_monotonic, 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление для экспорта в JSON (формат полей сохранен)"""
+        return {
+            "start_time": self.start_time,
+            "start_timestamp": self.start_timestamp,
+            "end_time": self.end_time,
+            "end_timestamp": self.end_timestamp,
+            "duration": self.duration,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BaseTiming":
+        """
+        Восстановление из экспортированного представления (`to_dict()`):
+            - Монотонные отметки восстанавливаются от `start_timestamp` с сохраненной длительностью
+        """
+        timing = cls(data.get("start_timestamp"), data.get("end_timestamp"))
+        if timing.end_timestamp is not None:
+            timing._start_monotonic = timing.start_timestamp or 0.0
+            timing._end_monotonic = timing._start_monotonic + data.get("duration", 0.0)
+        return timing
+
+
+@dataclass(slots=True)
 class TestTiming(BaseTiming):
     """Тайминги выполнения теста"""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTiming(BaseTiming):
     """Тайминги выполнения тестовой сессии"""
 
 
-@dataclass
+@dataclass(slots=True)
 class TestData:
-    """Данные отдельного теста"""
+    """
+    Данные отдельного теста
+        - `module` и `class_name` интернированы (общие строки для тестов одного модуля/класса)
+        - `meta`, `steps`, `tags` создаются при первом обращении
+    """
     module: str
     class_name: str | None
     test_name: str
     timing: TestTiming = field(default_factory=TestTiming)
     _status: str | None = field(default=None, init=False)
-    meta: dict[str, str] = field(default_factory=dict)
-    steps: list[str] = field(default_factory=list)
-    tags: list[str] = field(default_factory=list)
+    _meta: dict[str, str] | None = field(default=None, init=False, repr=False)
+    _steps: list[str] | None = field(default=None, init=False, repr=False)
+    _tags: list[str] | None = field(default=None, init=False, repr=False)
 
     @property
     def status(self) -> str | None:
@@ -61,14 +107,240 @@ class TestData:
         """Сеттер с преобразованием в UPPERCASE"""
         self._status = value.upper() if value is not None and isinstance(value, str) else None
 
+    @property
+    def meta(self) -> dict[str, str]:
+        """Метаданные теста"""
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
+    @property
+    def steps(self) -> list[str]:
+        """Шаги теста"""
+        if self._steps is None:
+            self._steps = []
+        return self._steps
+
+    @property
+    def tags(self) -> list[str]:
+        """Теги теста"""
+        if self._tags is None:
+            self._tags = []
+        return self._tags
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление для экспорта в JSON (формат полей сохранен)"""
+        return {
+            "module": self.module,
+            "class_name": self.class_name,
+            "test_name": self.test_name,
+            "timing": self.timing.to_dict(),
+            "_status": self._status,
+            "meta": self._meta or {},
+            "steps": self._steps or [],
+            "tags": self._tags or [],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TestData":
+        """Восстановление из экспортированного представления (`to_dict()`) с интернированием модуля/класса"""
+        class_name = data.get("class_name")
+        test_data = cls(sys.intern(data["module"]), sys.intern(class_name) if class_name is not None else None,
+                        data["test_name"], TestTiming.from_dict(data.get("timing") or {}))
+        test_data._status = data.get("_status")
+        test_data._meta = data.get("meta") or None
+        test_data._steps = data.get("steps") or None
+        test_data._tags = data.get("tags") or None
+        return test_data
+
+
+@dataclass(slots=True)
+class WorkerStats:
+    """
+    Статистика воркера pytest-xdist:
+        - `duration` - длительность сессии воркера (с)
+        - `busy` - суммарная длительность тестов воркера (с)
+        - `utilization` - доля времени сессии, занятая тестами
+    """
+    tests: int = 0
+    start_timestamp: float | None = None
+    end_timestamp: float | None = None
+    duration: float = 0.0
+    busy: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Загрузка воркера: busy / duration"""
+        return round(self.busy / self.duration, 3) if self.duration else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление для экспорта в JSON"""
+        return {
+            "tests": self.tests,
+            "start_timestamp": self.start_timestamp,
+            "end_timestamp": self.end_timestamp,
+            "duration": self.duration,
+            "busy": self.busy,
+            "utilization": self.utilization,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WorkerStats":
+        """Восстановление из экспортированного представления (`to_dict()`)"""
+        return cls(data.get("tests", 0), data.get("start_timestamp"), data.get("end_timestamp"),
+                   data.get("duration", 0.0), data.get("busy", 0.0))
+
+    @classmethod
+    def from_session(cls, data: "SessionData") -> "WorkerStats":
+        """Статистика по данным сессии воркера"""
+        return cls(
+            tests=len(data.tests),
+            start_timestamp=data.session.start_timestamp,
+            end_timestamp=data.session.end_timestamp,
+            duration=data.session.duration,
+            busy=round(sum(test.timing.duration for test in data.tests.values()), 2),
+        )
+
+
+# Логарифмические корзины `LatencySketch`: относительная погрешность квантилей не больше 1%
+_LATENCY_GAMMA = 1.01 / 0.99
+_LATENCY_LOG_GAMMA = math.log(_LATENCY_GAMMA)
+_LATENCY_MIN = 1e-6  # нижняя граница длительности (с): нулевые длительности попадают в первую корзину
+
+
+@dataclass(slots=True)
+class LatencySketch:
+    """
+    Потоковая статистика длительностей HTTP-запросов эндпоинта (память не зависит от количества запросов):
+        - `count`, `total`, `max` - точные агрегаты
+        - Квантили - по логарифмическим корзинам `buckets` {индекс: количество} с относительной
+          погрешностью 1% (DDSketch): корзина i содержит значения в интервале (γ^(i-1), γ^i]
+        - Объединение статистик воркеров pytest-xdist точное: сумма счетчиков (`merge()`)
+
+    Ex:
+        sketch = LatencySketch()
+        sketch.add(0.031)
+        sketch.median → 0.031
+    """
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+    def add(self, duration: float) -> None:
+        """Регистрация длительности запроса (с)"""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        index = math.ceil(math.log(max(duration, _LATENCY_MIN)) / _LATENCY_LOG_GAMMA)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Добавляет статистику `other` (Ex: другого воркера)"""
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> float:
+        """
+        Оценка квантиля длительности
+
+        :param q: Перцентиль 0..100
+        :return: float: длительность (с), 0.0 без запросов
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return round(min(2 * _LATENCY_GAMMA ** index / (_LATENCY_GAMMA + 1), self.max), 4)
+        return round(self.max, 4)
+
+    @property
+    def median(self) -> float:
+        """Медиана длительности (с)"""
+        return self.quantile(50)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Представление для экспорта в JSON (ключи корзин - строки)"""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "median": self.median,
+            "buckets": {str(index): count for index, count in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | list[float]) -> "LatencySketch":
+        """
+        Восстановление из экспортированного представления (`to_dict()`)
+            - list длительностей - формат файлов сессий до `LatencySketch`
+        """
+        if isinstance(data, list):
+            sketch = cls()
+            for duration in data:
+                sketch.add(duration)
+            return sketch
+        return cls(data.get("count", 0), data.get("total", 0.0), data.get("max", 0.0),
+                   {int(index): count for index, count in (data.get("buckets") or {}).items()})
+
 
 @dataclass
 class SessionData:
-    """Данные тестовой сессии"""
+    """
+    Данные тестовой сессии
+        - `workers` заполняется только при объединении сессий воркеров pytest-xdist (`merge()`)
+        - `latencies` - статистика длительностей HTTP-запросов по эндпоинтам: {"GET get_dag_by_id": LatencySketch}
+        - `performance` - отчет о регрессиях производительности (`perf_regression.PerfReport.to_dict()`)
+    """
     session: SessionTiming = field(default_factory=SessionTiming)
     debug: bool = field(default_factory=get_debug_flag)
     pytest_debug: bool = False
     tests: dict[str, TestData] = field(default_factory=dict)
+    workers: dict[str, WorkerStats] = field(default_factory=dict)
+    latencies: dict[str, LatencySketch] = field(default_factory=dict)
+    performance: dict[str, Any] | None = None
+
+    @property
+    def utilization(self) -> float:
+        """Средняя загрузка воркеров: суммарное время тестов / (количество воркеров * длительность сессии)"""
+        capacity = len(self.workers) * self.session.duration
+        return round(sum(stats.busy for stats in self.workers.values()) / capacity, 3) if capacity else 0.0
+
+    @classmethod
+    def merge(cls, sessions: dict[str, "SessionData"]) -> "SessionData":
+        """
+        Объединяет данные сессий воркеров pytest-xdist в одну сессию:
+            - Время сессии: от самого раннего старта до самого позднего окончания воркера
+            - Тесты и длительности запросов всех воркеров, статистика каждого воркера в `workers`
+
+        :param sessions: {worker_id: SessionData}
+        :return: SessionData
+        """
+        merged = cls()
+        starts = [data.session.start_timestamp for data in sessions.values() if data.session.start_timestamp]
+        ends = [data.session.end_timestamp for data in sessions.values() if data.session.end_timestamp]
+        if starts:
+            end = max(ends) if ends else None
+            merged.session = SessionTiming.from_dict({
+                "start_timestamp": min(starts),
+                "end_timestamp": end,
+                "duration": round(end - min(starts), 2) if end is not None else 0.0,
+            })
+        for worker_id, data in sorted(sessions.items()):
+            merged.debug = merged.debug or data.debug
+            merged.pytest_debug = merged.pytest_debug or data.pytest_debug
+            merged.tests.update(data.tests)
+            merged.workers[worker_id] = WorkerStats.from_session(data)
+            for endpoint, sketch in data.latencies.items():
+                merged.latencies.setdefault(endpoint, LatencySketch()).merge(sketch)
+        return merged
 
     def add_test(self, nodeid: str) -> TestData:
         """Добавляет тест с разбором nodeid"""
@@ -1,16 +1,261 @@
 """checker.py"""
 
+import json
 import re
+from collections.abc import Callable, Iterable, Iterator
 from os import linesep
 from typing import Any, get_args
 
 from requests import Response
 
 from libs import get_log
+from libs.api.airflow.json_column import JsonColumn
+from libs.api.airflow.json_stream import JsonStreamWalker
+from libs.api.airflow.swagger_validator import get_schema_validators
 
 LOG = get_log(__name__)
 
 
+# Разделитель сегментов пути: точка вне `[...]` и `{...}` (Ex: "dags.[?version=1.5].{dag_id,tags}")
+_SEGMENT_SEPARATOR = re.compile(r"\.(?![^\[{]*[\]}])")
+_SLICE_PATTERN = re.compile(r"^\[(-?\d*):(-?\d*)(?::(-?\d*))?]$")
+_FILTER_PATTERN = re.compile(r"^\[\?([^\]=!]+?)(?:(!?=)([^\]]*))?]$")
+_PROJECTION_PATTERN = re.compile(r"^\{([^{}]+)}$")
+_FILTER_VALUE = re.compile(r"""("[^"]*"|'[^']*'|[^|]*)(\||$)""")  # значение фильтра до `|` (кавычки - целиком)
+
+
+class PathSelector:
+    """
+    Селектор сегмента пути в dotted.notation, вычисляемый в процессе обхода (без промежуточных списков):
+        - Срез списка: `[0:10]`, `[-5:]`, `[::2]`
+        - Фильтр элементов списка по значению ключа: `[?state=failed]`, `[?state!=success]`,
+          несколько значений через `|`: `[?state=failed|upstream_failed|null]`, наличие значения: `[?note]`
+            - Значения `null`, `true`, `false` и числа сравниваются как JSON-литералы с учетом типа:
+              `[?v=1]` не совпадает с `true`, `[?v=1]` совпадает с `1.0`
+            - Число без кавычек совпадает и со строкой той же записи: `[?dag_id=123]` → "123"
+            - Строки в кавычках сравниваются только со строками: `[?v="1.5"]`, `[?v='null']`, `[?v="a|b"]`
+            - Остальные значения сравниваются как строки
+        - Проекция словаря на набор ключей: `{task_id,state}` → {"task_id": ..., "state": ...}
+    """
+
+    __slots__ = ("segment", "kind", "bounds", "key", "values", "negate", "keys")
+
+    def __init__(self, segment: str):
+        self.segment: str = segment
+        self.bounds: slice | None = None
+        self.key: str | None = None
+        self.values: frozenset[tuple[type, Any]] | None = None  # ключи сравнения (см. `_value_key()`)
+        self.negate: bool = False
+        self.keys: tuple[str, ...] = ()
+
+        if match := _SLICE_PATTERN.match(segment):
+            self.kind = "slice"
+            self.bounds = slice(*(int(bound) if bound else None for bound in match.groups()))
+            if self.bounds.step == 0:
+                raise ValueError(f'Шаг среза не может быть равен нулю: "{segment}"')
+        elif match := _FILTER_PATTERN.match(segment):
+            self.kind = "filter"
+            self.key, operator, values = match.groups()
+            self.negate = operator == "!="
+            self.values = frozenset(self._parse_literals(values)) if operator else None
+        elif match := _PROJECTION_PATTERN.match(segment):
+            self.kind = "projection"
+            self.keys = tuple(key.strip() for key in match.group(1).split(","))
+        else:
+            raise ValueError(
+                f'Некорректный селектор: "{segment}" | '
+                'Используйте `[начало:конец:шаг]`, `[?ключ=значение]` или `{ключ1,ключ2}`'
+            )
+
+    @staticmethod
+    def parse(segment: str) -> "PathSelector | None":
+        """:return: PathSelector для сегментов-селекторов или None для ключа, индекса `[n]` и `[*]`"""
+        if segment.startswith("{") or (segment.startswith("[") and (":" in segment or segment.startswith("[?"))):
+            return PathSelector(segment)
+        return None
+
+    @staticmethod
+    def _parse_literals(values: str) -> Iterator[tuple[type, Any]]:
+        """
+        Ключи сравнения значений фильтра, разделенных `|`:
+            - строка в кавычках → строка без кавычек
+            - null, true, false → JSON-литерал
+            - число → число и строка той же записи
+            - иначе → строка
+        """
+        pos = 0
+        while True:
+            match = _FILTER_VALUE.match(values, pos)
+            value = match.group(1)
+            if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+                yield str, value[1:-1]
+            else:
+                try:
+                    literal = json.loads(value)
+                except ValueError:
+                    literal = value
+                if isinstance(literal, (int, float)) and not isinstance(literal, bool):
+                    yield str, value
+                yield PathSelector._value_key(literal) or (str, value)
+            if not match.group(2):
+                return
+            pos = match.end()
+
+    @staticmethod
+    def _value_key(value: Any) -> tuple[type, Any] | None:
+        """
+        Ключ сравнения значения с учетом типа JSON: bool не равен числу, int и float равны по значению
+
+        :return: (тип, значение) или None для контейнеров
+        """
+        if value is None or isinstance(value, (bool, str)):
+            return type(value), value
+        if isinstance(value, (int, float)):
+            return float, value
+        return None
+
+    @property
+    def streamable(self) -> bool:
+        """Элемент списка можно выбрать по индексу и значению без длины списка (см. `JsonStreamWalker`)"""
+        if self.kind == "filter":
+            return True
+        if self.kind == "slice":
+            bounds = self.bounds
+            return (bounds.step or 1) > 0 and all(bound is None or bound >= 0 for bound in (bounds.start, bounds.stop))
+        return False
+
+    def matches(self, idx: int, item: Any) -> bool:
+        """Проверка элемента списка с индексом `idx` (только для `streamable` селекторов)"""
+        if self.kind == "slice":
+            start, stop, step = self.bounds.start or 0, self.bounds.stop, self.bounds.step or 1
+            return idx >= start and (stop is None or idx < stop) and (idx - start) % step == 0
+        if not isinstance(item, dict):
+            return False
+        value = item.get(self.key)
+        found = value is not None if self.values is None else self._value_key(value) in self.values
+        return found != self.negate
+
+    def select(self, current: Any) -> Iterator[Any]:
+        """:return: Итератор выбранных значений для текущего элемента обхода"""
+        if self.kind == "projection":
+            if isinstance(current, dict):
+                yield {key: current.get(key) for key in self.keys}
+        elif isinstance(current, list):
+            if self.kind == "slice":
+                for idx in range(*self.bounds.indices(len(current))):
+                    yield current[idx]
+            else:
+                for item in current:
+                    if self.matches(0, item):
+                        yield item
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.segment}")'
+
+
+class PathTrie:
+    """
+    Префиксное дерево (trie) путей в dotted.notation:
+        - Общие префиксы путей объединяются в один узел: `dags.[*].dag_id` и `dags.[*].tags.[*].name`
+          разделяют узлы `dags` и `[*]`
+        - Обход JSON-объекта по всем путям дерева выполняется за один проход
+        - Для каждого найденного значения (кроме null) вызывается `visit(key_path, value)`
+        - Порядок значений для каждого пути совпадает с порядком обхода этого пути по отдельности
+        - Срезы, фильтры и проекции (`PathSelector`) применяются в том же обходе
+
+    Ex:
+        PathTrie(["dags.[*].dag_id", "total_entries"]).walk(json_data, lambda path, value: ...)
+        PathTrie(["task_instances.[?state=failed].task_id"]).walk(json_data, ...)
+    """
+
+    __slots__ = ("children", "paths", "selector")
+
+    def __init__(self, key_paths: Iterable[str] = (), selector: PathSelector | None = None):
+        # Ключи потомков: str - ключ словаря, int - индекс списка, "[*]" - все элементы списка,
+        # сегмент селектора (Ex: "[0:10]", "[?state=failed]", "{dag_id,state}") - узел с `selector`
+        self.children: dict[str | int, PathTrie] = {}
+        self.paths: list[str] = []
+        self.selector: PathSelector | None = selector
+        for key_path in key_paths:
+            self.add(key_path)
+
+    @staticmethod
+    def split(key_path: str) -> list[str]:
+        """Разбивает путь на сегменты (точки внутри `[...]` и `{...}` не считаются разделителями)"""
+        return _SEGMENT_SEPARATOR.split(key_path)
+
+    @staticmethod
+    def is_multi(key_path: str) -> bool:
+        """Путь может вернуть несколько значений: содержит `[*]`, срез или фильтр"""
+        if "[" not in key_path:
+            return False
+        return any(part == "[*]" or (part.startswith("[") and (":" in part or part.startswith("[?")))
+                   for part in PathTrie.split(key_path))
+
+    def add(self, key_path: str) -> None:
+        """Добавляет путь в дерево (синтаксис пути должен быть проверен заранее)"""
+        node = self
+        for part in PathTrie.split(key_path):
+            selector = PathSelector.parse(part)
+            key = int(part[1:-1]) if selector is None and part.startswith("[") and part != "[*]" else part
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = PathTrie(selector=selector)
+            node = child
+        if key_path not in node.paths:
+            node.paths.append(key_path)
+
+    def walk(self, current: Any, visit: Callable[[str, Any], None], keep_null: bool = False) -> None:
+        """
+        Рекурсивно обходит структуру данных по всем путям дерева
+
+        :param current: Текущий элемент для обработки (dict, list или None)
+        :param visit: Обработчик найденного значения: visit(key_path, value)
+        :param keep_null: Передавать в `visit` значения null и отсутствующие ключи: если null или отсутствует
+            промежуточный сегмент, None получает каждый путь поддерева (по одному разу на элемент `[*]`)
+        """
+        if current is None:
+            if keep_null:
+                self.visit_null(visit)
+            return
+
+        for key_path in self.paths:
+            visit(key_path, current)
+
+        for key, child in self.children.items():
+            # Обработка срезов, фильтров и проекций
+            if child.selector is not None:
+                if keep_null and not isinstance(current, dict if child.selector.kind == "projection" else list):
+                    child.visit_null(visit)
+                    continue
+                for item in child.selector.select(current):
+                    child.walk(item, visit, keep_null)
+            # Обработка списков и wildcard
+            elif key == "[*]":
+                if isinstance(current, list):
+                    for item in current:
+                        child.walk(item, visit, keep_null)
+                elif keep_null:
+                    child.visit_null(visit)
+            elif isinstance(key, int):
+                if isinstance(current, list) and key < len(current):
+                    child.walk(current[key], visit, keep_null)
+                elif keep_null:
+                    child.visit_null(visit)
+            # Обработка словарей
+            elif isinstance(current, dict):
+                child.walk(current.get(key), visit, keep_null)
+            elif keep_null:
+                child.visit_null(visit)
+
+    def visit_null(self, visit: Callable[[str, Any], None]) -> None:
+        """Передает None в `visit` для всех путей узла и его потомков (поддерево null или отсутствует)"""
+        for key_path in self.paths:
+            visit(key_path, None)
+        for child in self.children.values():
+            child.visit_null(visit)
+
+
 class Checker:
     """Класс методов проверки и валидации HTTP ответов"""
 
@@ -31,6 +276,8 @@ class Checker:
                 - Вложенных ключей через точку: required_keys = "key.subkey.value"
                 - Элементов списков через индекс: required_keys = "key.[0].subkey.[123]"
                 - Всех элементов списка: required_keys = "key.[*].subkey.[*].value"
+                - Среза списка: required_keys = "key.[0:10].subkey"
+                - Отфильтрованных элементов списка: required_keys = "key.[?state=failed].subkey"
                 - параметр `required_keys` может содержать несколько проверок в виде списка:
                     Ex: required_keys = ["key1.subkey", "key2.[0].subkey.[*].value"]
             - Проверяет типы значений (если указан словарь `key_types` и значения есть в ответе):
@@ -83,94 +330,180 @@ class Checker:
             assert (isinstance(json_data, (dict, list)) and json_data), f'JSON is empty{postfix}'
         # endregion
 
-        # region Проверка обязательных ключей (required_keys)
-        if required_keys:
-            # Проверка синтаксиса для всех путей
-            for key_path in required_keys:
-                Checker._validate_path_syntax(key_path)
+        # region Подготовка путей проверки (required_keys + key_types)
+        required_keys, allowed_types = Checker._prepare_path_checks(required_keys, key_types)
+        # endregion
 
-            required_keys = [required_keys] if isinstance(required_keys, str) else required_keys
+        # region Однопроходный обход JSON по всем путям (PathTrie)
+        found_values: dict[str, Any] = {}  # первое найденное значение по пути
+        found_counts: dict[str, int] = {}  # количество найденных значений по пути
+        type_errors: dict[str, tuple[int, Any]] = {}  # первый элемент с несоответствием типа: (номер, значение)
+
+        def visit(key_path: str, value: Any) -> None:
+            """Сбор значений и проверка типов в процессе обхода"""
+            count = found_counts[key_path] = found_counts.get(key_path, 0) + 1
+            if count == 1:
+                found_values[key_path] = value
+            types = allowed_types.get(key_path)
+            if types is not None and key_path not in type_errors and not isinstance(value, types):
+                type_errors[key_path] = (count, value)
+
+        if required_keys or allowed_types:
+            PathTrie([*required_keys, *allowed_types]).walk(json_data, visit)
+        # endregion
 
-            for key_path in required_keys:
-                try:
-                    # Валидация синтаксиса пути
-                    if any(part.startswith("[") and not re.match(r"\[\*?\d*]", part)
-                           for part in key_path.split(".")):
-                        raise ValueError(f"Invalid path syntax: '{key_path}'")
-
-                    values = Checker.get_value(json_data, key_path)
-                    if values is None:
-                        raise AssertionError(f'Путь "{key_path}" не найден')
-
-                    # Если результат — список, проверяем, что все элементы не None
-                    if isinstance(values, list):
-                        for idx, item in enumerate(values):
-                            if item is None:
-                                raise AssertionError(
-                                    f'Элемент #{idx} в пути "{key_path}" содержит None '
-                                    f'или отсутствует{postfix}'
-                                )
-                    # Для скаляров проверяем существование
-                    else:
-                        assert values is not None, f'Значение для пути "{key_path}" равно None{postfix}'
-
-                except Exception as e:
-                    raise AssertionError(f'Ошибка проверки обязательных ключей: {e}{postfix}') from e
+        # region Проверка обязательных ключей (required_keys)
+        for key_path in required_keys:
+            # Для wildcard-путей допустим пустой список значений, для точных путей значение обязательно
+            if not PathTrie.is_multi(key_path) and key_path not in found_values:
+                raise AssertionError(f'Ошибка проверки обязательных ключей: Путь "{key_path}" не найден{postfix}')
         # endregion
 
         # region Проверка типов данных (key_types)
-        if key_types:
-            for key_path, expected_type in key_types.items():
-                try:
-                    # Проверяем синтаксис пути перед обработкой
-                    Checker._validate_path_syntax(key_path)
-                    # Получаем значение по заданному пути
-                    values = Checker.get_value(json_data, key_path)
-
-                    allowed_types = get_args(expected_type) or (expected_type,)
-                    has_wildcard = "[*]" in key_path
-
-                    if has_wildcard:
-                        # Для wildcard-путей проверяем элементы списка на соответствие типу
-                        if not isinstance(values, list):
-                            raise AssertionError(
-                                f'Ожидался список для пути "{key_path}", получен: {type(values).__name__}'
-                            )
-
-                        # Перебираем элементы с выводом индекса
-                        for idx, item in enumerate(values, start=1):  # <--- start=1 для удобства нумерации элементов
-                            try:
-                                assert isinstance(item, allowed_types), (
-                                    f'Ошибка Типа данных в элементе #{idx} | Путь: {key_path} | '
-                                    f'Ожидаемый тип: {allowed_types} | '
-                                    f'Фактический тип: {type(item).__name__} | '
-                                    f'Значение: {Checker.truncate(str(item))}'
-                                )
-                            except AssertionError as e:
-                                # Вывод отладочной информации
-                                LOG.debug(
-                                    f'Проблемный элемент с несоответствием типа для пути {key_path}: '
-                                    f'{key_path.split(".")[0]}[{idx - 1}] | {e}{linesep}'
-                                    f'Response JSON: {Checker.truncate(str(json_data))}'
-                                )
-                                raise
-
-                    else:
-                        # Для обычных путей проверяем тип самого значения
-                        if not isinstance(values, allowed_types):
-                            raise AssertionError(
-                                f'Ошибка Типа данных | Путь: "{key_path}") | '
-                                f'Ожидаемый тип: {allowed_types} | '
-                                f'Фактический тип: {type(values).__name__} | '
-                                f'Значение: {Checker.truncate(str(values))}'
-                            )
-
-                except Exception as e:
-                    raise AssertionError(f'Ошибка проверки типа для пути "{key_path}": {e}') from e
+        for key_path, types in allowed_types.items():
+            if PathTrie.is_multi(key_path):
+                # Для wildcard-путей проверяем элементы списка на соответствие типу
+                if key_path not in type_errors:
+                    continue
+                idx, item = type_errors[key_path]  # <--- нумерация элементов начинается с 1
+                error = Checker._type_error(key_path, types, item, idx)
+                # Вывод отладочной информации
+                LOG.debug(
+                    f'Проблемный элемент с несоответствием типа для пути {key_path}: '
+                    f'{key_path.split(".")[0]}[{idx - 1}] | {error}{linesep}'
+                    f'Response JSON: {Checker.truncate(str(json_data))}'
+                )
+            else:
+                # Для обычных путей проверяем тип самого значения
+                value = found_values.get(key_path)
+                if isinstance(value, types):
+                    continue
+                error = Checker._type_error(key_path, types, value)
+            raise AssertionError(f'Ошибка проверки типа для пути "{key_path}": {error}')
         # endregion
 
         return json_data
 
+    @staticmethod
+    def validate_response_stream(
+            response: Any,
+            expected_code: int = 200,
+            required_keys: str | list[str] | None = None,
+            key_types: dict[str, type | tuple[type, ...]] | None = None,
+            chunk_size: int = 1 << 16
+    ) -> dict[str, int]:
+        """
+        Потоковый вариант `validate_response_json()` для больших ответов (Ex: `get_dags` с `limit=1000`):
+            - Тело ответа читается по частям, JSON-объект целиком не строится (память не зависит от размера ответа)
+            - Пути `required_keys` и `key_types` компилируются в `PathTrie` и проверяются по мере чтения
+            - Несоответствие типа прерывает чтение сразу (оставшаяся часть тела не загружается),
+              отсутствие обязательных ключей проверяется по окончании чтения
+            - Сообщения об ошибках совпадают с `validate_response_json()`
+            - Для контейнеров проверяется только тип (содержимое обрабатывается потоково)
+            - Соединение освобождается в любом случае: при досрочном прерывании - закрывается
+
+        :param response: Ответ без предзагрузки тела:
+                          - requests.Response с `stream=True`
+                          - urllib3.HTTPResponse (Ex: `CustomRESTClient.GET(url, _preload_content=False)`)
+        :param expected_code: Ожидаемый HTTP-код (по умолчанию 200)
+        :param required_keys: Ключи или пути, которые должны существовать
+        :param key_types: Dict {key: expected_type or tuple_of_types} для проверки типов
+        :param chunk_size: Размер читаемой части тела в байтах
+        :return: dict {key_path: количество найденных значений (без null)}
+
+        Usage:
+        >>> response = rest_client.GET(url, _preload_content=False)
+        >>> Checker.validate_response_stream(response, required_keys="dags.[*].dag_id",
+        ...                                  key_types={"dags": list, "dags.[*].dag_id": str})
+        """
+        # region Подготовка
+        status_code = getattr(response, "status_code", None) or getattr(response, "status", None)
+        if hasattr(response, "iter_content"):
+            chunks = response.iter_content(chunk_size)
+        else:
+            chunks = response.stream(chunk_size)
+        required_keys, allowed_types = Checker._prepare_path_checks(required_keys, key_types)
+
+        found_counts: dict[str, int] = {}  # количество найденных значений по пути
+
+        def visit(key_path: str, value: Any) -> None:
+            """Проверка типов по мере чтения (с досрочным прерыванием)"""
+            count = found_counts[key_path] = found_counts.get(key_path, 0) + 1
+            types = allowed_types.get(key_path)
+            if types is not None and not isinstance(value, types):
+                idx = count if PathTrie.is_multi(key_path) else None
+                error = Checker._type_error(key_path, types, value, idx)
+                raise AssertionError(f'Ошибка проверки типа для пути "{key_path}": {error}')
+
+        walker = JsonStreamWalker(chunks, PathTrie([*required_keys, *allowed_types]), visit)
+        consumed = False
+        # endregion
+
+        try:
+            # region Проверка статус-кода
+            if status_code != expected_code:
+                raise AssertionError(
+                    f'Expected HTTP {expected_code}, got {status_code} | URL: {getattr(response, "url", None)}'
+                    f'{linesep}Response: {Checker.truncate(walker.read_head())}'
+                )
+            # endregion
+
+            # region Потоковый обход JSON по всем путям
+            try:
+                walker.walk()
+            except ValueError as e:
+                raise AssertionError(f'Invalid JSON: {e}{linesep}Response: {Checker.truncate(walker.head)}') from e
+            consumed = True
+            # endregion
+        finally:
+            release = getattr(response, "release_conn", None) if consumed else None
+            (release or response.close)()
+
+        postfix = f'{linesep}Response: {Checker.truncate(walker.head)}'
+
+        # region Проверка обязательных ключей (required_keys)
+        for key_path in required_keys:
+            if not PathTrie.is_multi(key_path) and key_path not in found_counts:
+                raise AssertionError(f'Ошибка проверки обязательных ключей: Путь "{key_path}" не найден{postfix}')
+        # endregion
+
+        # region Проверка типов для отсутствующих значений (key_types)
+        for key_path, types in allowed_types.items():
+            if not PathTrie.is_multi(key_path) and key_path not in found_counts and not isinstance(None, types):
+                error = Checker._type_error(key_path, types, None)
+                raise AssertionError(f'Ошибка проверки типа для пути "{key_path}": {error}')
+        # endregion
+
+        return found_counts
+
+    @staticmethod
+    def validate_response_schema(
+            response: Response,
+            spec: dict,
+            schema_name: str,
+            expected_code: int = 200
+    ) -> dict | list:
+        """
+        Проверяет ответ API на соответствие схеме из спецификации SWAGGER/OpenAPI:
+            - Проверяет статус-код и валидность JSON через `validate_response_json()`
+            - Проверяет JSON-объект целиком валидатором, скомпилированным из `definitions`/`components.schemas`
+            - Валидаторы компилируются один раз на версию спецификации (кеш по хешу спецификации)
+
+        :param response: requests.Response object
+        :param spec: Спецификация SWAGGER/OpenAPI (Ex: `AirflowApiClient.get_swagger_spec()`)
+        :param schema_name: Имя схемы ответа (Ex: "DAGCollection", "DAGRun", "Pet")
+        :param expected_code: Ожидаемый HTTP-код (по умолчанию 200)
+        :return: dict | list - JSON-объект целиком
+
+        Usage:
+        >>> Checker.validate_response_schema(response, client.get_swagger_spec(), "DAGCollection")
+        """
+        json_data = Checker.validate_response_json(response, expected_code=expected_code)
+        try:
+            return get_schema_validators(spec).validate(schema_name, json_data)
+        except AssertionError as e:
+            raise AssertionError(f'{e}{linesep}Response: {Checker.truncate(response.text)}') from None
+
     @staticmethod
     def assert_json_value(
             response: Response,
@@ -186,7 +519,7 @@ class Checker:
                 - одного элемента пути: key_path = "key.subkey.value"
                 - кортежа путей: key_path = ("key1.subkey.value", "key2.[0].subkey.value")
         ВАЖНО:
-            - Запрещено использование [*] в `key_path`
+            - Запрещено использование [*], срезов `[0:10]` и фильтров `[?key=value]` в `key_path`
             - Для списков используйте конкретные индексы: [0], [123] и т.д.
 
         :param response: requests.Response object
@@ -208,9 +541,9 @@ class Checker:
         # region Проверка на запрещенный паттерн [*] в key_path
         def _check_wildcard(key: str) -> None:
             """Внутренняя проверка синтаксиса пути"""
-            if "[*]" in key:
+            if PathTrie.is_multi(key):
                 raise AssertionError(
-                    f'Использование [*] запрещено в key_path: "{key}" | '
+                    f'Использование [*], срезов и фильтров запрещено в key_path: "{key}" | '
                     f'Используйте конкретные индексы, например [0], [123]'
                 )
 
@@ -253,54 +586,26 @@ class Checker:
             - Для элемента списка через индекс: key_path = "key.[123].subkey.[0].value"
             - Для списка значений ключей всех элементов списка: key_path = "key.[*].subkey.[*]"
                 Ex: key_path = dags.[*].tags.[0].name → список значений `name` из первого элемента `tags` каждого DAG
+            - Для среза списка: key_path = "dags.[0:10].dag_id" (поддерживаются отрицательные границы и шаг)
+            - Для элементов списка, отобранных фильтром: key_path = "task_instances.[?state=failed|null].task_id"
+            - Для проекции словаря на набор ключей: key_path = "task_instances.[?state=failed].{task_id,state}"
+            - Срезы, фильтры и проекции применяются в процессе обхода, без промежуточных списков
             - Для wildcard [*] может возвращать уникальные значения (unique=True) или все по порядку (unique=False)
-            - Если на пути встречается null или [] - возвращает None
-            - Если unique=True, None будут исключены из результатов, даже если они разрешены в key_types.
+            - Значения null, отсутствующие ключи и индексы пропускаются:
+                - для точного пути возвращается None
+                - для пути с [*], срезом или фильтром - список без них (пустой список, если значений нет)
+            - Если unique=True, значения сравниваются на равенство (в т.ч. dict и list), порядок - по первому вхождению
 
         :param data: JSON-объект (объект может содержать вложенные структуры такие как  dict или list)
         :param key_path: Путь к ключу в формате dotted.notation (вида `key.subkey` или `key.[n]/[*].subkey`)
-        :param unique: Для wildcard-путей возвращает set вместо list (без None)
+        :param unique: Для wildcard-путей возвращает list уникальных значений
         :return: value/list - значение ключа по указанному пути или список значений всех ключей (при [*])
         """
 
-        def traverse(current: Any, parts: list[str]) -> Any:
-            """
-            Рекурсивно обходит структуру данных по указанному пути
-
-            :param current: Текущий элемент для обработки (dict, list или None)
-            :param parts: Оставшиеся части пути для обработки
-            :return: Результат обхода. Может быть:
-                    - Списком значений для wildcard-путей
-                    - Конкретным значением для точных путей
-                    - None если путь не найден
-            """
-            if not parts:
-                return [current] if current is not None else []
-
-            part = parts[0]
-            remaining = parts[1:]
-
-            # Обработка списков и wildcard
-            if part.startswith("[") and part.endswith("]"):
-                results = []
-                if part == "[*]":
-                    if isinstance(current, list):
-                        for item in current:
-                            results.extend(traverse(item, remaining))
-                else:
-                    idx = int(part[1:-1])
-                    if isinstance(current, list) and idx < len(current):
-                        results.extend(traverse(current[idx], remaining))
-                return results
-
-            # Обработка словарей
-            if isinstance(current, dict):
-                return traverse(current.get(part), remaining)
-            return []
-
         # Определяем, содержит ли путь wildcard
-        has_wildcard = "[*]" in key_path
-        all_values = traverse(data, key_path.split("."))
+        has_wildcard = PathTrie.is_multi(key_path)
+        all_values = []
+        PathTrie([key_path]).walk(data, lambda _, value: all_values.append(value))
 
         # Для обычных путей возвращаем единственное значение
         if not has_wildcard:
@@ -310,14 +615,140 @@ class Checker:
         if unique:
             unique_values = []
             seen = set()
+            seen_unhashable = []  # dict и list: сравнение на равенство
             for value in all_values:
-                if value not in seen:
+                try:
+                    if value in seen:
+                        continue
                     seen.add(value)
-                    unique_values.append(value)
+                except TypeError:
+                    if value in seen_unhashable:
+                        continue
+                    seen_unhashable.append(value)
+                unique_values.append(value)
             return unique_values
 
         return all_values
 
+    @staticmethod
+    def get_columns(data: dict | list, key_paths: str | list[str]) -> dict[str, JsonColumn]:
+        """
+        Колоночный режим: извлекает значения по нескольким путям в dotted.notation за один обход JSON-объекта
+            - Для каждого пути возвращается колонка `JsonColumn` со всеми значениями по порядку обхода
+            - В отличие от `get_value()` колонка содержит и `null`-значения (в т.ч. отсутствующие ключи)
+            - Проверки над колонкой выполняются целиком (см. `JsonColumn`, `validate_columns()`)
+
+        :param data: JSON-объект
+        :param key_paths: Путь или список путей (Ex: ["dags.[*].dag_id", "dags.[*].is_paused"])
+        :return: dict {key_path: JsonColumn}
+
+        Usage:
+        >>> columns = Checker.get_columns(json_data, ["task_instances.[*].task_id", "task_instances.[*].state"])
+        >>> columns["task_instances.[*].state"].count("failed")
+        """
+        key_paths = [key_paths] if isinstance(key_paths, str) else list(key_paths)
+        for key_path in key_paths:
+            Checker._validate_path_syntax(key_path)
+
+        columns = {key_path: JsonColumn(key_path) for key_path in key_paths}
+        appenders = {key_path: column.values.append for key_path, column in columns.items()}
+        PathTrie(key_paths).walk(data, lambda key_path, value: appenders[key_path](value), keep_null=True)
+        return columns
+
+    @staticmethod
+    def get_column(data: dict | list, key_path: str) -> JsonColumn:
+        """
+        Колоночный режим для одного пути (см. `get_columns()`)
+
+        :param data: JSON-объект
+        :param key_path: Путь в dotted.notation (Ex: "task_instances.[*].state")
+        :return: JsonColumn
+        """
+        return Checker.get_columns(data, key_path)[key_path]
+
+    @staticmethod
+    def validate_columns(
+            json_data: dict | list,
+            not_null: str | list[str] | None = None,
+            unique: str | list[str] | None = None,
+            key_types: dict[str, type | tuple[type, ...]] | None = None,
+            allowed_values: dict[str, Iterable[Any]] | None = None,
+    ) -> dict[str, JsonColumn]:
+        """
+        Колоночный режим проверок wildcard-путей для больших массивов JSON:
+            - Все пути извлекаются в колонки за один обход (`get_columns()`)
+            - Проверяет отсутствие `null` и отсутствующих ключей (`not_null`)
+            - Проверяет уникальность значений (`unique`)
+            - Проверяет типы значений (`key_types`): `null` проверяется как NoneType
+                Ex: key_types = {"dags.[*].schedule_interval": (dict, type(None))}
+            - Проверяет вхождение значений в допустимый набор (`allowed_values`)
+                Ex: allowed_values = {"task_instances.[*].state": {"success", "skipped"}}
+            - Возвращает колонки для дополнительных проверок и агрегатов
+
+        :param json_data: JSON-объект
+        :param not_null: Пути, значения которых не должны быть null
+        :param unique: Пути, значения которых должны быть уникальны
+        :param key_types: Dict {key_path: expected_type or tuple_of_types}
+        :param allowed_values: Dict {key_path: допустимые значения}
+        :return: dict {key_path: JsonColumn}
+
+        Usage:
+        >>> columns = Checker.validate_columns(json_data, not_null="dags.[*].dag_id", unique="dags.[*].dag_id")
+        >>> columns["dags.[*].dag_id"].value_counts()
+        """
+        not_null = [not_null] if isinstance(not_null, str) else list(not_null or [])
+        unique = [unique] if isinstance(unique, str) else list(unique or [])
+        key_types = key_types or {}
+        allowed_values = allowed_values or {}
+
+        key_paths = list(dict.fromkeys([*not_null, *unique, *key_types, *allowed_values]))
+        columns = Checker.get_columns(json_data, key_paths)
+
+        def postfix() -> str:
+            """Текст ответа для сообщения об ошибке (формируется только при ошибке)"""
+            return f'{linesep}Response: {Checker.truncate(str(json_data))}'
+
+        for key_path in not_null:
+            idx = columns[key_path].first_null()
+            if idx is not None:
+                raise AssertionError(
+                    f'Ошибка проверки колонки "{key_path}": Элемент #{idx + 1} содержит None или отсутствует '
+                    f'(всего: {columns[key_path].null_count} из {len(columns[key_path])}){postfix()}'
+                )
+
+        for key_path in unique:
+            column = columns[key_path]
+            if not column.is_unique():
+                duplicates = column.duplicates()
+                raise AssertionError(
+                    f'Ошибка проверки колонки "{key_path}": Значения не уникальны | '
+                    f'Повторы: {Checker.truncate(str(duplicates))}{postfix()}'
+                )
+
+        for key_path, expected_type in key_types.items():
+            allowed_types = get_args(expected_type) or (expected_type,)
+            mismatch = columns[key_path].first_type_mismatch(allowed_types)
+            if mismatch is not None:
+                idx, item = mismatch
+                raise AssertionError(
+                    f'Ошибка проверки типа для пути "{key_path}": '
+                    f'Ошибка Типа данных в элементе #{idx + 1} | Путь: {key_path} | '
+                    f'Ожидаемый тип: {allowed_types} | '
+                    f'Фактический тип: {type(item).__name__} | '
+                    f'Значение: {Checker.truncate(str(item))}'
+                )
+
+        for key_path, allowed in allowed_values.items():
+            allowed = list(allowed)
+            unexpected = columns[key_path].not_in(allowed)
+            if unexpected:
+                raise AssertionError(
+                    f'Ошибка проверки колонки "{key_path}": Недопустимые значения: {unexpected} | '
+                    f'Допустимые: {allowed}{postfix()}'
+                )
+
+        return columns
+
     @staticmethod
     def truncate(text: str, max_len: int = 1000) -> str:
         """
@@ -328,20 +759,65 @@ class Checker:
         """
         return text[:max_len] + "..." if len(text) > max_len else text
 
+    @staticmethod
+    def _prepare_path_checks(
+            required_keys: str | list[str] | None,
+            key_types: dict[str, type | tuple[type, ...]] | None
+    ) -> tuple[list[str], dict[str, tuple[type, ...]]]:
+        """
+        Проверяет синтаксис путей `required_keys` и `key_types`
+
+        :return: (список обязательных путей, dict {key_path: кортеж допустимых типов})
+        """
+        required_keys = [required_keys] if isinstance(required_keys, str) else list(required_keys or [])
+        key_types = key_types or {}
+
+        for key_path in required_keys:
+            Checker._validate_path_syntax(key_path)
+        for key_path in key_types:
+            try:
+                Checker._validate_path_syntax(key_path)
+            except ValueError as e:
+                raise AssertionError(f'Ошибка проверки типа для пути "{key_path}": {e}') from e
+
+        allowed_types = {key_path: get_args(expected_type) or (expected_type,)
+                         for key_path, expected_type in key_types.items()}
+        return required_keys, allowed_types
+
+    @staticmethod
+    def _type_error(key_path: str, types: tuple[type, ...], value: Any, idx: int | None = None) -> str:
+        """Текст ошибки несоответствия типа (idx - номер элемента для wildcard-путей, начиная с 1)"""
+        if idx is not None:
+            return (
+                f'Ошибка Типа данных в элементе #{idx} | Путь: {key_path} | '
+                f'Ожидаемый тип: {types} | '
+                f'Фактический тип: {type(value).__name__} | '
+                f'Значение: {Checker.truncate(str(value))}'
+            )
+        return (
+            f'Ошибка Типа данных | Путь: "{key_path}") | '
+            f'Ожидаемый тип: {types} | '
+            f'Фактический тип: {type(value).__name__} | '
+            f'Значение: {Checker.truncate(str(value))}'
+        )
+
     @staticmethod
     def _validate_path_syntax(key_path: str):
         """Проверяет корректность синтаксиса пути в формате dotted.notation"""
         _INDEX_PATTERN = re.compile(r"^\[\d+]$")
         _WILDCARD_PATTERN = re.compile(r"^\[\*]$")
 
-        parts = key_path.split(".")
+        parts = PathTrie.split(key_path)
         for part in parts:
-            if part.startswith("["):
-                # Проверяем корректность индекса списка: [*], [0], [123]
-                if not (_WILDCARD_PATTERN.match(part) or _INDEX_PATTERN.match(part)):
+            if part.startswith(("[", "{")):
+                # Проверяем корректность индекса списка: [*], [0], [123] и селекторов: [0:10], [?state=failed], {a,b}
+                if _WILDCARD_PATTERN.match(part) or _INDEX_PATTERN.match(part):
+                    continue
+                if PathSelector.parse(part) is None:
                     raise ValueError(
                         f'Некорректный формат индекса списка: "{part}" | '
-                        'Используйте `[*]` для всех элементов или `[число]` для конкретного индекса'
+                        'Используйте `[*]` для всех элементов, `[число]` для конкретного индекса, '
+                        '`[начало:конец]` для среза или `[?ключ=значение]` для фильтра'
                     )
             else:
                 # Запрещаем квадратные скобки в обычных ключах
@@ -0,0 +1,290 @@
+"""session_history.py"""
+
+import re
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from libs import get_log
+from libs.api.airflow.exeptions import DataSerializationError
+from libs.api.airflow.helpers import format_local_time, log_and_raise
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.session_serializer import load_session
+
+LOG = get_log(__name__)
+
+FAILED_STATUSES = ("FAILED", "ERROR")
+FINISHED_STATUSES = ("PASSED",) + FAILED_STATUSES  # прогоны, учитываемые в длительностях и флакинесс
+
+# Файл сессии воркера pytest-xdist (`get_worker_file_path()`): Ex: "test_results.gw0.json"
+_WORKER_FILE = re.compile(r"\.gw\d+\.jsonl?$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    start_timestamp REAL NOT NULL UNIQUE,
+    end_timestamp REAL,
+    duration REAL,
+    date TEXT NOT NULL,
+    tests INTEGER NOT NULL,
+    workers INTEGER NOT NULL,
+    utilization REAL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    module TEXT NOT NULL,
+    class_name TEXT,
+    test_name TEXT NOT NULL,
+    status TEXT,
+    start_timestamp REAL,
+    duration REAL NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tests_nodeid ON tests(nodeid, start_timestamp);
+CREATE INDEX IF NOT EXISTS tests_module ON tests(module);
+CREATE INDEX IF NOT EXISTS tests_date ON tests(date);
+"""
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Перцентиль с линейной интерполяцией между соседними значениями (как `numpy.percentile` по умолчанию)
+
+    :param values: Отсортированный по возрастанию непустой список
+    :param q: Перцентиль 0..100
+    :return: float
+    """
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class SessionHistory:
+    """
+    Историческая база таймингов тестов (SQLite) из файлов `save_session_data()`:
+        - `ingest()` загружает файл сессии (JSON или JSONL); повторная загрузка той же сессии пропускается
+        - Индексы по nodeid, модулю и дате (локальная дата старта теста)
+        - Запросы: перцентили длительностей, флакинесс, тренды по дням - входные данные для планирования
+          и таймаутов
+
+    Ex:
+        with SessionHistory("log/history.sqlite") as history:
+            history.ingest_dir("log")
+            p95 = history.duration_percentiles(module="tests_airflow_api")
+            flaky = history.flakiness(min_runs=10)
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SessionHistory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает соединение с базой"""
+        self._connection.close()
+
+    # region Загрузка
+
+    def ingest(self, file_path: str | Path) -> int:
+        """
+        Загружает файл сессии в базу
+
+        :param file_path: JSON/JSONL-файл `save_session_data()`
+        :return: int: Количество добавленных тестов (0 - сессия уже загружена или не завершена)
+        """
+        try:
+            data = load_session(file_path)
+        except (OSError, ValueError) as e:
+            log_and_raise(
+                error_type=DataSerializationError,
+                message="Ошибка чтения файла сессии",
+                from_exception=e,
+                filename=str(file_path),
+                logger_name=self.__class__.__name__,
+                log_level="error",
+            )
+        return self.ingest_session(data, source=str(file_path))
+
+    def ingest_session(self, data: SessionData, source: str = "") -> int:
+        """
+        Загружает данные сессии в базу (одна транзакция на сессию)
+
+        :param data: SessionData
+        :param source: Источник данных (путь к файлу)
+        :return: int: Количество добавленных тестов (0 - сессия уже загружена или не завершена)
+        """
+        session = data.session
+        if session.start_timestamp is None:
+            LOG.warning(f'Сессия без времени старта не загружена: {source}')
+            return 0
+
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO sessions "
+                "(source, start_timestamp, end_timestamp, duration, date, tests, workers, utilization) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, session.start_timestamp, session.end_timestamp, session.duration,
+                 format_local_time(session.start_timestamp, "%Y-%m-%d"), len(data.tests), len(data.workers),
+                 data.utilization if data.workers else None),
+            )
+            if not cursor.rowcount:
+                LOG.debug(f'Сессия уже загружена: {source}')
+                return 0
+            session_id = cursor.lastrowid
+            rows = [
+                (session_id, nodeid, test.module, test.class_name, test.test_name, test.status,
+                 test.timing.start_timestamp, test.timing.duration,
+                 format_local_time(test.timing.start_timestamp or session.start_timestamp, "%Y-%m-%d"))
+                for nodeid, test in data.tests.items()
+            ]
+            self._connection.executemany("INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        LOG.debug(f'Сессия загружена: {source} | Тестов: {len(rows)}')
+        return len(rows)
+
+    def ingest_dir(self, directory: str | Path, pattern: str = "test_results*.json*", workers: bool = False) -> int:
+        """
+        Загружает все файлы сессий каталога (уже загруженные сессии пропускаются)
+            - Файлы воркеров pytest-xdist (Ex: `test_results.gw0.json`) по умолчанию пропускаются:
+              их тесты уже входят в объединенный файл сессии контроллера
+
+        :param directory: Каталог с файлами сессий
+        :param pattern: glob-шаблон имени файла
+        :param workers: Загружать файлы воркеров (Ex: оставшиеся после аварийного завершения контроллера)
+        :return: int: Количество добавленных тестов
+        """
+        return sum(
+            self.ingest(file_path) for file_path in sorted(Path(directory).glob(pattern))
+            if workers or not _WORKER_FILE.search(file_path.name)
+        )
+
+    # endregion
+
+    # region Запросы
+
+    def _select(self, columns: str, nodeid: str | None, module: str | None, since: str | None,
+                statuses: Iterable[str] | None = FINISHED_STATUSES, tail: str = "") -> list[tuple]:
+        """Выборка из `tests` с общими фильтрами"""
+        conditions, params = [], []
+        for column, value in (("nodeid", nodeid), ("module", module)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            conditions.append("date >= ?")
+            params.append(since)
+        if statuses:
+            statuses = tuple(statuses)
+            conditions.append(f'status IN ({", ".join("?" * len(statuses))})')
+            params.extend(statuses)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ""
+        return self._connection.execute(f'SELECT {columns} FROM tests{where} {tail}', params).fetchall()
+
+    def duration_percentiles(
+            self,
+            nodeid: str | None = None,
+            module: str | None = None,
+            since: str | None = None,
+            percentiles: tuple[float, ...] = (50, 90, 95),
+    ) -> dict[str, dict[str, float]]:
+        """
+        Перцентили длительности завершенных прогонов (PASSED/FAILED/ERROR) по каждому тесту
+
+        :param nodeid: Фильтр по тесту
+        :param module: Фильтр по модулю (имя без .py)
+        :param since: Фильтр по дате "YYYY-MM-DD" (включительно)
+        :param percentiles: Перцентили 0..100
+        :return: {nodeid: {"runs": n, "p50": ..., "p90": ..., "max": ...}}
+        """
+        durations: dict[str, list[float]] = {}
+        for test_id, duration in self._select("nodeid, duration", nodeid, module, since,
+                                              tail="ORDER BY nodeid, duration"):
+            durations.setdefault(test_id, []).append(duration)
+
+        result = {}
+        for test_id, values in durations.items():
+            stats = {"runs": len(values)}
+            stats.update({f'p{q:g}': round(percentile(values, q), 3) for q in percentiles})
+            stats["max"] = values[-1]
+            result[test_id] = stats
+        return result
+
+    def flakiness(
+            self,
+            nodeid: str | None = None,
+            module: str | None = None,
+            since: str | None = None,
+            min_runs: int = 2,
+    ) -> dict[str, dict[str, float]]:
+        """
+        Флакинесс тестов по завершенным прогонам в хронологическом порядке:
+            - `failure_rate` - доля падений
+            - `flip_rate` - доля смен результата (PASSED <-> FAILED) между соседними прогонами:
+              0 - стабильно зеленый/красный, 1 - результат меняется каждый прогон
+
+        :param nodeid: Фильтр по тесту
+        :param module: Фильтр по модулю (имя без .py)
+        :param since: Фильтр по дате "YYYY-MM-DD" (включительно)
+        :param min_runs: Минимальное количество прогонов для оценки
+        :return: {nodeid: {"runs", "failures", "failure_rate", "flip_rate"}}, по убыванию `flip_rate`
+        """
+        outcomes: dict[str, list[bool]] = {}
+        for test_id, status in self._select("nodeid, status", nodeid, module, since,
+                                            tail="ORDER BY nodeid, start_timestamp"):
+            outcomes.setdefault(test_id, []).append(status in FAILED_STATUSES)
+
+        result = {}
+        for test_id, failed in outcomes.items():
+            if len(failed) < min_runs:
+                continue
+            flips = sum(previous != current for previous, current in zip(failed, failed[1:]))
+            result[test_id] = {
+                "runs": len(failed),
+                "failures": sum(failed),
+                "failure_rate": round(sum(failed) / len(failed), 3),
+                "flip_rate": round(flips / (len(failed) - 1), 3),
+            }
+        return dict(sorted(result.items(), key=lambda item: item[1]["flip_rate"], reverse=True))
+
+    def trend(
+            self,
+            nodeid: str | None = None,
+            module: str | None = None,
+            since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Тренд по дням: количество прогонов, средняя и максимальная длительность, доля падений
+
+        :param nodeid: Фильтр по тесту
+        :param module: Фильтр по модулю (имя без .py)
+        :param since: Фильтр по дате "YYYY-MM-DD" (включительно)
+        :return: [{"date", "runs", "avg_duration", "max_duration", "failure_rate"}] по возрастанию даты
+        """
+        failed = ", ".join(f"'{status}'" for status in FAILED_STATUSES)
+        rows = self._select(
+            f'date, COUNT(*), AVG(duration), MAX(duration), AVG(status IN ({failed}))',
+            nodeid, module, since, tail="GROUP BY date ORDER BY date",
+        )
+        return [
+            {
+                "date": date,
+                "runs": runs,
+                "avg_duration": round(avg_duration, 3),
+                "max_duration": max_duration,
+                "failure_rate": round(failure_rate, 3),
+            }
+            for date, runs, avg_duration, max_duration, failure_rate in rows
+        ]
+
+    # endregion
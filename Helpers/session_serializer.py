@@ -0,0 +1,196 @@
+"""session_serializer.py"""
+
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from libs import get_log
+from libs.api.airflow.session_data import LatencySketch, SessionData, SessionTiming, TestData, WorkerStats
+
+try:
+    import orjson  # опциональный быстрый JSON-бэкенд
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+LOG = get_log(__name__)
+
+
+# ---------------------------------- JSON -----------------------------------
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Сериализация в JSON (UTF-8 без экранирования не-ASCII символов)
+        - orjson (при наличии) или стандартный json
+
+    :param obj: JSON-сериализуемый объект
+    :param indent: Форматирование с отступом 2 пробела
+    :return: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Десериализация JSON: orjson (при наличии) или стандартный json"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# ---------------------------- SessionData → dict ----------------------------
+
+def timing_to_dict(timing: SessionTiming | Any) -> dict[str, Any]:
+    """Тайминги без `None`-значений (формат `convert_to_serializable`)"""
+    start_timestamp, end_timestamp = timing.start_timestamp, timing.end_timestamp
+    result: dict[str, Any] = {}
+    if start_timestamp is not None:
+        result["start_time"] = timing.start_time
+        result["start_timestamp"] = start_timestamp
+    if end_timestamp is not None:
+        result["end_time"] = timing.end_time
+        result["end_timestamp"] = end_timestamp
+    result["duration"] = timing.duration
+    return result
+
+
+def test_to_dict(test: TestData) -> dict[str, Any]:
+    """
+    Данные теста в JSON-представлении: прямой доступ к полям схемы `TestData` без обхода
+    `dataclasses.fields()` и проверок типов на каждом уровне
+    """
+    result: dict[str, Any] = {"module": test.module}
+    if test.class_name is not None:
+        result["class_name"] = test.class_name
+    result["test_name"] = test.test_name
+    result["timing"] = timing_to_dict(test.timing)
+    if test._status is not None:
+        result["_status"] = test._status
+    result["meta"] = test._meta or {}
+    result["steps"] = test._steps or []
+    result["tags"] = test._tags or []
+    return result
+
+
+def latencies_to_dict(latencies: dict[str, LatencySketch]) -> dict[str, dict[str, Any]]:
+    """Статистика длительностей запросов по эндпоинтам: {endpoint: `LatencySketch.to_dict()`}"""
+    return {endpoint: sketch.to_dict() for endpoint, sketch in latencies.items()}
+
+
+def latencies_from_dict(data: dict[str, Any] | None) -> dict[str, LatencySketch]:
+    """Восстановление статистики длительностей запросов (`latencies_to_dict()`)"""
+    return {endpoint: LatencySketch.from_dict(sketch) for endpoint, sketch in (data or {}).items()}
+
+
+def session_to_dict(data: SessionData) -> dict[str, Any]:
+    """Данные сессии целиком в JSON-представлении (формат `convert_to_serializable`)"""
+    result: dict[str, Any] = {"session": timing_to_dict(data.session)}
+    if data.debug is not None:
+        result["debug"] = data.debug
+    if data.pytest_debug is not None:
+        result["pytest_debug"] = data.pytest_debug
+    result["tests"] = {nodeid: test_to_dict(test) for nodeid, test in data.tests.items()}
+    if data.workers:
+        result["workers"] = {worker_id: stats.to_dict() for worker_id, stats in data.workers.items()}
+        result["utilization"] = data.utilization
+    if data.latencies:
+        result["latencies"] = latencies_to_dict(data.latencies)
+    if data.performance is not None:
+        result["performance"] = data.performance
+    return result
+
+
+# ---------------------------- dict → SessionData ----------------------------
+
+def session_from_dict(data: dict[str, Any]) -> SessionData:
+    """Восстановление `SessionData` из JSON-представления"""
+    session_data = SessionData(
+        session=SessionTiming.from_dict(data.get("session") or {}),
+        debug=data.get("debug"),
+        pytest_debug=data.get("pytest_debug", False),
+    )
+    session_data.tests = {nodeid: TestData.from_dict(test) for nodeid, test in (data.get("tests") or {}).items()}
+    session_data.workers = {
+        worker_id: WorkerStats.from_dict(stats) for worker_id, stats in (data.get("workers") or {}).items()
+    }
+    session_data.latencies = latencies_from_dict(data.get("latencies"))
+    session_data.performance = data.get("performance")
+    return session_data
+
+
+def session_from_records(records: Iterable[dict[str, Any]]) -> SessionData:
+    """
+    Восстановление `SessionData` из записей JSONL-файла потокового режима
+    (`session_start` → `test` ... → `session`, см. `SessionDataCollector.start_streaming()`)
+    """
+    session_data = SessionData()
+    for record in records:
+        kind = record.get("record")
+        if kind == "test":
+            session_data.tests[record["nodeid"]] = TestData.from_dict(record)
+        elif kind in ("session_start", "session"):
+            session_data.session = SessionTiming.from_dict(record.get("session") or {})
+            if kind == "session_start":
+                session_data.debug = record.get("debug")
+                session_data.pytest_debug = record.get("pytest_debug", False)
+            else:
+                session_data.latencies = latencies_from_dict(record.get("latencies"))
+                session_data.performance = record.get("performance")
+    return session_data
+
+
+# --------------------------------- Файлы -----------------------------------
+
+def dump_session(data: SessionData, file_path: str | Path, indent: bool = True) -> int:
+    """
+    Сохраняет данные сессии в JSON-файл
+
+    :param data: SessionData
+    :param file_path: Путь к файлу
+    :param indent: Форматирование с отступом (формат `test_results.json`)
+    :return: int: Размер файла в байтах
+    """
+    payload = dumps(session_to_dict(data), indent=indent)
+    Path(file_path).write_bytes(payload)
+    return len(payload)
+
+
+def load_session(file_path: str | Path) -> SessionData:
+    """
+    Загружает данные сессии из файла:
+        - `.json` - результат `save_session_data()`
+        - `.jsonl` - результат потокового режима (неполная последняя строка пропускается)
+
+    :param file_path: Путь к файлу
+    :return: SessionData
+    """
+    file_path = Path(file_path)
+    if file_path.suffix == ".jsonl":
+        return session_from_records(iter_jsonl(file_path))
+    return session_from_dict(loads(file_path.read_bytes()))
+
+
+def iter_jsonl(file_path: str | Path) -> Iterator[dict[str, Any]]:
+    """
+    Построчное чтение JSONL-файла без загрузки файла целиком
+        - Некорректная строка в конце файла (запись, прерванная аварийным завершением) пропускается
+
+    :param file_path: Путь к JSONL-файлу
+    :return: Итератор записей
+    """
+    with Path(file_path).open("rb") as file:
+        broken: tuple[int, ValueError] | None = None
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            if broken is not None:
+                raise broken[1]
+            try:
+                yield loads(line)
+            except ValueError as e:
+                broken = (line_number, e)
+        if broken is not None:
+            LOG.warning(f'Пропущена неполная запись в конце файла: "{file_path}" | Строка: {broken[0]}')
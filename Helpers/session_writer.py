@@ -0,0 +1,87 @@
+"""session_writer.py"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from libs.api.airflow.session_serializer import dumps
+
+
+class JsonlWriter:
+    """
+    Потоковая запись данных сессии в JSONL-файл (одна запись - одна строка):
+        - Запись выполняется через буфер файла (`buffer_size`) без накопления данных в памяти
+        - Буфер сбрасывается на диск (flush + fsync) каждые `fsync_every` записей или `fsync_interval` секунд:
+          при аварийном завершении процесса теряются только записи после последней синхронизации
+        - Частично записанная последняя строка пропускается при чтении (`session_serializer.iter_jsonl()`)
+
+    Ex:
+        with JsonlWriter("log/test_results.jsonl") as writer:
+            writer.write({"record": "test", "nodeid": "tests/test_api.py::test_dags", "_status": "PASSED"})
+    """
+
+    def __init__(
+            self,
+            file_path: str | Path,
+            buffer_size: int = 1 << 16,
+            fsync_every: int = 100,
+            fsync_interval: float = 5.0
+    ):
+        self.file_path = Path(file_path)
+        self.buffer_size = buffer_size
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.records: int = 0
+        self._file: BinaryIO | None = None
+        self._pending: int = 0  # записи после последней синхронизации
+        self._synced_at: float = 0.0
+
+    def __enter__(self) -> "JsonlWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Файл не открыт для записи"""
+        return self._file is None
+
+    def open(self) -> "JsonlWriter":
+        """Создает (перезаписывает) файл и открывает его для буферизованной записи"""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.file_path.open("wb", buffering=self.buffer_size)
+        self._synced_at = time.monotonic()
+        return self
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Добавляет запись в файл одной строкой JSON
+
+        :param record: JSON-сериализуемый словарь
+        """
+        self._file.write(dumps(record) + b"\n")
+        self.records += 1
+        self._pending += 1
+        if self._pending >= self.fsync_every or time.monotonic() - self._synced_at >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Сбрасывает буфер и синхронизирует файл с диском"""
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._synced_at = time.monotonic()
+
+    def close(self) -> None:
+        """Синхронизирует и закрывает файл"""
+        if self._file is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,398 @@
+"""swagger_payload.py"""
+
+import random
+import string
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from threading import Lock
+from typing import Any, Literal
+
+from libs.api.airflow.swagger_validator import SpecCache, get_spec_hash
+
+Text = Callable[[str, str], str]  # (имя схемы, имя свойства) -> строковое значение
+Mode = Literal["min", "max"]
+
+# Префиксы ссылок `$ref` на схемы: Swagger 2.0 (Petstore) и OpenAPI 3.x (Airflow)
+_REF_PREFIXES = ("#/definitions/", "#/components/schemas/")
+
+# Диапазоны integer по `format`; без `format` - int64
+_INT_BOUNDS = {"int32": (-2**31, 2**31 - 1), "int64": (-2**63, 2**63 - 1)}
+
+ARRAY_MAX_ITEMS = 3  # элементов массива в режиме "max", если `maxItems` не задан
+STRING_MAX_LENGTH = 255  # длина граничной строки, если `maxLength` не задан
+MAX_DEPTH = 8  # глубже объекты строятся в режиме "min" (защита от рекурсивных схем)
+
+_default_random = random.Random()
+
+
+@dataclass(slots=True)
+class _Context:
+    """Состояние построения payload: генератор случайных чисел, режим и текущая глубина"""
+    rng: random.Random
+    text: Text
+    full: bool
+    depth: int = 0
+
+
+Generator = Callable[[_Context], Any]
+
+
+def _ref_name(ref: str) -> str:
+    """Имя схемы из ссылки `$ref`"""
+    prefix = next((p for p in _REF_PREFIXES if ref.startswith(p)), None)
+    if prefix is None:
+        raise ValueError(f'Неподдерживаемый формат ссылки $ref: "{ref}"')
+    return ref[len(prefix):]
+
+
+def _schema_type(schema: dict) -> str | None:
+    return schema.get("type") or ("object" if "properties" in schema else None)
+
+
+def _int_range(schema: dict) -> tuple[int, int]:
+    """Граничные значения integer: `minimum`/`maximum` или диапазон `format`"""
+    low, high = _INT_BOUNDS.get(schema.get("format"), _INT_BOUNDS["int64"])
+    return schema.get("minimum", low), schema.get("maximum", high)
+
+
+class PayloadFactory:
+    """
+    Фабрика тестовых payload, скомпилированная из схем спецификации SWAGGER/OpenAPI:
+        - Источник схем: `definitions` (Swagger 2.0) или `components.schemas` (OpenAPI 3.x)
+        - Каждая схема компилируется один раз (при первом обращении) в дерево замыканий-генераторов,
+          построение payload не обращается к спецификации
+        - Режимы: "min" - только `required` свойства, массивы из `max(minItems, 1)` элементов;
+          "max" - все свойства, массивы до `maxItems` (`ARRAY_MAX_ITEMS`) элементов
+        - Граничные payload: payload "max", в котором одно свойство заменено граничным значением
+          (enum, min/max integer, пустая/длинная строка, пустой/полный массив)
+        - Строковые значения строит функция `text(schema, key)`: данные теста в стиле проекта (Ex: RandomData)
+        - Экземпляр кешируется по хешу спецификации в `get_payload_factory()`
+
+    Ex:
+        payloads = get_payload_factory(swagger.json())
+        pet = payloads.build("Pet", "min", rng=faker.rng)
+        load = payloads.build_many("Pet", 10_000)
+        for path, pet in payloads.boundary_payloads("Pet"): ...
+        variables = payloads.operation_enums("/pet", "POST")  # {"status": {"type": "string", "enum": [...]}}
+    """
+
+    def __init__(self, spec: dict, spec_hash: str | None = None):
+        self.spec_hash: str = spec_hash or get_spec_hash(spec)
+        self.schemas: dict[str, dict] = spec.get("definitions") or spec.get("components", {}).get("schemas", {})
+        self.paths: dict[str, dict] = spec.get("paths", {})
+        self._compiled: dict[str, Generator] = {}
+        self._pending: dict[str, Generator] = {}
+        self._boundaries: dict[str, list[tuple[str, Generator]]] = {}
+        self._enums: dict[tuple[str, str], dict[str, dict]] = {}
+        self._lock = Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.schemas
+
+    def __getitem__(self, name: str) -> Generator:
+        """Скомпилированный генератор схемы по имени"""
+        generator = self._compiled.get(name)
+        if generator is None:
+            if name not in self.schemas:
+                raise KeyError(f'Схема "{name}" отсутствует в спецификации | Доступные: {", ".join(self.schemas)}')
+            with self._lock:
+                generator = self._compile_ref(name)
+        return generator
+
+    # ---------------------------- Построение -----------------------------
+
+    def build(self, name: str, mode: Mode = "max", rng: random.Random | None = None, text: Text | None = None) -> Any:
+        """
+        Строит payload по схеме
+
+        :param name: Имя схемы (Ex: "Pet")
+        :param mode: "min" | "max"
+        :param rng: Генератор случайных чисел (Ex: `RandomData().rng` - воспроизводимые данные теста)
+        :param text: Построение строковых значений `text(schema, key)`, по умолчанию - случайное слово a-z
+        :return: payload
+        """
+        return self[name](self._context(mode, rng, text))
+
+    def build_many(
+            self,
+            name: str,
+            count: int,
+            mode: Mode = "max",
+            rng: random.Random | None = None,
+            text: Text | None = None,
+    ) -> list[Any]:
+        """
+        Строит `count` payload по схеме (нагрузочные прогоны): генератор и контекст создаются один раз
+
+        :param name: Имя схемы
+        :param count: Количество payload
+        :param mode: "min" | "max"
+        :param rng: Генератор случайных чисел
+        :param text: Построение строковых значений `text(schema, key)`
+        :return: list[payload]
+        """
+        generator, context = self[name], self._context(mode, rng, text)
+        return [generator(context) for _ in range(count)]
+
+    def boundary_payloads(
+            self,
+            name: str,
+            rng: random.Random | None = None,
+            text: Text | None = None,
+    ) -> list[tuple[str, dict]]:
+        """
+        Граничные payload: в payload "max" одно свойство заменено граничным значением
+
+        :param name: Имя схемы объекта
+        :param rng: Генератор случайных чисел
+        :param text: Построение строковых значений `text(schema, key)`
+        :return: [(путь к свойству в dotted.notation, payload), ...] Ex: ("category.id", {...})
+        """
+        generator, context = self[name], self._context("max", rng, text)
+        boundaries = self._boundaries.get(name)
+        if boundaries is None:
+            with self._lock:
+                boundaries = self._boundaries[name] = self._compile_boundaries(self.schemas[name], "", name, 0)
+
+        result = []
+        for path, value in boundaries:
+            payload = generator(context)
+            *parents, key = path.split(".")
+            target = payload
+            for parent in parents:
+                target = target.get(parent)
+                if not isinstance(target, dict):
+                    break
+            else:
+                target[key] = value(context)
+                result.append((path, payload))
+        return result
+
+    def operation_enums(self, path: str, method: str) -> dict[str, dict]:
+        """
+        Перечислимые параметры операции (варианты значений для параметризации тестов):
+            - параметры запроса с `enum` или массивы с `items.enum` (Ex: GET /pet/findByStatus: status),
+              в OpenAPI 3.x - в `schema` параметра
+            - свойства с `enum` схемы тела запроса: параметр `in: body` или `requestBody` (Ex: POST /pet: Pet.status)
+
+        :param path: Путь операции (Ex: "/pet")
+        :param method: HTTP-метод
+        :return: {имя: схема значения с `enum`}
+        """
+        key = (path, method.lower())
+        enums = self._enums.get(key)
+        if enums is not None:
+            return enums
+
+        enums = {}
+        operation = self.paths.get(path, {}).get(key[1], {})
+        bodies = [parameter["schema"] for parameter in operation.get("parameters", ()) if parameter.get("in") == "body"]
+        bodies += [
+            content["schema"] for content in operation.get("requestBody", {}).get("content", {}).values()
+            if "schema" in content
+        ]
+        for parameter in operation.get("parameters", ()):
+            if parameter.get("in") == "body":
+                continue
+            # OpenAPI 3.x: описание значения параметра - в `schema`
+            value = parameter.get("schema", parameter)
+            if "enum" in value:
+                enums[parameter["name"]] = value
+            elif "enum" in value.get("items", {}):
+                enums[parameter["name"]] = value["items"]
+        for body in bodies:
+            body = self.schemas.get(_ref_name(body["$ref"]), {}) if "$ref" in body else body
+            enums.update({
+                name: sub for name, sub in body.get("properties", {}).items() if "enum" in sub
+            })
+        self._enums[key] = enums
+        return enums
+
+    @staticmethod
+    def _context(mode: Mode, rng: random.Random | None, text: Text | None) -> _Context:
+        rng = rng or _default_random
+        if text is None:
+            def text(schema: str, key: str) -> str:
+                return "".join(rng.choices(string.ascii_lowercase, k=8))
+        return _Context(rng, text, mode == "max")
+
+    # ---------------------------- Компиляция -----------------------------
+
+    def _compile_ref(self, name: str) -> Generator:
+        """Компиляция именованной схемы с мемоизацией (с заглушкой для рекурсивных ссылок)"""
+        if name in self._compiled:
+            return self._compiled[name]
+        if name in self._pending:
+            return self._pending[name]
+        if name not in self.schemas:
+            raise KeyError(f'Ссылка на несуществующую схему: "{name}"')
+
+        resolved: list[Generator] = []
+        self._pending[name] = lambda context: resolved[0](context)
+        try:
+            generator = self._compile(self.schemas[name], name, "")
+        finally:
+            del self._pending[name]
+        resolved.append(generator)
+        self._compiled[name] = generator
+        return generator
+
+    def _compile(self, schema: dict, owner: str, key: str) -> Generator:
+        """
+        Компиляция схемы в функцию-генератор
+
+        :param schema: Схема значения
+        :param owner: Имя схемы, которой принадлежит свойство (для `text()`)
+        :param key: Имя свойства (для `text()`)
+        """
+        if "$ref" in schema:
+            return self._compile_ref(_ref_name(schema["$ref"]))
+        if "enum" in schema:
+            values = tuple(schema["enum"])
+            return lambda context: context.rng.choice(values)
+        if "allOf" in schema:
+            return self._compile_all_of(schema["allOf"], owner, key)
+        variants = schema.get("oneOf") or schema.get("anyOf")
+        if variants:
+            generators = tuple(self._compile(sub, owner, key) for sub in variants)
+            return lambda context: context.rng.choice(generators)(context)
+
+        schema_type = _schema_type(schema)
+        if schema_type == "object":
+            return self._compile_object(schema, owner)
+        if schema_type == "array":
+            return self._compile_array(schema, owner, key)
+        if schema_type == "string":
+            return self._compile_string(schema, owner, key)
+        if schema_type == "integer":
+            low, high = _int_range(schema)
+            low = max(low, min(1, high))  # положительные значения, если диапазон позволяет
+            return lambda context: context.rng.randint(low, high)
+        if schema_type == "number":
+            low, high = schema.get("minimum", 0.0), schema.get("maximum", 1e6)
+            return lambda context: round(context.rng.uniform(low, high), 2)
+        if schema_type == "boolean":
+            return lambda context: context.rng.random() < 0.5
+        return lambda context: None
+
+    def _compile_all_of(self, schemas: list[dict], owner: str, key: str) -> Generator:
+        generators = tuple(self._compile(sub, owner, key) for sub in schemas)
+
+        def generate(context: _Context) -> dict:
+            result = {}
+            for generator in generators:
+                value = generator(context)
+                if isinstance(value, dict):
+                    result.update(value)
+            return result
+
+        return generate
+
+    def _compile_object(self, schema: dict, owner: str) -> Generator:
+        required = set(schema.get("required", ()))
+        properties = tuple(
+            (key, self._compile(sub, owner, key), key in required) for key, sub in schema.get("properties", {}).items()
+        )
+
+        def generate(context: _Context) -> dict:
+            full = context.full and context.depth < MAX_DEPTH
+            context.depth += 1
+            result = {key: generator(context) for key, generator, is_required in properties if full or is_required}
+            context.depth -= 1
+            return result
+
+        return generate
+
+    def _compile_array(self, schema: dict, owner: str, key: str) -> Generator:
+        item = self._compile(schema.get("items", {}), owner, key)
+        low = schema.get("minItems", 0)
+        high = schema.get("maxItems", max(low, ARRAY_MAX_ITEMS))
+        least = min(max(low, 1), high)
+
+        def generate(context: _Context) -> list:
+            if context.depth >= MAX_DEPTH:
+                count = low
+            else:
+                count = context.rng.randint(least, high) if context.full else least
+            return [item(context) for _ in range(count)]
+
+        return generate
+
+    @staticmethod
+    def _compile_string(schema: dict, owner: str, key: str) -> Generator:
+        string_format = schema.get("format")
+        if string_format == "date-time":
+            return lambda context: datetime.now(timezone.utc).isoformat()
+        if string_format == "date":
+            return lambda context: date.today().isoformat()
+
+        min_length, max_length = schema.get("minLength", 0), schema.get("maxLength")
+
+        def generate(context: _Context) -> str:
+            value = context.text(owner, key)
+            if max_length is not None:
+                value = value[:max_length]
+            return value.ljust(min_length, "x") if len(value) < min_length else value
+
+        return generate
+
+    def _compile_boundaries(self, schema: dict, path: str, owner: str, depth: int) -> list[tuple[str, Generator]]:
+        """Граничные значения свойств схемы: [(путь в dotted.notation, генератор значения), ...]"""
+        if "$ref" in schema:
+            owner = _ref_name(schema["$ref"])
+            schema = self.schemas[owner]
+
+        def constant(value: Any) -> Generator:
+            return lambda context: value
+
+        key = path.rsplit(".", 1)[-1]
+        schema_type = _schema_type(schema)
+        if "enum" in schema:
+            return [(path, constant(value)) for value in schema["enum"]]
+        if "allOf" in schema:
+            return [
+                boundary
+                for sub in schema["allOf"]
+                for boundary in self._compile_boundaries(sub, path, owner, depth)
+            ]
+        if schema_type == "object":
+            if depth >= MAX_DEPTH:
+                return []
+            return [
+                boundary
+                for name, sub in schema.get("properties", {}).items()
+                for boundary in self._compile_boundaries(sub, f'{path}.{name}' if path else name, owner, depth + 1)
+            ]
+        if schema_type == "array":
+            item = self._compile(schema.get("items", {}), owner, key)
+            low = schema.get("minItems", 0)
+            high = schema.get("maxItems", max(low, ARRAY_MAX_ITEMS))
+            return [
+                (path, lambda context, count=count: [item(context) for _ in range(count)])
+                for count in dict.fromkeys((low, high))
+            ]
+        if schema_type == "integer":
+            return [(path, constant(value)) for value in dict.fromkeys(_int_range(schema))]
+        if schema_type == "number" and ("minimum" in schema or "maximum" in schema):
+            return [(path, constant(schema[bound])) for bound in ("minimum", "maximum") if bound in schema]
+        if schema_type == "string" and "format" not in schema:
+            lengths = (schema.get("minLength", 0), schema.get("maxLength", STRING_MAX_LENGTH))
+            return [(path, constant("x" * length)) for length in dict.fromkeys(lengths)]
+        if schema_type == "boolean":
+            return [(path, constant(True)), (path, constant(False))]
+        return []
+
+
+_cache: SpecCache[PayloadFactory] = SpecCache(PayloadFactory)
+
+
+def get_payload_factory(spec: dict) -> PayloadFactory:
+    """
+    Возвращает фабрику payload для спецификации, закешированную по хешу спецификации (`SpecCache`,
+    см. `swagger_validator.get_schema_validators()`)
+
+    :param spec: Спецификация SWAGGER/OpenAPI в виде словаря
+    :return: PayloadFactory
+    """
+    return _cache.get(spec)
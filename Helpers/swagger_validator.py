@@ -0,0 +1,335 @@
+"""swagger_validator.py"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from threading import Lock
+from typing import Any, Generic, TypeVar
+
+Validator = Callable[[Any], None]
+T = TypeVar("T")
+
+# Соответствие типов JSON Schema точным типам Python после `json.loads()` (bool не считается integer)
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+# Префиксы ссылок `$ref` на схемы: Swagger 2.0 (Petstore) и OpenAPI 3.x (Airflow)
+_REF_PREFIXES = ("#/definitions/", "#/components/schemas/")
+
+
+class SchemaMismatch(Exception):
+    """
+    Внутреннее исключение несоответствия значения схеме:
+        - Путь до ошибки накапливается при раскрутке стека (от листа к корню) без затрат на успешных проверках
+        - Преобразуется в AssertionError с путем в dotted.notation в `SchemaValidators.validate()`
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+        self.parts: list[str] = []
+
+    @property
+    def path(self) -> str:
+        """Путь до ошибки в dotted.notation: `dags.[3].dag_id`"""
+        return ".".join(reversed(self.parts)) or "<root>"
+
+
+def get_spec_hash(spec: dict) -> str:
+    """
+    Вычисляет хеш спецификации SWAGGER/OpenAPI (не зависит от порядка ключей)
+
+    :param spec: Спецификация в виде словаря
+    :return: str: sha256 hexdigest
+    """
+    dump = json.dumps(spec, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+class SchemaValidators:
+    """
+    Набор валидаторов, скомпилированных из схем спецификации SWAGGER/OpenAPI:
+        - Источник схем: `definitions` (Swagger 2.0) или `components.schemas` (OpenAPI 3.x)
+        - Каждая схема компилируется один раз (при первом обращении) в дерево замыканий:
+            - проверка ответа целиком стоит примерно как один обход JSON-объекта
+            - ссылки `$ref` разрешаются на этапе компиляции (поддерживаются рекурсивные схемы)
+        - Поддерживаются ключевые слова: type, nullable/x-nullable, enum, required, properties,
+          additionalProperties, items, allOf, oneOf/anyOf (с `discriminator`)
+        - Экземпляр кешируется по хешу спецификации в `get_schema_validators()`
+
+    Ex:
+        validators = get_schema_validators(client.get_swagger_spec())
+        validators.validate("DAGCollection", response.json())
+        validators["Pet"](pet_json)  # без преобразования ошибки в AssertionError (raises SchemaMismatch)
+    """
+
+    def __init__(self, spec: dict, spec_hash: str | None = None):
+        self.spec_hash: str = spec_hash or get_spec_hash(spec)
+        self.schemas: dict[str, dict] = spec.get("definitions") or spec.get("components", {}).get("schemas", {})
+        self._compiled: dict[str, Validator] = {}
+        self._pending: dict[str, Validator] = {}
+        self._lock = Lock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.schemas
+
+    def __getitem__(self, name: str) -> Validator:
+        """Скомпилированный валидатор схемы по имени"""
+        validator = self._compiled.get(name)
+        if validator is None:
+            with self._lock:
+                validator = self._compile_ref(name)
+        return validator
+
+    def validate(self, name: str, data: Any) -> Any:
+        """
+        Проверяет JSON-объект на соответствие схеме из спецификации
+
+        :param name: Имя схемы (Ex: "Pet", "DAGCollection")
+        :param data: JSON-объект
+        :return: data - JSON-объект без изменений для дальнейших проверок
+        :raises AssertionError: С путем до первого несоответствия в dotted.notation
+        """
+        if name not in self.schemas:
+            raise KeyError(f'Схема "{name}" отсутствует в спецификации | Доступные: {", ".join(self.schemas)}')
+        try:
+            self[name](data)
+        except SchemaMismatch as e:
+            raise AssertionError(f'Ошибка валидации по схеме "{name}" | Путь: "{e.path}" | {e.reason}') from None
+        return data
+
+    # ---------------------------- Компиляция -----------------------------
+
+    def _compile_ref(self, name: str) -> Validator:
+        """Компиляция именованной схемы с мемоизацией (с заглушкой для рекурсивных ссылок)"""
+        if name in self._compiled:
+            return self._compiled[name]
+        if name in self._pending:
+            return self._pending[name]
+        if name not in self.schemas:
+            raise KeyError(f'Ссылка на несуществующую схему: "{name}"')
+
+        # Заглушка доступна только внутри компиляции и не публикуется в `_compiled` до ее окончания
+        resolved: list[Validator] = []
+        self._pending[name] = lambda value: resolved[0](value)
+        try:
+            validator = self._compile(self.schemas[name])
+        finally:
+            del self._pending[name]
+        resolved.append(validator)
+        self._compiled[name] = validator
+        return validator
+
+    def _compile(self, schema: dict) -> Validator:
+        """Компиляция схемы в функцию-валидатор"""
+        if "$ref" in schema:
+            ref = schema["$ref"]
+            prefix = next((p for p in _REF_PREFIXES if ref.startswith(p)), None)
+            if prefix is None:
+                raise ValueError(f'Неподдерживаемый формат ссылки $ref: "{ref}"')
+            return self._compile_ref(ref[len(prefix):])
+
+        checks: list[Validator] = []
+        schema_type = schema.get("type")
+        nullable = schema.get("nullable") or schema.get("x-nullable")
+        if isinstance(schema_type, list):  # OpenAPI 3.1: `type: ["string", "null"]`
+            nullable = nullable or "null" in schema_type
+            schema_type = tuple(name for name in schema_type if name in _JSON_TYPES)
+
+        if schema_type and (isinstance(schema_type, tuple) or schema_type in _JSON_TYPES):
+            checks.append(self._compile_type(schema_type))
+        if "enum" in schema:
+            checks.append(self._compile_enum(schema["enum"]))
+        if "properties" in schema or "required" in schema or isinstance(schema.get("additionalProperties"), dict):
+            checks.append(self._compile_object(schema))
+        if "items" in schema:
+            checks.append(self._compile_array(schema["items"]))
+        for sub_schema in schema.get("allOf", ()):
+            checks.append(self._compile(sub_schema))
+        variants = schema.get("oneOf") or schema.get("anyOf")
+        if variants:
+            checks.append(self._compile_variants(variants, schema.get("discriminator")))
+
+        validator = self._chain(checks)
+        return self._nullable(validator) if nullable else validator
+
+    @staticmethod
+    def _chain(checks: list[Validator]) -> Validator:
+        """Объединение проверок одного уровня схемы в один валидатор"""
+        if not checks:
+            return lambda value: None
+        if len(checks) == 1:
+            return checks[0]
+        checks = tuple(checks)
+
+        def validate(value: Any) -> None:
+            for check in checks:
+                check(value)
+
+        return validate
+
+    @staticmethod
+    def _nullable(validator: Validator) -> Validator:
+        def validate(value: Any) -> None:
+            if value is not None:
+                validator(value)
+
+        return validate
+
+    @staticmethod
+    def _compile_type(schema_type: str | tuple[str, ...]) -> Validator:
+        names = (schema_type,) if isinstance(schema_type, str) else schema_type
+        allowed = tuple(python_type for name in names for python_type in _JSON_TYPES[name])
+        expected = " | ".join(names)
+
+        def validate(value: Any) -> None:
+            if type(value) not in allowed:
+                raise SchemaMismatch(
+                    f'Ожидаемый тип: {expected} | Фактический тип: {type(value).__name__} | '
+                    f'Значение: {str(value)[:100]}'
+                )
+
+        return validate
+
+    @staticmethod
+    def _compile_enum(enum: list) -> Validator:
+        allowed = frozenset(enum) if all(isinstance(item, (str, int, float, bool)) for item in enum) else tuple(enum)
+
+        def validate(value: Any) -> None:
+            if value is not None and value not in allowed:
+                raise SchemaMismatch(f'Значение "{value}" не входит в enum: {list(enum)}')
+
+        return validate
+
+    def _compile_object(self, schema: dict) -> Validator:
+        properties = tuple((key, self._compile(sub)) for key, sub in schema.get("properties", {}).items())
+        required = tuple(schema.get("required", ()))
+        additional = schema.get("additionalProperties")
+        additional = self._compile(additional) if isinstance(additional, dict) and additional else None
+        known = frozenset(key for key, _ in properties)
+
+        def validate(value: Any) -> None:
+            if type(value) is not dict:
+                return  # тип проверяется отдельно в `_compile_type`
+            for key in required:
+                if key not in value:
+                    raise SchemaMismatch(f'Отсутствует обязательный ключ "{key}"')
+            for key, check in properties:
+                if key in value:
+                    try:
+                        check(value[key])
+                    except SchemaMismatch as e:
+                        e.parts.append(key)
+                        raise
+            if additional is not None:
+                for key, item in value.items():
+                    if key not in known:
+                        try:
+                            additional(item)
+                        except SchemaMismatch as e:
+                            e.parts.append(key)
+                            raise
+
+        return validate
+
+    def _compile_array(self, items: dict) -> Validator:
+        check = self._compile(items)
+
+        def validate(value: Any) -> None:
+            if type(value) is not list:
+                return  # тип проверяется отдельно в `_compile_type`
+            idx = 0
+            try:
+                for idx, item in enumerate(value):
+                    check(item)
+            except SchemaMismatch as e:
+                e.parts.append(f'[{idx}]')
+                raise
+
+        return validate
+
+    def _compile_variants(self, variants: list[dict], discriminator: dict | None) -> Validator:
+        checks = tuple(self._compile(sub) for sub in variants)
+
+        # Быстрый путь: выбор схемы по значению поля-дискриминатора (OpenAPI 3.x)
+        by_discriminator: dict[str, Validator] = {}
+        property_name = (discriminator or {}).get("propertyName")
+        if property_name:
+            for sub, check in zip(variants, checks):
+                if "$ref" in sub:
+                    by_discriminator[sub["$ref"].rsplit("/", 1)[-1]] = check
+            for value, ref in (discriminator.get("mapping") or {}).items():
+                by_discriminator[value] = self._compile({"$ref": ref})
+
+        def validate(value: Any) -> None:
+            if by_discriminator and type(value) is dict and value.get(property_name) in by_discriminator:
+                by_discriminator[value[property_name]](value)
+                return
+            for check in checks:
+                try:
+                    check(value)
+                    return
+                except SchemaMismatch:
+                    continue
+            raise SchemaMismatch(f'Значение не соответствует ни одной из схем oneOf/anyOf: {str(value)[:100]}')
+
+        return validate
+
+
+class SpecCache(Generic[T]):
+    """
+    Кеш объектов, построенных по спецификации (валидаторы, фабрика payload):
+        - Объекты хранятся по хешу спецификации: равные по содержимому спецификации используют общий объект
+        - Без пересчета хеша возвращается только объект последней переданной спецификации: кеш хранит ссылку
+          на одну спецификацию и не растет, если каждый вызов передает новый словарь (Ex: `swagger.json()`)
+
+    Ex:
+        _validators = SpecCache(SchemaValidators)
+        validators = _validators.get(spec)
+    """
+
+    def __init__(self, build: Callable[[dict, str], T]):
+        self._build = build
+        self._by_hash: dict[str, T] = {}
+        self._last: tuple[dict, T] | None = None
+        self._lock = Lock()
+
+    def get(self, spec: dict) -> T:
+        """
+        Объект для спецификации: из кеша или построенный `build(spec, spec_hash)`
+
+        :param spec: Спецификация SWAGGER/OpenAPI в виде словаря
+        :return: T
+        """
+        last = self._last
+        if last is not None and last[0] is spec:
+            return last[1]
+
+        spec_hash = get_spec_hash(spec)
+        with self._lock:
+            value = self._by_hash.get(spec_hash)
+            if value is None:
+                value = self._by_hash[spec_hash] = self._build(spec, spec_hash)
+            self._last = (spec, value)
+        return value
+
+
+_cache: SpecCache[SchemaValidators] = SpecCache(SchemaValidators)
+
+
+def get_schema_validators(spec: dict) -> SchemaValidators:
+    """
+    Возвращает набор валидаторов для спецификации, закешированный по хешу спецификации (`SpecCache`):
+        - Повторная передача того же объекта спецификации (Ex: из `lru_cache`) не пересчитывает хеш
+        - Равные по содержимому спецификации (та же версия API) используют общий набор валидаторов
+
+    :param spec: Спецификация SWAGGER/OpenAPI в виде словаря
+    :return: SchemaValidators
+    """
+    return _cache.get(spec)
@@ -0,0 +1,148 @@
+"""test_scheduler.py"""
+
+import heapq
+import re
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from libs import get_log
+from libs.api.airflow.session_history import SessionHistory
+from libs.api.airflow.session_serializer import load_session
+
+LOG = get_log(__name__)
+
+_GROUP_SUFFIX = re.compile(r"@[^\[\]@:/]+$")  # суффикс `@group` в nodeid при `--dist loadgroup`
+
+DEFAULT_DURATION = 1.0  # оценка длительности теста без истории (с), если известных длительностей нет
+
+
+def strip_group_suffix(nodeid: str) -> str:
+    """Ex: "tests/test_api.py::test_dags@lpt_0" -> "tests/test_api.py::test_dags" """
+    return _GROUP_SUFFIX.sub("", nodeid)
+
+
+def get_schedule_unit(nodeid: str, scope: str = "class") -> str:
+    """
+    Единица планирования теста - тесты одной единицы выполняются подряд (общие фикстуры поднимаются один раз)
+
+    :param nodeid: pytest nodeid
+    :param scope: "test" | "class" | "module"
+    :return: Ex: scope="class": "tests/test_api.py::TestDags"; функция вне класса - отдельная единица
+    """
+    nodeid = strip_group_suffix(nodeid)
+    if scope == "module":
+        return nodeid.split("::", 1)[0]
+    if scope == "class":
+        parts = nodeid.split("::")
+        if len(parts) > 2:
+            return "::".join(parts[:2])
+    return nodeid
+
+
+def load_durations(
+        history_db: str | Path | None = None,
+        session_file: str | Path | None = None,
+        percentile: float = 50,
+) -> dict[str, float]:
+    """
+    Длительности тестов для планирования:
+        - Из базы истории (`SessionHistory`): перцентиль длительности по всем прогонам
+        - Иначе из файла последней сессии (`save_session_data()`)
+
+    :param history_db: Путь к SQLite-базе истории
+    :param session_file: Путь к JSON/JSONL-файлу сессии
+    :param percentile: Перцентиль длительности из истории 0..100
+    :return: {nodeid: длительность (с)} (nodeid без суффикса `@group`)
+    """
+    if history_db and Path(history_db).exists():
+        with SessionHistory(history_db) as history:
+            stats = history.duration_percentiles(percentiles=(percentile,))
+        return {strip_group_suffix(nodeid): values[f'p{percentile:g}'] for nodeid, values in stats.items()}
+
+    if session_file and Path(session_file).exists():
+        try:
+            data = load_session(session_file)
+        except (OSError, ValueError) as e:
+            LOG.warning(f'Длительности тестов не загружены: {session_file} | Ошибка: {e}')
+            return {}
+        return {
+            strip_group_suffix(nodeid): test.timing.duration
+            for nodeid, test in data.tests.items()
+            if test.timing.end_timestamp is not None
+        }
+    return {}
+
+
+@dataclass(slots=True)
+class SchedulePlan:
+    """
+    План распределения тестов:
+        - `order` - порядок выполнения: единицы по убыванию длительности (LPT), внутри единицы - порядок сбора
+        - `bins` - единицы, распределенные по воркерам (LPT): каждая корзина выполняется одним воркером
+          (`xdist_group` при `--dist loadgroup`; какой воркер получит корзину, определяет xdist)
+        - `fixed` - единицы с собственной группой `xdist_group` (не распределяются)
+    """
+    order: list[str] = field(default_factory=list)
+    units: dict[str, list[str]] = field(default_factory=dict)
+    unit_durations: dict[str, float] = field(default_factory=dict)
+    bins: list[list[str]] = field(default_factory=list)
+    bin_loads: list[float] = field(default_factory=list)
+    fixed: list[str] = field(default_factory=list)
+
+    @property
+    def makespan(self) -> float:
+        """Оценка длительности сессии: максимальная загрузка воркера (с)"""
+        return max(self.bin_loads, default=0.0)
+
+
+def plan_lpt(
+        nodeids: list[str],
+        durations: dict[str, float],
+        workers: int,
+        scope: str = "class",
+        groups: dict[str, str] | None = None,
+) -> SchedulePlan:
+    """
+    Планирование тестов по правилу LPT (Longest Processing Time first):
+        - Тесты объединяются в единицы (`get_schedule_unit()`), длительность единицы - сумма оценок ее тестов
+        - Тесты без истории получают медиану известных длительностей
+        - Единицы по убыванию длительности назначаются воркеру с минимальной текущей загрузкой
+        - Результат детерминирован (одинаков во всех воркерах xdist при одинаковых входных данных)
+
+    :param nodeids: nodeid тестов в порядке сбора
+    :param durations: {nodeid: длительность (с)}
+    :param workers: Количество воркеров
+    :param scope: Единица планирования: "test" | "class" | "module"
+    :param groups: {nodeid: имя группы} - тесты с собственной `xdist_group` (единица = группа, без распределения)
+    :return: SchedulePlan
+    """
+    groups = groups or {}
+    known = [duration for duration in durations.values() if duration > 0]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+
+    plan = SchedulePlan()
+    for nodeid in nodeids:
+        group = groups.get(nodeid)
+        unit = f'@{group}' if group else get_schedule_unit(nodeid, scope)
+        plan.units.setdefault(unit, []).append(nodeid)
+        plan.unit_durations[unit] = plan.unit_durations.get(unit, 0.0) + durations.get(
+            strip_group_suffix(nodeid), default)
+
+    ranked = sorted(plan.units, key=lambda unit: (-plan.unit_durations[unit], unit))
+    plan.order = [nodeid for unit in ranked for nodeid in plan.units[unit]]
+
+    workers = max(workers, 1)
+    plan.bins = [[] for _ in range(workers)]
+    plan.bin_loads = [0.0] * workers
+    heap = [(0.0, index) for index in range(workers)]
+    for unit in ranked:
+        if unit.startswith("@"):
+            plan.fixed.append(unit)
+            continue
+        load, index = heapq.heappop(heap)
+        plan.bins[index].append(unit)
+        load += plan.unit_durations[unit]
+        plan.bin_loads[index] = round(load, 3)
+        heapq.heappush(heap, (load, index))
+    return plan
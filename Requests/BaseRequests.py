@@ -6,6 +6,7 @@ import requests
 from helpers.data_collector import DataCollector
 from helpers.report import allure_attach_response
 from requests import JSONDecodeError, Response
+from Utils.logging import StructLog
 
 
 class BaseRequests:
@@ -18,6 +19,7 @@ class BaseRequests:
         self.cookies: dict = {}
         self.data_collector = DataCollector()
         self.log = logging.getLogger('requests')
+        self.slog = StructLog(self.log)
 
     def update_headers(self, headers: dict):
         """update_headers"""
@@ -63,11 +65,12 @@ class BaseRequests:
             verify=False,
             allow_redirects=False,
         )
-        self.log.debug(response.text)
+        # Тело ответа декодируется в текст только при эмитировании DEBUG-записи
+        self.slog.debug("Response", text=lambda: response.text)
         try:
-            if response.text:
+            if response.content:
                 data = DataCollector(response.json())
-                self.log.debug(data)
+                self.slog.debug("DataCollector", data=data)
         except JSONDecodeError:
             pass
         return response
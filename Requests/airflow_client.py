@@ -12,8 +12,10 @@ from simple_settings import settings as cfg
 from urllib3 import Retry
 
 from libs import get_log
+from libs.logging import StructLog
 
 LOG = get_log(__name__)
+SLOG = StructLog(LOG)
 
 
 def with_validation(expected_status=200, validate_json=True):
@@ -70,18 +72,14 @@ class AirflowApiClient:
     ) -> Response:
         """Базовый запрос с логированием"""
         url = urljoin(self.base_url, endpoint.lstrip("/"))
-
-        log_info = {
-            "method": method,
-            "url": url,
-        }
-        if params is not None:
-            log_info["params"] = params
-        if json is not None:
-            log_info["json"] = json
-        if data is not None:
-            log_info["data"] = "<binary data>" if isinstance(data, (bytes, bytearray)) else data
-        LOG.debug(f'Send Request | {log_info}')
+        SLOG.debug(
+            "Send Request",
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            data=lambda: "<binary data>" if isinstance(data, (bytes, bytearray)) else data,
+        )
 
         start_time = time.monotonic()
         response = self.session.request(
@@ -95,7 +93,7 @@ class AirflowApiClient:
         )
         duration = time.monotonic() - start_time
 
-        LOG.debug(f'Response Status: HTTP{response.status_code} | Duration: {duration:.2f}s')
+        SLOG.debug("Response", status=response.status_code, duration=lambda: f'{duration:.2f}s')
         return response
 
     def close(self) -> None:
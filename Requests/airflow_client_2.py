@@ -1,5 +1,6 @@
 """airflow_api_client"""
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from functools import lru_cache
 from os import linesep
@@ -11,14 +12,22 @@ from requests import HTTPError, JSONDecodeError, Response
 from simple_settings import settings as cfg
 
 from libs import get_log
+from libs.api.airflow.swagger_validator import SchemaValidators, get_schema_validators
+from libs.logging import StructLog
 
 LOG = get_log(__name__)
+SLOG = StructLog(LOG)
 
 
 class AirflowApiClient:
     """airflow_api_client"""
 
-    def __init__(self):
+    def __init__(self, latency_hook: Callable[[str, float], None] | None = None):
+        """
+        :param latency_hook: Обработчик длительности запросов `hook(endpoint, seconds)`
+            Ex: AirflowApiClient(latency_hook=SessionDataCollector().record_latency)
+        """
+        self.latency_hook = latency_hook
         self.base_url = cfg.AIRFLOW_BASE_URL.rstrip("/") + "/"
         self.session = requests.Session()
         self.session.auth = cfg.AIRFLOW_AUTH_CREDENTIALS
@@ -34,28 +43,32 @@ class AirflowApiClient:
             self,
             method: str,
             endpoint: str,
+            operation: str,
             params: dict[str, Any] | None = None,
             json: dict | list | None = None,
+            stream: bool = False,
     ) -> Response:
-        """Базовый запрос с логированием"""
-        url = urljoin(self.base_url, endpoint.lstrip("/"))
+        """
+        Базовый запрос с логированием
+            - Длительность запроса (до получения заголовков ответа) передается в `latency_hook`
+              по эндпоинту "<HTTP-метод> <operation>": Ex: "GET get_dag_by_id"
 
-        log_info = {
-            "method": method,
-            "url": url,
-        }
-        if params is not None:
-            log_info["params"] = params
-        if json is not None:
-            log_info["json"] = json
-        LOG.debug(f'Send Request | {log_info} ')
+        :param operation: Имя операции - шаблон эндпоинта без значений параметров пути (dag_id, run_id)
+        :param stream: Не загружать тело ответа сразу (для `Checker.validate_response_stream()`)
+        """
+        url = urljoin(self.base_url, endpoint.lstrip("/"))
+        SLOG.debug("Send Request", method=method, url=url, params=params, json=json)
 
-        return self.session.request(
+        response = self.session.request(
             method=method,
             url=url,
             params=params,
             json=json,
+            stream=stream,
         )
+        if self.latency_hook is not None:
+            self.latency_hook(f'{method} {operation}', response.elapsed.total_seconds())
+        return response
 
     def close(self) -> None:
         """Закрытие сессии (очистка соединений)"""
@@ -116,12 +129,24 @@ class AirflowApiClient:
         :return: Полная схема OpenAPI
         :raises Exception: Пробрасывает исключения из `retrieve_response_json()`
         """
-        response = self._request("GET", "openapi.json")
+        response = self._request("GET", "openapi.json", "get_swagger_spec")
         return self.retrieve_response_json(response)
 
+    def get_schema_validators(self) -> SchemaValidators:
+        """
+        Получение валидаторов ответов, скомпилированных из `components.schemas` SWAGGER схемы
+        - Компиляция выполняется один раз на версию SWAGGER схемы (кеш по хешу схемы)
+
+        Ex:
+            client.get_schema_validators().validate("DAGCollection", client.get_dags_list())
+
+        :return: SchemaValidators
+        """
+        return get_schema_validators(self.get_swagger_spec())
+
     # ------------------------- Методы примитивы API --------------------------
 
-    def get_dags_list(self) -> dict:
+    def get_dags_list(self, stream: bool = False) -> dict | Response:
         """
         Получение списка DAGs: GET /dags
 
@@ -133,15 +158,19 @@ class AirflowApiClient:
             https://airflow-forge.apps.qa.kryptodev.ru/api/v1/dags \
             -H 'Content-Type: application/json'
 
-        :return: dict - JSON-объект из Response
+            response = client.get_dags_list(stream=True)
+            Checker.validate_response_stream(response, required_keys="dags.[*].dag_id")
+
+        :param stream: Вернуть Response без загрузки тела (для `Checker.validate_response_stream()`)
+        :return: dict - JSON-объект из Response (или Response при `stream=True`)
         """
         # Arrange
         endpoint = "dags"
         # Act
         LOG.info(f'Получение списка DAGs | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_dags_list", stream=stream)
         # Check
-        return self.retrieve_response_json(response)
+        return response if stream else self.retrieve_response_json(response)
 
     def get_dag_by_id(self, dag_id: str) -> dict:
         """
@@ -162,7 +191,7 @@ class AirflowApiClient:
         endpoint = f'dags/{dag_id}'
         # Act
         LOG.info(f'Получение данных о DAG по ID | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_dag_by_id")
         # Check
         return self.retrieve_response_json(response)
 
@@ -193,7 +222,7 @@ class AirflowApiClient:
         prefix = "Остановка" if is_paused else "Запуск"
         # Act
         LOG.info(f'{prefix} DAG по ID | endpoint: {endpoint}')
-        response = self._request("PATCH", endpoint, params=params, json=payload)
+        response = self._request("PATCH", endpoint, "dag_control", params=params, json=payload)
         # Check
         return self.retrieve_response_json(response)
 
@@ -224,7 +253,7 @@ class AirflowApiClient:
         }
         # Act
         LOG.info(f'Запуск DAG Run для DAG ID с DAG RunID: "{run_id}" | endpoint: {endpoint}')
-        response = self._request("POST", endpoint, json=payload)
+        response = self._request("POST", endpoint, "trigger_dag_run", json=payload)
         # Check
         return self.retrieve_response_json(response)
 
@@ -243,7 +272,7 @@ class AirflowApiClient:
         endpoint = f'dags/{dag_id}/dagRuns/{run_id}'
         # Act
         LOG.debug(f'Проверка состояния DAG Run для DAG ID по DAG RunID | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_dag_run_state")
         # Check
         return self.retrieve_response_json(response)["state"]
 
@@ -263,7 +292,7 @@ class AirflowApiClient:
         endpoint = f'dags/{dag_id}/dagRuns/{run_id}'
         # Act
         LOG.info(f'Удаление DAG Run для DAG ID по DAG RunID | endpoint: {endpoint} ')
-        response = self._request("DELETE", endpoint)
+        response = self._request("DELETE", endpoint, "delete_dag_run")
         # Check
         return True if not self.retrieve_response_json(response) else False
 
@@ -284,13 +313,13 @@ class AirflowApiClient:
         endpoint = f"dags/{dag_id}/tasks"
         # Act
         LOG.debug(f'Получение списка задач для DAG по DAG ID | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_dag_tasks")
         # Check
         response_data = self.retrieve_response_json(response)
         # Извлекаем только task_id из каждой задачи
         return [task["task_id"] for task in response_data.get("tasks", [])]
 
-    def get_dag_run_tasks(self, dag_id: str, run_id: str) -> list[dict]:
+    def get_dag_run_tasks(self, dag_id: str, run_id: str, stream: bool = False) -> list[dict] | Response:
         """
         Получение списка задач DAG Run: GET /dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances
          - Для конкретного DAG Run
@@ -300,15 +329,17 @@ class AirflowApiClient:
 
         :param dag_id: Имя DAG
         :param run_id: Идентификатор запуска DAG Run
-        :return: list - JSON-объект из Response
+        :param stream: Вернуть Response без загрузки тела (для `Checker.validate_response_stream()`,
+            пути от корня ответа: Ex: "task_instances.[*].state")
+        :return: list - JSON-объект из Response (или Response при `stream=True`)
         """
         # Arrange
         endpoint = f'dags/{dag_id}/dagRuns/{run_id}/taskInstances'
         # Act
         LOG.info(f'Получение списка задач DAG Run для DAG ID по DAG RunID | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_dag_run_tasks", stream=stream)
         # Check
-        return self.retrieve_response_json(response).get("task_instances", [])
+        return response if stream else self.retrieve_response_json(response).get("task_instances", [])
 
     def get_task_instance(self, dag_id: str, run_id: str, task_id: str) -> dict:
         """
@@ -326,7 +357,7 @@ class AirflowApiClient:
         endpoint = f"dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}"
         # Act
         LOG.debug(f'Получение состояния задачи "{task_id}" в DAG Run для DAG ID | endpoint: {endpoint}')
-        response = self._request("GET", endpoint)
+        response = self._request("GET", endpoint, "get_task_instance")
         # Check
         return self.retrieve_response_json(response)
 
@@ -348,6 +379,6 @@ class AirflowApiClient:
         payload = {"new_state": state}
         # Act
         LOG.info(f'Изменение состояния задачи "{task_id}" на {state} в DAG Run для DAG ID | endpoint: {endpoint}')
-        response = self._request("PATCH", endpoint, json=payload)
+        response = self._request("PATCH", endpoint, "set_task_instance_state", json=payload)
         # Check
         return self.retrieve_response_json(response)
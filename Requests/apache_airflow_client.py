@@ -15,8 +15,8 @@ from airflow_client.client.model.task_instance_reference import TaskInstanceRefe
 from airflow_client.client.model.update_task_instance import UpdateTaskInstance
 
 from libs.api.airflow.api_config import AirflowConfig
-from libs.api.airflow.decorators import handle_api_errors, log_method_args
-from libs.api.airflow.helpers import get_method_name, log_and_raise, make_text_ansi_name, process_kwargs_timeout
+from libs.api.airflow.decorators import handle_api_errors, inject_request_timeout, log_method_args
+from libs.api.airflow.helpers import log_and_raise, make_text_ansi_name
 from libs.api.airflow.rest_client import CustomRESTClient
 from libs.logging import get_log
 
@@ -105,6 +105,7 @@ class AirflowAPIClient(ApiClient):
     # ------------------------- DAG Methods -------------------------
     @log_method_args()
     @handle_api_errors
+    @inject_request_timeout
     def get_dags(
             self,
             limit: int | None = 1000,
@@ -121,14 +122,13 @@ class AirflowAPIClient(ApiClient):
         :param kwargs: Словарь с дополнительными параметрами (см. Документацию базового метода)
         :return: Словарь с информацией о DAGs
         """
-        kwargs = process_kwargs_timeout(getattr(self, get_method_name(self)), locals())
-
-        response = self.dag_api.get_dags(**kwargs)
+        response = self.dag_api.get_dags(limit=limit, offset=offset, order_by=order_by, **kwargs)
 
         return response.to_dict()
 
     @log_method_args()
     @handle_api_errors
+    @inject_request_timeout
     def get_dag_by_id(
             self,
             dag_id: str,
@@ -141,14 +141,13 @@ class AirflowAPIClient(ApiClient):
         :param kwargs: Словарь с дополнительными параметрами (см. Документацию базового метода)
         :return: Словарь с информацией о DAG
         """
-        kwargs = process_kwargs_timeout(getattr(self, get_method_name(self)), locals())
-
-        response = self.dag_api.get_dag(**kwargs)
+        response = self.dag_api.get_dag(dag_id=dag_id, **kwargs)
 
         return response.to_dict()
 
     @log_method_args()
     @handle_api_errors
+    @inject_request_timeout
     def patch_dag(
             self,
             dag_id: str,
@@ -167,18 +166,14 @@ class AirflowAPIClient(ApiClient):
         dag = DAG(is_paused=is_paused)
         update_mask = ["is_paused"]
 
-        kwargs = process_kwargs_timeout(getattr(self, get_method_name(self)), locals())
-
-        # Извлекаем избыточные для целевого метода аргументы
-        kwargs.pop("is_paused")
-
-        response = self.dag_api.patch_dag(**kwargs)
+        response = self.dag_api.patch_dag(dag_id=dag_id, dag=dag, update_mask=update_mask, **kwargs)
 
         return response.to_dict()
 
     # -------------------------- DAG Runs ---------------------------
     @log_method_args()
     @handle_api_errors
+    @inject_request_timeout
     def get_dag_runs(
             self,
             dag_id: str,
@@ -205,9 +200,9 @@ class AirflowAPIClient(ApiClient):
                 log_level="error",
             )
 
-        kwargs = process_kwargs_timeout(getattr(self, get_method_name(self)), locals())
-
-        response = self.dag_run_api.get_dag_runs(**kwargs)
+        response = self.dag_run_api.get_dag_runs(
+            dag_id=dag_id, limit=limit, offset=offset, order_by=order_by, **kwargs
+        )
 
         return response.to_dict()
 
@@ -9,8 +9,10 @@ from libs import get_log
 from libs.api.airflow.api_config import AirflowConfig
 from libs.api.airflow.decorators import handle_api_errors
 from libs.api.airflow.helpers import make_text_ansi_name
+from libs.logging import StructLog
 
 LOG = get_log(__name__)
+SLOG = StructLog(LOG)
 
 
 class CustomRESTClient(RESTClientObject):
@@ -44,11 +46,13 @@ class CustomRESTClient(RESTClientObject):
         merged_headers = {**self.configuration.default_headers, **(headers or {})}
         kwargs["_request_timeout"] = kwargs.pop("_request_timeout", None) or self._request_timeout
 
-        LOG.debug(
-            f'Timeouts|Retries - Default: {self._request_timeout}; Used: {kwargs["_request_timeout"]}; '
-            f'(retries): {self.configuration.retries}'
+        SLOG.debug(
+            "Timeouts|Retries",
+            default=self._request_timeout,
+            used=kwargs["_request_timeout"],
+            retries=self.configuration.retries,
         )
-        LOG.debug(f'Отправляемые заголовки: {merged_headers}')
+        SLOG.debug("Отправляемые заголовки", headers=merged_headers)
 
         return super().request(method, url, headers=merged_headers, **kwargs)
 
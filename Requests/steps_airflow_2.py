@@ -8,9 +8,12 @@ from os import linesep
 from requests import HTTPError
 
 from libs import get_log
+from libs.api.airflow.checker import Checker
 from libs.api.airflow.client import AirflowApiClient
+from libs.logging import SampledLog
 
 LOG = get_log(__name__)
+POLL_LOG = SampledLog(LOG)  # повторы состояния в циклах ожидания сворачиваются, смена состояния выводится сразу
 
 
 class StepsAirflow(ABC):
@@ -52,17 +55,24 @@ class StepsAirflow(ABC):
         LOG.info(f'Ожидание завершения выполнения {context}')
 
         timeout = timeout if timeout else self.wait_timeout
+        poll_key = f'task:{self.dag_id}:{run_id}:{task_id}'
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
-            state = self.client.get_task_instance(self.dag_id, run_id, task_id)["state"]
-            state = state.upper() if state else "N/A"
-            LOG.info(f'Текущее состояние Task: "{state}" | Время ожидания: {elapsed:.0f} s | {context}')
+        try:
+            while time.time() - start_time < timeout:
+                elapsed = time.time() - start_time
+                state = self.client.get_task_instance(self.dag_id, run_id, task_id)["state"]
+                state = state.upper() if state else "N/A"
+                POLL_LOG.info(
+                    poll_key, state, f'Текущее состояние Task: "{state}" | Время ожидания: {elapsed:.0f} s | {context}'
+                )
 
-            if state == "SUCCESS":
-                LOG.debug(f'Выполнение Task успешно завершено за {elapsed:.1f} s | {context}')
-                return state
-            time.sleep(self.check_interval)
+                if state == "SUCCESS":
+                    POLL_LOG.flush(poll_key)
+                    LOG.debug(f'Выполнение Task успешно завершено за {elapsed:.1f} s | {context}')
+                    return state
+                time.sleep(self.check_interval)
+        finally:
+            POLL_LOG.flush(poll_key)
 
         LOG.debug(
             f'Текущее состояние Task: "{state}" | '
@@ -147,25 +157,34 @@ class StepsAirflow(ABC):
         LOG.info(f'Ожидание завершения выполнения {context}')
 
         timeout = timeout if timeout else self.wait_timeout
+        poll_key = f'dag_run:{self.dag_id}:{run_id}'
         start_time = time.time()
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
-            state = self.client.get_dag_run_state(self.dag_id, run_id)
-            state = state.upper() if state else "N/A"
-            LOG.info(f'Текущее состояние DAG Run: "{state}" | Время ожидания: {elapsed:.0f} s | {context}')
-
-            if state == "SUCCESS":
-                LOG.debug(f'Выполнение DAG Run успешно завершено за {elapsed:.1f} s | {context}')
-                return
-            elif state in {None, "FAILED", "UPSTREAM_FAILED"}:
-                tasks = self.client.get_dag_run_tasks(self.dag_id, run_id)
-                failed_tasks = [task for task in tasks if task["state"] in {None, "FAILED".lower()}]
-                raise RuntimeError(
-                    f'{context}завершился с ошибкой. Состояние выполнения: "{state}"{linesep}'
-                    f'Проваленные задачи: {failed_tasks}'
+        try:
+            while time.time() - start_time < timeout:
+                elapsed = time.time() - start_time
+                state = self.client.get_dag_run_state(self.dag_id, run_id)
+                state = state.upper() if state else "N/A"
+                POLL_LOG.info(
+                    poll_key, state,
+                    f'Текущее состояние DAG Run: "{state}" | Время ожидания: {elapsed:.0f} s | {context}'
                 )
 
-            time.sleep(self.check_interval)
+                if state == "SUCCESS":
+                    POLL_LOG.flush(poll_key)
+                    LOG.debug(f'Выполнение DAG Run успешно завершено за {elapsed:.1f} s | {context}')
+                    return
+                elif state in {None, "FAILED", "UPSTREAM_FAILED"}:
+                    POLL_LOG.flush(poll_key)
+                    tasks = self.client.get_dag_run_tasks(self.dag_id, run_id)
+                    failed_tasks = Checker.get_value(tasks, "[?state=failed|null]")
+                    raise RuntimeError(
+                        f'{context}завершился с ошибкой. Состояние выполнения: "{state}"{linesep}'
+                        f'Проваленные задачи: {failed_tasks}'
+                    )
+
+                time.sleep(self.check_interval)
+        finally:
+            POLL_LOG.flush(poll_key)
 
         raise TimeoutError(f'{context}не завершился за отведенное время: {timeout} секунд')
 
@@ -0,0 +1,118 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional
+
+from Config import ID_BLOCK_SIZE, ID_STATE_PATH
+
+try:
+    import fcntl  # POSIX
+except ImportError:
+    fcntl = None
+    import msvcrt  # Windows
+
+
+@contextmanager
+def locked_file(file_path: str) -> Iterator[int]:
+    """
+    Эксклюзивная блокировка файла между процессами (flock / msvcrt.locking), файл создается при отсутствии
+    :param file_path: путь к файлу
+    :return: файловый дескриптор, открытый на чтение и запись
+    """
+    fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield fd
+    finally:
+        if fcntl is None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)  # flock снимается при закрытии дескриптора
+
+
+class IdAllocator:
+    """
+    Распределитель уникальных ID тестовых сущностей для параллельных воркеров (xdist) и сессий на одном хосте
+     - процесс резервирует блок из `block_size` ID под файловой блокировкой общего счетчика `state_path`,
+       ID внутри блока выдаются без блокировок и обращения к файлу: O(1) на ID
+     - счетчик не опускается ниже `time.time() * 10**6`: ID 16-значные и возрастают между сессиями,
+       в том числе после удаления файла счетчика или на другом хосте, запущенном в другую секунду
+     - выданные ID сохраняются в `issued` и дописываются в журнал `journal_path` - очистка в teardown удаляет
+       только сущности своего процесса, журнал позволяет дочистить сущности аварийно прерванной сессии
+
+    Ex:
+        allocator = IdAllocator(journal_path='.log/test_ids_gw0.txt')
+        test_ids = allocator.take(5)
+        for test_id in allocator.issued: ...
+    """
+
+    def __init__(
+        self,
+        state_path: str = ID_STATE_PATH,
+        block_size: int = ID_BLOCK_SIZE,
+        journal_path: Optional[str] = None,
+    ):
+        self.state_path = state_path
+        self.block_size = max(block_size, 1)
+        self.journal_path = journal_path
+        self.issued: list[int] = []
+        self._next = self._end = 0  # текущий блок [_next, _end)
+        self._lock = threading.Lock()
+        self._journal: Optional[IO[str]] = None
+
+    def _reserve(self, count: int) -> None:
+        """
+        Резервирует блок не меньше `count` ID в общем счетчике
+        :param count: минимальный размер блока
+        """
+        os.makedirs(os.path.dirname(self.state_path) or os.curdir, exist_ok=True)
+        size = max(self.block_size, count)
+        with locked_file(self.state_path) as fd:
+            stored = os.read(fd, 64).strip()
+            start = max(int(stored) if stored else 0, int(time.time() * 10**6))
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(start + size).encode())
+        self._next, self._end = start, start + size
+
+    def take(self, count: int = 1) -> list[int]:
+        """
+        Выдает `count` уникальных ID
+        :param count: количество ID
+        :return: list[int]: ID по возрастанию
+        """
+        with self._lock:
+            if self._end - self._next < count:
+                self._reserve(count)
+            ids = list(range(self._next, self._next + count))
+            self._next += count
+            self.issued.extend(ids)
+            self._record(ids)
+        return ids
+
+    def next(self) -> int:
+        """
+        Выдает один уникальный ID
+        :return: int
+        """
+        return self.take(1)[0]
+
+    def _record(self, ids: list[int]) -> None:
+        """Дописывает выданные ID в журнал (по строке на ID)"""
+        if self.journal_path is None:
+            return
+        if self._journal is None:
+            os.makedirs(os.path.dirname(self.journal_path) or os.curdir, exist_ok=True)
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._journal.write(''.join(f'{_}\n' for _ in ids))
+        self._journal.flush()
+
+    def close(self) -> None:
+        """Закрывает журнал выданных ID"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
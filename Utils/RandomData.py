@@ -1,12 +1,14 @@
 import random
 import string
+from collections import deque
 from datetime import datetime
-from typing import Literal, Optional
-from uuid import uuid4
+from typing import Any, Callable, Hashable, Literal, Optional
+from uuid import UUID
 
 from allure_commons.utils import now
 from faker import Faker
 
+from Config import RANDOM_POOL_SIZE, RANDOM_SEED
 from Utils.Singleton import Singleton
 
 Locale = Literal['en', 'ru']
@@ -15,15 +17,72 @@ Locale = Literal['en', 'ru']
 class RandomData(metaclass=Singleton):
     """
     Провайдер случайных данных
+     - слова, целые числа и uuid выдаются из пулов, заполняемых пакетами: один вызов Faker на пакет
+       вместо вызова на каждое значение; размер пакета удваивается от 8 до `pool_size` значений,
+       поэтому seed теста не тратит время на заполнение пулов, которые тесту не нужны
+     - все значения строятся от собственного генератора экземпляра: при одинаковом seed
+       последовательность значений повторяется (см. `seed()`, `seed_test()`)
     """
 
-    def __init__(self):
+    def __init__(self, pool_size: int = RANDOM_POOL_SIZE):
         self.__faker_ru = Faker('ru_RU')
         self.__faker_en = Faker('en')
+        self.__fakers = {'ru': self.__faker_ru, 'en': self.__faker_en}
+        self.pool_size = max(pool_size, 1)
+        self.base_seed = RANDOM_SEED or str(random.SystemRandom().getrandbits(32))
+        self._random = random.Random()
+        self._pools: dict[Hashable, deque] = {}
+        self._batches: dict[Hashable, int] = {}
+        self.seed(self.base_seed)
 
     def __getattr__(self, item):
         return getattr(self.__faker, item)
 
+    @property
+    def rng(self) -> random.Random:
+        """
+        Генератор случайных чисел экземпляра: значения от него воспроизводимы при одинаковом seed теста
+        :return: random.Random
+        """
+        return self._random
+
+    def seed(self, value: Any) -> None:
+        """
+        Переинициализирует генераторы (собственный и Faker) и очищает пулы
+        :param value: seed: int | str
+        """
+        self._random.seed(value)
+        for faker in self.__fakers.values():
+            faker.seed_instance(value)
+        self._pools.clear()
+        self._batches.clear()
+
+    def seed_test(self, nodeid: str) -> None:
+        """
+        Seed теста: базовый seed сессии (env.RANDOM_SEED) + nodeid
+         - данные теста не зависят от порядка запуска и распределения тестов между воркерами xdist
+        :param nodeid: pytest nodeid теста
+        """
+        self.seed(f'{self.base_seed}:{nodeid}')
+
+    def _take(self, key: Hashable, count: int, generate: Callable[[int], list]) -> list:
+        """
+        Выдает `count` значений из пула `key`, при нехватке пул пополняется пакетом `generate(size)`
+         - пакеты пула растут вдвое до `pool_size`
+        :param key: ключ пула
+        :param count: количество значений
+        :param generate: генератор пакета значений
+        :return: list
+        """
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = deque()
+        if len(pool) < count:
+            size = self._batches.get(key, min(8, self.pool_size))
+            pool.extend(generate(max(size, count - len(pool))))
+            self._batches[key] = min(size * 2, self.pool_size)
+        return [pool.popleft() for _ in range(count)]
+
     def words(
         self,
         lang: Locale = 'ru',
@@ -41,50 +100,48 @@ class RandomData(metaclass=Singleton):
         :param prefix: str: префикс, добавляемый к результату (в начало фразы)
         :return: str: случайная фраза
         """
-        if lang == 'ru':
-            rand = ' '.join([_.capitalize() if capitalize else _ for _ in self.__faker_ru.words(nb=nb)])
-        elif lang == 'en':
-            rand = ' '.join([_.capitalize() if capitalize else _ for _ in self.__faker_en.words(nb=nb)])
-        else:
+        faker = self.__fakers.get(lang)
+        if faker is None:
             raise NotImplementedError(f"запрашиваемый язык: `{lang}` для генерации случайных фраз не реализован")
 
+        words = self._take(('words', lang), nb, lambda size: faker.words(nb=size))
+        rand = ' '.join([_.capitalize() if capitalize else _ for _ in words])
         rand = f'{prefix} {rand}' if prefix else rand
-        rand += f' {str(uuid4())}' if uuid else ''
+        rand += f' {self.uuid()}' if uuid else ''
         return rand
 
-    @staticmethod
-    def texts(length_word: int = 10, count_words: int = 1, prefix: Optional[str] = None) -> str:
+    def texts(self, length_word: int = 10, count_words: int = 1, prefix: Optional[str] = None) -> str:
         """
-        Статический метод генерации случайного текста
+        Генератор случайного текста
         :param length_word: int: количество символов в слове
         :param count_words: int: количество слов
         :param prefix: str: префикс, добавляемый к результату (в начало фразы)
         :return: str: случайный текст из ascii символов
         """
-        result_str = ''
-        for i in range(count_words):
-            letters = string.ascii_letters
-            result_str += ''.join(random.choice(letters) for i in range(length_word))
-            if i + 1 < count_words:
-                result_str += ' '
+        choices = self._random.choices
+        result_str = ' '.join(''.join(choices(string.ascii_letters, k=length_word)) for _ in range(count_words))
         return f'{prefix} {result_str}' if prefix else result_str
 
-    @staticmethod
-    def ints(length: int = 16) -> int:
+    def ints(self, length: int = 16) -> int:
         """
-        Статический метод генерации случайного целого числа c заданной разрядностью
+        Генератор случайного целого числа c заданной разрядностью
         :param length: int: количество цифр в числе (разрядность)
         :return: int: случайное число заданной разрядности
         """
-        return random.randint(10 ** (length - 1), 10**length - 1)
+        population = range(10 ** (length - 1), 10**length)
+        return self._take(('ints', length), 1, lambda size: self._random.choices(population, k=size))[0]
 
-    @staticmethod
-    def uuid() -> str:
+    def uuid(self) -> str:
         """
-        Статический метод генерации уникального ID
+        Генератор уникального ID
         :return: UUID: str: уникальный ID версии uuid4
         """
-        return str(uuid4())
+
+        def generate(size: int) -> list[str]:
+            getrandbits = self._random.getrandbits
+            return [str(UUID(int=getrandbits(128), version=4)) for _ in range(size)]
+
+        return self._take('uuid', 1, generate)[0]
 
     @staticmethod
     def timestamp() -> str:
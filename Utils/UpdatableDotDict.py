@@ -1,6 +1,6 @@
 """UpdatableDotDict"""
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime
 from threading import Lock
 from typing import Any, TypeAlias
@@ -36,6 +36,8 @@ class UpdatableSingleton(type):
             Экземпляр создается только один раз, последующие вызовы обновляют текущий инстанс
         - static: - Singleton c базовым функционалом создания общего на все вызовы класса
             Экземпляр создается только один раз, последующие вызовы игнорируют аргументы инита
+    - Повторный вызов без блокировки: static-синглтон или updatable-синглтон без аргументов обновления
+      возвращается сразу (блокировка только при создании экземпляра и при обновлении)
 
     Ex: Класс-синглтон, наследующий DotDict:
 
@@ -51,10 +53,14 @@ class UpdatableSingleton(type):
     _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
-        with cls._lock:
-            # Режим работы синглтона (по умолчанию updatable)
-            mode = getattr(cls, "_singleton_mode", "updatable")
+        # Режим работы синглтона (по умолчанию updatable)
+        mode = getattr(cls, "_singleton_mode", "updatable")
+        # Быстрый путь без блокировки (double-checked locking): экземпляр уже создан и обновлять нечего
+        instance = cls._instances.get(cls)
+        if instance is not None and (mode != "updatable" or not (args or kwargs)):
+            return instance
 
+        with cls._lock:
             if cls not in cls._instances:
                 # Создаем новый экземпляр
                 instance = super().__call__(*args, **kwargs)
@@ -221,6 +227,200 @@ class DotDict(dict):
         return {key: convert(value) for key, value in self.items()}
 
 
+class LazyDotDict(dict):
+    """
+    Словарь с `dotted` доступом и ленивой конвертацией вложенных структур (вариант DotDict для больших данных):
+        - Конструктор копирует только верхний уровень: вложенные dict/list не конвертируются
+        - Вложенный dict/list оборачивается (`LazyDotDict`/`LazyList`) при первом обращении,
+          обертка кешируется на месте исходного значения: повторное обращение без конвертации
+        - Быстрое чтение атрибута: `__slots__ = ()` (нет `__dict__` экземпляра) и прямой `dict.__getitem__`
+        - Исходные данные не изменяются (кешируются обертки в копии верхнего уровня)
+        Ex:
+        response = LazyDotDict(dag_api.get_dag_runs(dag_id).to_dict())
+        state = response.dag_runs[0].state  # обернуты только `dag_runs` и `dag_runs[0]`
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        """Получение значения по ключу как атрибута (вызывается только если обычный атрибут не найден)"""
+        try:
+            value = dict.__getitem__(self, name)
+        except KeyError:
+            if name.startswith("_"):
+                # Служебные атрибуты (`__deepcopy__`, `_ipython_...`) запрашиваются через getattr/hasattr
+                raise AttributeError(name) from None
+            log_and_raise(
+                AttributeError,
+                f'"{self.__class__.__name__}" не содержит атрибута "{name}"',
+                available_attrs=list(self.keys()),
+                logger_name=self.__class__.__name__,
+                log_level="error",
+            )
+        if type(value) is dict or type(value) is list:
+            value = _lazy_wrap(value)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Установка значения по ключу как атрибута"""
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        """Удаление ключа как атрибута"""
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: str) -> Any:
+        """Получение значения по ключу: вложенный dict/list оборачивается при первом обращении"""
+        value = dict.__getitem__(self, key)
+        if type(value) is dict or type(value) is list:
+            value = _lazy_wrap(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Получение значения по ключу или `default`"""
+        return self[key] if key in self else default
+
+    def values(self) -> list[Any]:
+        """Значения (вложенные dict/list обернуты)"""
+        return [self[key] for key in self]
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Пары ключ-значение (вложенные dict/list обернуты)"""
+        return [(key, self[key]) for key in self]
+
+    def __repr__(self) -> str:
+        """Строковое представление объекта. Отображает имя класса и содержимое словаря"""
+        return f'{self.__class__.__name__}({dict.__repr__(self)})'
+
+    def to_dict(self) -> dict[str, RecursiveType]:
+        """Конвертация обратно в обычный dict (обернутые и необернутые вложенные структуры)"""
+        return _lazy_unwrap(self)
+
+
+class LazyList(list):
+    """Список для `LazyDotDict`: вложенные dict/list оборачиваются при первом обращении к элементу"""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return LazyList(list.__getitem__(self, index))
+        value = list.__getitem__(self, index)
+        if type(value) is dict or type(value) is list:
+            value = _lazy_wrap(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _lazy_wrap(value: dict | list) -> LazyDotDict | LazyList:
+    """Обертка вложенного dict/list (копия верхнего уровня)"""
+    return LazyDotDict(value) if type(value) is dict else LazyList(value)
+
+
+def _lazy_unwrap(value: Any) -> RecursiveType:
+    """Конвертер LazyDotDict/LazyList --> dict/list"""
+    if isinstance(value, dict):
+        return {key: _lazy_unwrap(item) for key, item in dict.items(value)}
+    if isinstance(value, list):
+        return [_lazy_unwrap(item) for item in list.__iter__(value)]
+    return value
+
+
+class FrozenDotDict(dict):
+    """
+    Неизменяемый словарь с `dotted` доступом (снимок конфигурации `Config.snapshot`):
+        - Вложенные dict конвертируются в FrozenDotDict, list/tuple - в tuple (глубокая заморозка)
+        - Любое изменение (`__setitem__`, `update()`, `pop()`, ...) вызывает TypeError
+        - Безопасен для чтения из любых потоков без блокировок: объект не изменяется после создания
+    """
+
+    __slots__ = ()
+
+    def __init__(self, data: Mapping | None = None, **kwargs: Any):
+        super().__init__()
+        for source in (data or {}, kwargs):
+            for key, value in source.items():
+                dict.__setitem__(self, key, _freeze(value))
+
+    def __getattr__(self, name: str) -> Any:
+        """Получение значения по ключу как атрибута"""
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            if name.startswith("_"):
+                raise AttributeError(name) from None
+            log_and_raise(
+                AttributeError,
+                f'"{self.__class__.__name__}" не содержит атрибута "{name}"',
+                available_attrs=list(self.keys()),
+                logger_name=self.__class__.__name__,
+                log_level="error",
+            )
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        """Запрет изменения снимка"""
+        log_and_raise(
+            TypeError,
+            f'"{self.__class__.__name__}" доступен только для чтения',
+            logger_name=self.__class__.__name__,
+            log_level="error",
+        )
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __repr__(self) -> str:
+        """Строковое представление объекта. Отображает имя класса и содержимое словаря"""
+        return f'{self.__class__.__name__}({dict.__repr__(self)})'
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def to_dict(self) -> dict[str, RecursiveType]:
+        """Конвертация в изменяемый dict (tuple вложенных коллекций -> list)"""
+        return _thaw(self)
+
+
+def _freeze(value: Any) -> Any:
+    """Глубокая заморозка: Mapping -> FrozenDotDict, list/tuple -> tuple"""
+    if isinstance(value, FrozenDotDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDotDict(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> RecursiveType:
+    """Конвертер FrozenDotDict/tuple --> dict/list"""
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _deep_merge(source: dict, overrides: Mapping) -> dict:
+    """Глубокое слияние `overrides` в `source` (вложенные Mapping из `overrides` копируются)"""
+    for key, value in overrides.items():
+        if isinstance(value, Mapping):
+            target = source.get(key)
+            source[key] = _deep_merge(target if isinstance(target, dict) else {}, value)
+        else:
+            source[key] = value
+    return source
+
+
 class Config(DotDict, metaclass=UpdatableSingleton):
     """
     Ключевые особенности:
@@ -236,8 +436,33 @@ class Config(DotDict, metaclass=UpdatableSingleton):
         - Уведомление внешних компонентов об изменениях
     - Потокобезопасность
         - Использование блокировки для корректной работы в многопоточной среде
+        - Снимки copy-on-write (`snapshot`): неизменяемый FrozenDotDict, заменяемый атомарно после обновления.
+          Читатели снимка не блокируются и не видят частично примененное обновление
+
+    - Вложенные dict конвертируются в базовый DotDict (`_inherited=True`): создание вложенного Config
+      через метакласс повторно захватывало бы блокировку синглтона, удерживаемую при создании и обновлении
+
+        Ex:
+        timeout = Config().snapshot.rest_config.timeout  # чтение без блокировки
     """
 
+    def __init__(self, data: DotDictType = None, _inherited: bool = True, **kwargs: Any):
+        super().__init__(data, _inherited=_inherited, **kwargs)
+
+    @property
+    def snapshot(self) -> FrozenDotDict:
+        """Неизменяемый снимок конфигурации (последнее примененное обновление)"""
+        snapshot = self.__dict__.get("_snapshot")
+        if snapshot is None:
+            snapshot = FrozenDotDict(self.to_dict())
+            self._snapshot = snapshot
+        return snapshot
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Установка значения по ключу: снимок пересоздается при следующем обращении к `snapshot`"""
+        super().__setitem__(key, value)
+        self.__dict__.pop("_snapshot", None)
+
     def _perform_update(self, *args, **kwargs):
         """
         Расширенный метод обновления с дополнительной функциональностью:
@@ -245,39 +470,41 @@ class Config(DotDict, metaclass=UpdatableSingleton):
         - Валидацией значений
         - Механизмом оповещения
         - Поддержкой сложных структур данных
+        Обновление выполняется над копией (copy-on-write): при ошибке валидации конфигурация не изменяется,
+        новый снимок публикуется одной операцией присваивания после применения
         """
-
-        # 1. Слияние вложенных словарей (deep merge)
-        def deep_update(source, overrides):
-            for key, value in overrides.items():
-                if isinstance(value, Mapping) and key in source:
-                    deep_update(source[key], value)
-                else:
-                    source[key] = self._convert(value)
-            return source
+        # 1. Слияние в копию текущих данных (deep merge)
+        merged = self.to_dict()
 
         # 2. Обработка разных типов данных
         for arg in args:
             if isinstance(arg, Mapping):
-                deep_update(self, arg)
+                _deep_merge(merged, arg)
             elif isinstance(arg, Iterable):
                 for k, v in arg:
-                    self[k] = self._convert(v)
+                    merged[k] = v
             else:
                 raise TypeError("Неподдерживаемый тип данных для обновления")
 
         # 3. Обработка ключевых аргументов
-        deep_update(self, kwargs)
+        _deep_merge(merged, kwargs)
+
+        # 4. Валидация нового снимка до применения
+        snapshot = FrozenDotDict(merged)
+        self._validate(snapshot)
 
-        # 4. Валидация данных после обновления
-        self._validate()
+        # 5. Применение и атомарная замена снимка
+        for key, value in merged.items():
+            dict.__setitem__(self, key, self._convert(value))
+        self._snapshot = snapshot
 
-        # 5. Уведомление подписчиков
+        # 6. Уведомление подписчиков
         self._notify_observers()
 
-    def _validate(self):
+    def _validate(self, data: Mapping | None = None):
         """Пример валидации конфигурации"""
-        if 'timeout' in self and not (0 < self.timeout < 100):
+        data = self if data is None else data
+        if 'timeout' in data and not (0 < data['timeout'] < 100):
             raise ValueError("Некорректное значение timeout")
 
     def _notify_observers(self):
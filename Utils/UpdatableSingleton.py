@@ -18,6 +18,8 @@ class UpdatableSingleton(type):
             Экземпляр создается только один раз, последующие вызовы обновляют текущий инстанс
         - static: - Singleton c базовым функционалом создания общего на все вызовы класса
             Экземпляр создается только один раз, последующие вызовы игнорируют аргументы инита
+    - Повторный вызов без блокировки: static-синглтон или updatable-синглтон без аргументов обновления
+      возвращается сразу (блокировка только при создании экземпляра и при обновлении)
 
     Ex: Класс-синглтон, наследующий DotDict:
 
@@ -33,10 +35,14 @@ class UpdatableSingleton(type):
     _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
-        with cls._lock:
-            # Режим работы синглтона (по умолчанию updatable)
-            mode = getattr(cls, "_singleton_mode", "updatable")
+        # Режим работы синглтона (по умолчанию updatable)
+        mode = getattr(cls, "_singleton_mode", "updatable")
+        # Быстрый путь без блокировки (double-checked locking): экземпляр уже создан и обновлять нечего
+        instance = cls._instances.get(cls)
+        if instance is not None and (mode != "updatable" or not (args or kwargs)):
+            return instance
 
+        with cls._lock:
             if cls not in cls._instances:
                 # Создаем новый экземпляр
                 instance = super().__call__(*args, **kwargs)
@@ -79,6 +85,10 @@ def convert_to_serializable(obj: Any) -> Any:
     if isinstance(obj, (list, tuple, set, frozenset)):
         return [convert_to_serializable(item) for item in obj]
 
+    # Объекты с собственным представлением для экспорта (Ex: TestData, TestTiming)
+    if callable(getattr(obj, "to_dict", None)):
+        return convert_to_serializable(obj.to_dict())
+
     # Датаклассы
     if is_dataclass_instance(obj):
         return {
@@ -4,14 +4,15 @@ import inspect
 import json
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar
+from logging import DEBUG, Logger
+from typing import Any, ParamSpec, TypeVar
 
 from airflow_client.client import ApiException
 from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
 
 from libs import get_log
 from libs.api.airflow.exeptions import ServiceUnavailableError
-from libs.api.airflow.helpers import get_error_source, handle_api_exception, log_and_raise, make_text_ansi_name
+from libs.api.airflow.helpers import handle_api_exception, log_and_raise, make_text_ansi_name
 
 # Обобщённая типизации
 T = TypeVar("T")
@@ -20,6 +21,136 @@ P = ParamSpec("P")
 LOG = get_log(__name__)
 
 
+class CallPlan:
+    """
+    План вызова метода клиента: строится один раз при декорировании вместо интроспекции на каждом вызове
+        - Сигнатура метода: имена позиционных параметров, значения по умолчанию, имена `*args`/`**kwargs`
+        - Имя метода и логгер `<Class>.<method>` (кеш по классу экземпляра)
+        - Связывание аргументов вызова без `inspect.Signature.bind()` (формат `BoundArguments.arguments`
+          после `apply_defaults()`)
+        - Общий для всех декораторов метода: `get_call_plan()` кеширует план по исходной функции (`__wrapped__`)
+    """
+
+    __slots__ = ("name", "parameters", "named", "positional", "defaults", "var_positional", "var_keyword", "_loggers")
+
+    def __init__(self, func: Callable):
+        self.name: str = func.__name__
+        self.parameters: tuple[str, ...] = ()
+        self.named: frozenset[str] = frozenset()  # параметры без `*args`/`**kwargs`
+        self.positional: tuple[str, ...] = ()  # параметры, принимающие позиционные аргументы (включая self)
+        self.defaults: dict[str, Any] = {}
+        self.var_positional: str | None = None
+        self.var_keyword: str | None = None
+        self._loggers: dict[type, tuple[str, Logger]] = {}
+
+        parameters, positional = [], []
+        for parameter in inspect.signature(func).parameters.values():
+            parameters.append(parameter.name)
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                self.var_positional = parameter.name
+                continue
+            if parameter.kind is parameter.VAR_KEYWORD:
+                self.var_keyword = parameter.name
+                continue
+            if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD):
+                positional.append(parameter.name)
+            if parameter.default is not parameter.empty:
+                self.defaults[parameter.name] = parameter.default
+        self.parameters, self.positional = tuple(parameters), tuple(positional)
+        self.named = frozenset(parameters) - {self.var_positional, self.var_keyword}
+
+    def method(self, instance: object) -> tuple[str, Logger]:
+        """
+        Имя метода и логгер экземпляра
+
+        :param instance: Экземпляр класса (self)
+        :return: ("<Class>.<method>", Logger)
+        """
+        cls = type(instance)
+        cached = self._loggers.get(cls)
+        if cached is None:
+            method = f'{cls.__name__}.{self.name}'
+            cached = self._loggers[cls] = (method, get_log(method))
+        return cached
+
+    def bind(self, args: tuple, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """
+        Связывание аргументов вызова с параметрами метода (значения по умолчанию подставляются)
+
+        :param args: Позиционные аргументы (включая self)
+        :param kwargs: Именованные аргументы
+        :return: {параметр: значение} в порядке сигнатуры; `*args` - tuple, `**kwargs` - dict
+        """
+        values = dict(zip(self.positional, args))
+        extra = {}
+        for key, value in kwargs.items():
+            if key in self.named:
+                values[key] = value
+            else:
+                extra[key] = value
+        if self.var_positional is not None:
+            values[self.var_positional] = tuple(args[len(self.positional):])
+        if self.var_keyword is not None:
+            values[self.var_keyword] = extra
+        arguments = {}
+        for name in self.parameters:
+            if name in values:
+                arguments[name] = values[name]
+            elif name in self.defaults:
+                arguments[name] = self.defaults[name]
+        return arguments
+
+
+_CALL_PLANS: dict[Callable, CallPlan] = {}
+
+
+def get_call_plan(func: Callable) -> CallPlan:
+    """
+    План вызова исходной (недекорированной) функции метода (кеш)
+
+    :param func: Функция метода или обертка с `__wrapped__`
+    :return: CallPlan
+    """
+    func = inspect.unwrap(func)
+    plan = _CALL_PLANS.get(func)
+    if plan is None:
+        plan = _CALL_PLANS[func] = CallPlan(func)
+    return plan
+
+
+def inject_request_timeout(func: Callable[P, T]) -> Callable[P, T]:
+    """
+    @Decorator: подставляет `_request_timeout` экземпляра в `**kwargs` метода, если он не задан при вызове
+        - Наличие `**kwargs` у метода проверяется один раз при декорировании
+        - Таймаут экземпляра: `self._request_timeout` или `self.request_timeout`
+        - При уровне DEBUG логгера метода логирует параметры запроса плоским словарем (аргументы и `**kwargs`)
+    ВАЖНО: Применяется к методу последним (ближайшим к `def`)
+
+    :param func: Метод клиента API с `**kwargs`
+    :return: Обернутая функция
+    """
+    plan = get_call_plan(func)
+    if plan.var_keyword is None:
+        raise TypeError(f'Метод "{func.__qualname__}" должен принимать **kwargs для подстановки "_request_timeout"')
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if "_request_timeout" not in kwargs:
+            timeout = getattr(self, "_request_timeout", None) or getattr(self, "request_timeout", None)
+            kwargs["_request_timeout"] = timeout
+        _, logger = plan.method(self)
+        if logger.isEnabledFor(DEBUG):
+            arguments = plan.bind((self, *args), kwargs)
+            del arguments[plan.positional[0]]
+            # Плоский словарь: аргументы метода и вложенный `**kwargs`
+            nested_kwargs = arguments.pop(plan.var_keyword)
+            params = {**arguments, **nested_kwargs}
+            logger.debug(f'Параметры запроса в API: {{"kwargs": {params}}}')
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 def log_method_args(
         exclude_keys: list | None = None
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
@@ -38,36 +169,26 @@ def log_method_args(
     :param exclude_keys: Список маскируемых параметров
     """
 
+    exclude = frozenset(exclude_keys or ())
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # План вызова (сигнатура, имя метода) строится один раз при декорировании
+        plan = get_call_plan(func)
+
         @wraps(func)
         def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> T:
             # Проверяем флаг debug из экземпляра класса
             if not getattr(self, "debug", False):
                 return func(self, *args, **kwargs)
 
-            # Получаем информацию о сигнатуре метода
-            sig = inspect.signature(func)
-
-            # Полное связывание аргументов с обработкой исключений
-            try:
-                # Связываем аргументы с учетом self
-                bound_args = sig.bind(self, *args, **kwargs)
-            except TypeError:
-                # Для методов с **kwargs используем частичное связывание
-                bound_args = sig.bind_partial(self, *args, **kwargs)
-
-            bound_args.apply_defaults()
-
             # Маскирование конфиденциальных данных в выводе логгера
-            exclude = exclude_keys or []
             filtered_args = {
                 k: "******" if k in exclude else v
-                for k, v in bound_args.arguments.items()
+                for k, v in plan.bind((self, *args), kwargs).items()
                 if k != "self" and not k.startswith("_") and v is not None
             }
-            # Создаем логгер с именем класса вызываемого метода
-            method = f'{self.__class__.__name__}.{func.__name__}'
-            logger = get_log(method)
+            # Логгер с именем класса вызываемого метода
+            method, logger = plan.method(self)
             logger.debug(f'Вызов метода из теста: {make_text_ansi_name(method)} с параметрами: {filtered_args}')
 
             # Передаем оригинальные аргументы без изменений
@@ -84,7 +205,7 @@ def handle_api_errors(func: Callable) -> Callable:
             - `ApiException`: Ошибки API Airflow
             - `JSONDecodeError`: Некорректные JSON-ответы
             - Общие исключения: Резервная обработка непредвиденных ошибок
-        Определяет метод вызвавший исключение
+        Определяет метод вызвавший исключение (имя из плана вызова `CallPlan`, без обхода стека)
         С минимальным логированием:
             - Для Airflow: ErrorType + Status + Краткий reason + Обрезанный body
             - Для остальных: ErrorType: Message
@@ -96,11 +217,14 @@ def handle_api_errors(func: Callable) -> Callable:
         Ex:
         @log_method_args()       1. Логирование аргументов
         @auto_handle_errors      2. Обработка ошибок (должен быть ВТОРЫМ!)
+        @inject_request_timeout  3. Подстановка таймаута (опционально, последним)
         def any_method(...)
 
     :param func: Обертываемая функция метода API
     :return: Обернутая функция с обработкой ошибок
     """
+    # Источник ошибки - декорируемый метод: имя из плана вызова вместо обхода стека при каждой ошибке
+    plan = get_call_plan(func)
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
@@ -108,8 +232,7 @@ def handle_api_errors(func: Callable) -> Callable:
             return func(self, *args, **kwargs)
 
         except ApiException as e:
-            source = get_error_source(self)
-            handle_api_exception(e, method_name=source)
+            handle_api_exception(e, method_name=plan.method(self)[0])
 
         except json.JSONDecodeError as e:
             log_and_raise(
@@ -1,12 +1,20 @@
 """
 Color logger for consumer (logs will be emitted when poll() is called)
-Smart linebreak handler for Pytest log record
+Smart linebreak handler for Pytest log record (optionally queue-backed: background batched writes)
+Structured logging with deferred message rendering for hot paths
+Sampling and deduplication of polling-loop records (state transitions are never lost)
+Failure-only DEBUG capture: per-test ring buffer flushed only when the test fails
 Decorator for class method invocation logging
 """
 import re
-from logging import DEBUG, Filter, Formatter, getLogger, Handler, INFO, Logger, LogRecord
+import threading
+import time
+from collections import deque
+from logging import DEBUG, ERROR, Filter, Formatter, getLogger, Handler, INFO, Logger, LogRecord, makeLogRecord, WARNING
 from os import getenv, linesep
+from queue import Empty, SimpleQueue
 from sys import stdout
+from typing import Any, TextIO
 
 import colorama
 from colorama import Back, Fore, Style
@@ -61,6 +69,27 @@ class ColoredFormatter(Formatter):
         return formatted_message
 
 
+_EXC_FORMATTER = Formatter()  # трейсбэк записи для `prepare_record`
+
+
+def prepare_record(record: LogRecord) -> LogRecord:
+    """
+    Фиксирует сообщение записи для отложенного вывода (как `logging.handlers.QueueHandler.prepare`):
+        - `msg` - итоговая строка (`LazyFields` и аргументы вычисляются в вызывающем потоке в момент логирования)
+        - `args` и `exc_info` сбрасываются, трейсбэк сохраняется в `exc_text`
+    Повторный вызов для той же записи ничего не меняет
+
+    :param record: Запись лога
+    :return: LogRecord: та же запись
+    """
+    if record.exc_info and not record.exc_text:
+        record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+    record.msg = record.getMessage()
+    record.args = None
+    record.exc_info = None
+    return record
+
+
 class SmartLineBreakHandler(Handler):
     """
     Обработчик с управлением переносами строк в `log record`:
@@ -80,15 +109,47 @@ class SmartLineBreakHandler(Handler):
     Кастомный логгер в режиме `DEBUG` генерирует `log record` в промежутке между событиями Pytest
         - артефактом кастомного логгера является запись `log record` в одну строчку с `log record` от Pytest
     SmartLineBreakHandler - устраняет такие артефакты кастомного логгера
+
+    Режим очереди (`queued=True`, в `get_log()` - переменная окружения `LOG_QUEUED=True`):
+        - Вызывающий поток фиксирует сообщение записи (`prepare_record`) и помещает запись в очередь,
+          форматирование и вывод - в общем фоновом потоке
+        - Вывод пачками: сброс в `stdout` раз в `QueuedLogWriter.flush_interval` секунд
+          или при накоплении `QueuedLogWriter.buffer_size` символов
+        - Порядок записей и переносы строк (включая маркер `cr_mark_after`) такие же, как при прямом выводе
+        - `flush()` дожидается вывода всех записей из очереди (Ex: перед выводом результата теста Pytest)
     """
 
-    def __init__(self, cr_mark_after: str = "-#"):
+    def __init__(self, cr_mark_after: str = "-#", queued: bool = False):
         if not isinstance(cr_mark_after, str) or len(cr_mark_after) == 0:
             raise ValueError("Маркер должен быть непустой строкой")
         super().__init__()
         self.cr_mark_after = cr_mark_after
+        self.queued = queued
 
     def emit(self, record: LogRecord):
+        """
+        Эмитирует запись в `stdout`: сразу или через очередь фонового потока (`queued=True`)
+
+        :param record: запись подлежащая форматированию и эмитированию в `stdout`
+        """
+        if self.queued:
+            try:
+                prepare_record(record)
+            except Exception:  # pylint: disable=broad-exception-caught
+                self.handleError(record)
+                return
+            QueuedLogWriter.get().put(self, record)
+            return
+        stdout.write(self.render(record))
+        # Вывод в лог мгновенно (без буфера обмена)
+        stdout.flush()
+
+    def flush(self):
+        """В режиме очереди - дожидается вывода всех записей из очереди"""
+        if self.queued:
+            QueuedLogWriter.get().flush()
+
+    def render(self, record: LogRecord) -> str:
         """
         Управляет переносом строк у записи в лог в зависимости от флагов, выставленных в TruncateNameFilter:
             - атрибуты записи в лог `linesep_before` и linesep_after` зависят от имени логгера
@@ -96,7 +157,8 @@ class SmartLineBreakHandler(Handler):
             - `linesep_after=True` - добавляется перенос строки в конце `log record`
             - добавляется перенос строки в начале `log record`, если оба флага не установлены
 
-        :param record: запись подлежащая форматированию и эмитированию в `stdout`
+        :param record: запись подлежащая форматированию
+        :return: str: отформатированная запись с переносами строк
         """
         # Используем флаг из записи или значение по умолчанию
         linesep_before = getattr(record, "linesep_before", False)
@@ -114,14 +176,390 @@ class SmartLineBreakHandler(Handler):
             msg = msg[:-len(self.cr_mark_after)]  # Удаляем маркер
             cancel_return_after = True
 
-        output_msg = (
+        return (
                 (linesep if linesep_before else "") +
                 msg +
                 (linesep if linesep_after and not cancel_return_after else "")
         )
-        stdout.write(output_msg)
-        # Вывод в лог мгновенно (без буфера обмена)
-        stdout.flush()
+
+
+class QueuedLogWriter:
+    """
+    Общий фоновый поток вывода записей `SmartLineBreakHandler(queued=True)` в `stdout`:
+        - Записи всех логгеров - в одной очереди (сохраняется общий порядок вывода)
+        - Форматирование, запись пачкой и `flush` потока вывода выполняются в фоновом потоке
+        - Поток-демон запускается при первой записи; при завершении интерпретатора `logging.shutdown()`
+          вызывает `flush()` обработчиков - записи из очереди не теряются
+    """
+
+    flush_interval: float = 0.2  # секунд
+    buffer_size: int = 64 * 1024  # символов
+
+    _instance: "QueuedLogWriter | None" = None
+    _instance_lock = threading.Lock()
+
+    _FLUSH = object()  # маркер принудительного сброса
+
+    def __init__(self, stream: TextIO = stdout):
+        self.stream = stream
+        self._queue: SimpleQueue = SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="QueuedLogWriter", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "QueuedLogWriter":
+        """Общий экземпляр (поток запускается при первом обращении)"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def put(self, handler: SmartLineBreakHandler, record: LogRecord) -> None:
+        """Помещает запись в очередь (без форматирования и ввода-вывода в вызывающем потоке, см. `prepare_record`)"""
+        self._queue.put((handler, record))
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Дожидается вывода всех записей, помещенных в очередь до вызова"""
+        if threading.current_thread() is self._thread:
+            return
+        done = threading.Event()
+        self._queue.put((self._FLUSH, done))
+        done.wait(timeout)
+
+    def _run(self) -> None:
+        chunks, size = [], 0
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                handler, record = self._queue.get(timeout=timeout)
+            except Empty:
+                handler = record = None
+
+            if handler is not None and handler is not self._FLUSH:
+                try:
+                    chunk = handler.render(record)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    handler.handleError(record)
+                else:
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    deadline = deadline or time.monotonic() + self.flush_interval
+
+            if chunks and (
+                    handler is None
+                    or handler is self._FLUSH
+                    or size >= self.buffer_size
+                    or time.monotonic() >= deadline
+            ):
+                self.stream.write("".join(chunks))
+                self.stream.flush()
+                chunks, size, deadline = [], 0, None
+            if handler is self._FLUSH:
+                record.set()
+
+
+class LazyFields:
+    """
+    Сообщение структурированной записи: строка собирается только при форматировании записи обработчиком
+        - Формат: "<event> | <key>: <value> | ..."; поля со значением None пропускаются
+        - Значение-callable вычисляется при форматировании: Ex: `body=lambda: response.text`
+    """
+
+    __slots__ = ("event", "fields")
+
+    def __init__(self, event: str, fields: dict[str, Any]):
+        self.event = event
+        self.fields = fields
+
+    def __str__(self) -> str:
+        parts = [self.event]
+        for key, value in self.fields.items():
+            if callable(value):
+                value = value()
+            if value is not None:
+                parts.append(f'{key}: {value}')
+        return " | ".join(parts)
+
+
+class StructLog:
+    """
+    Структурированное логирование без guard-проверок в вызывающем коде:
+        - Уровень проверяется до создания записи: при выключенном уровне не строятся ни строки, ни `LogRecord`
+        - Сообщение (`LazyFields`) форматируется только при эмитировании записи
+        - Имя функции и строка в записи - место вызова (`stacklevel`)
+
+    Ex:
+        SLOG = StructLog(get_log(__name__))
+        SLOG.debug("Send Request", method=method, url=url, params=params)
+        SLOG.debug("Response", body=lambda: response.text)  # response.text декодируется только при DEBUG
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, logger: Logger):
+        self.logger = logger
+
+    def debug(self, event: str, **fields: Any) -> None:
+        """Запись уровня DEBUG"""
+        if self.logger.isEnabledFor(DEBUG):
+            self.logger.log(DEBUG, "%s", LazyFields(event, fields), stacklevel=2)
+
+    def info(self, event: str, **fields: Any) -> None:
+        """Запись уровня INFO"""
+        if self.logger.isEnabledFor(INFO):
+            self.logger.log(INFO, "%s", LazyFields(event, fields), stacklevel=2)
+
+    def warning(self, event: str, **fields: Any) -> None:
+        """Запись уровня WARNING"""
+        if self.logger.isEnabledFor(WARNING):
+            self.logger.log(WARNING, "%s", LazyFields(event, fields), stacklevel=2)
+
+    def error(self, event: str, **fields: Any) -> None:
+        """Запись уровня ERROR"""
+        if self.logger.isEnabledFor(ERROR):
+            self.logger.log(ERROR, "%s", LazyFields(event, fields), stacklevel=2)
+
+
+class _SampledKey:
+    """Состояние ключа `SampledLog`: отрезки подавленных повторов [state, count, since] с последней строки"""
+
+    __slots__ = ("segments", "last_line", "window", "lines")
+
+    def __init__(self, state: str, now: float):
+        self.segments: list[list] = [[state, 0, now]]
+        self.last_line: float = 0.0
+        self.window: float = now  # начало текущего окна ограничения частоты (1 с)
+        self.lines: int = 0  # строк в текущем окне
+
+
+class SampledLog:
+    """
+    Семплирование и дедупликация записей циклов ожидания (polling) по ключу (место вызова + объект ожидания):
+        - Смена состояния выводится сразу; повторы того же состояния подавляются
+        - Подавленные повторы сворачиваются в одну строку: состояние, количество проверок и время в состоянии
+          (добавляется к следующей выведенной строке или выводится `flush()`)
+        - Неизменное состояние выводится не чаще раза в `heartbeat` секунд
+        - Не больше `rate` строк на ключ в секунду: смена состояния сверх лимита не теряется,
+          а попадает в свернутую строку следующей записи или `flush()`
+
+    Ex:
+        POLL_LOG = SampledLog(LOG)
+        key = f'task:{dag_id}:{run_id}:{task_id}'
+        POLL_LOG.info(key, state, f'Текущее состояние Task: "{state}" | Время ожидания: {elapsed:.0f} s')
+        POLL_LOG.flush(key)  # цикл завершен: вывод свернутых повторов и удаление ключа
+    """
+
+    def __init__(self, logger: Logger, heartbeat: float = 60.0, rate: int = 1):
+        self.logger = logger
+        self.heartbeat = heartbeat
+        self.rate = rate
+        self._keys: dict[str, _SampledKey] = {}
+        self._lock = threading.Lock()
+
+    def info(self, key: str, state: str, message: str) -> None:
+        """Запись уровня INFO"""
+        self._record(INFO, key, state, message)
+
+    def debug(self, key: str, state: str, message: str) -> None:
+        """Запись уровня DEBUG"""
+        self._record(DEBUG, key, state, message)
+
+    def log(self, level: int, key: str, state: str, message: str) -> None:
+        """
+        Запись очередной проверки состояния
+
+        :param level: Уровень записи
+        :param key: Ключ дедупликации: Ex: "task:<dag_id>:<run_id>:<task_id>"
+        :param state: Текущее состояние (сравнивается с предыдущим для ключа)
+        :param message: Сообщение проверки
+        """
+        self._record(level, key, state, message)
+
+    def _record(self, level: int, key: str, state: str, message: str) -> None:
+        """Дедупликация и вывод записи (место вызова в записи - вызов публичного метода)"""
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is None:
+                entry = self._keys[key] = _SampledKey(state, now)
+                changed = True
+            else:
+                changed = entry.segments[-1][0] != state
+                if changed:
+                    entry.segments.append([state, 0, now])
+            segment = entry.segments[-1]
+            segment[1] += 1
+            if not (changed or now - entry.last_line >= self.heartbeat) or not self._allow(entry, now):
+                return
+            summary = self._summary(entry.segments[:-1], now, since=segment[2])
+            summary = f' | Свернуто: {summary}' if summary else ""
+            if not changed and segment[1] > 1:
+                message = f'{message} | Без изменений: {segment[1]} проверок за {now - segment[2]:.0f} s'
+            entry.segments = [[state, 0, segment[2]]]
+            entry.last_line = now
+        self.logger.log(level, "%s%s", message, summary, stacklevel=3)
+
+    def flush(self, key: str, level: int = INFO) -> None:
+        """
+        Завершение цикла ожидания: вывод свернутых повторов ключа (если есть) и удаление ключа
+
+        :param key: Ключ дедупликации
+        :param level: Уровень записи
+        """
+        with self._lock:
+            entry = self._keys.pop(key, None)
+        if entry is None or not self.logger.isEnabledFor(level):
+            return
+        summary = self._summary(entry.segments, time.monotonic())
+        if summary:
+            self.logger.log(level, "Свернуто: %s", summary, stacklevel=2)
+
+    def _allow(self, entry: _SampledKey, now: float) -> bool:
+        """Ограничение частоты строк ключа: не больше `rate` в окне 1 с"""
+        if now - entry.window >= 1.0:
+            entry.window, entry.lines = now, 0
+        if entry.lines >= self.rate:
+            return False
+        entry.lines += 1
+        return True
+
+    @staticmethod
+    def _summary(segments: list[list], now: float, since: float | None = None) -> str:
+        """
+        Свернутые повторы: Ex: '"QUEUED" x3 за 30 s -> "RUNNING" x5 за 50 s'
+
+        :param segments: Отрезки [state, count, since] (отрезки без подавленных проверок пропускаются)
+        :param now: Время окончания последнего отрезка
+        :param since: Время окончания последнего отрезка, если он завершен сменой состояния
+        """
+        ends = [segment[2] for segment in segments[1:]] + [since if since is not None else now]
+        parts = [
+            f'"{state}" x{count} за {end - start:.0f} s'
+            for (state, count, start), end in zip(segments, ends) if count
+        ]
+        return " -> ".join(parts)
+
+
+class TailLogBuffer:
+    """
+    Кольцевой буфер DEBUG-записей текущего теста (режим вывода логов только для упавших тестов):
+        - `start()` - начало теста: записи ниже INFO откладываются (`TailBufferFilter`) в буфер емкостью `capacity`
+          записей (при переполнении отбрасываются самые ранние записи)
+        - Запись хранится в буфере один раз вместе со списком обработчиков, отложивших ее (Ex: файл и консоль):
+          емкость и количество отброшенных записей не зависят от количества обработчиков
+        - `flush()` - тест упал: отложенные записи выводятся своими обработчиками в исходном порядке,
+          следующие записи теста выводятся сразу
+        - `stop()` - конец теста: неотправленные записи отбрасываются
+        - Вне теста (сбор, фикстуры сессии между тестами) записи выводятся сразу
+    """
+
+    capacity: int = 5000
+    _records: deque = deque(maxlen=capacity)  # (record, [handler, ...])
+    _received: int = 0
+    _active: bool = False
+    _lock = threading.RLock()
+
+    @classmethod
+    def start(cls, capacity: int | None = None) -> None:
+        """Начало теста: включает буферизацию"""
+        with cls._lock:
+            if capacity is not None and capacity != cls.capacity:
+                cls.capacity = capacity
+                cls._records = deque(maxlen=capacity)
+            cls._records.clear()
+            cls._received = 0
+            cls._active = True
+
+    @classmethod
+    def stop(cls) -> int:
+        """
+        Конец теста: выключает буферизацию и отбрасывает отложенные записи
+
+        :return: int: Количество отброшенных записей
+        """
+        with cls._lock:
+            discarded = len(cls._records)
+            cls._records.clear()
+            cls._active = False
+            return discarded
+
+    @classmethod
+    def capture(cls, handler: Handler, record: LogRecord) -> bool:
+        """
+        Откладывает запись обработчика в буфер
+            - Обработчики логгера вызываются для записи подряд: запись, уже отложенная предыдущим обработчиком,
+              не добавляется повторно - обработчик добавляется к ее списку
+            - Сообщение фиксируется при откладывании (`prepare_record`): при выводе в `flush()` запись показывает
+              аргументы на момент логирования (Ex: `LazyFields`, изменяемые dict)
+
+        :return: bool: True - запись отложена, False - буферизация выключена (запись выводится сразу)
+        """
+        if not cls._active:
+            return False
+        with cls._lock:
+            if not cls._active:
+                return False
+            if cls._records and cls._records[-1][0] is record:
+                cls._records[-1][1].append(handler)
+            else:
+                try:
+                    prepare_record(record)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    return False  # ошибка сообщения - запись выводится сразу (обработка ошибки обработчиком)
+                cls._records.append((record, [handler]))
+                cls._received += 1
+            return True
+
+    @classmethod
+    def flush(cls) -> None:
+        """Вывод отложенных записей (тест упал) и выключение буферизации до конца теста"""
+        with cls._lock:
+            records = list(cls._records)
+            dropped = cls._received - len(records)
+            cls._records.clear()
+            cls._active = False
+
+        if dropped:
+            notice = f'Ранние DEBUG-записи теста отброшены: {dropped} (емкость буфера: {cls.capacity})'
+            handlers = list(dict.fromkeys(handler for _, record_handlers in records for handler in record_handlers))
+            records.insert(0, (makeLogRecord({"name": "TailLogBuffer", "levelno": WARNING, "levelname": "WARNING",
+                                              "msg": notice}), handlers))
+        for record, handlers in records:
+            for handler in handlers:
+                # Фильтры обработчика уже применены при записи в буфер: повторно не применяются
+                handler.acquire()
+                try:
+                    handler.emit(record)
+                finally:
+                    handler.release()
+
+
+class TailBufferFilter(Filter):
+    """
+    Фильтр обработчика для `TailLogBuffer`: записи ниже `level` во время теста откладываются в буфер
+        - Экземпляр фильтра привязан к обработчику: при `TailLogBuffer.flush()` запись выводится тем же обработчиком
+        - Подключается последним фильтром обработчика (`add_tail_buffer()`): остальные фильтры применяются до буфера
+    """
+
+    def __init__(self, handler: Handler, level: int = INFO):
+        super().__init__()
+        self.handler = handler
+        self.level = level
+
+    def filter(self, record: LogRecord) -> bool:
+        """:return: bool: False - запись отложена в буфер"""
+        return record.levelno >= self.level or not TailLogBuffer.capture(self.handler, record)
+
+
+def add_tail_buffer(handler: Handler, level: int = INFO) -> Handler:
+    """Подключает к обработчику буферизацию записей ниже `level` (`TailLogBuffer`), если она еще не подключена"""
+    if not any(isinstance(handler_filter, TailBufferFilter) for handler_filter in handler.filters):
+        handler.addFilter(TailBufferFilter(handler, level))
+    return handler
 
 
 class TruncateNameFilter(Filter):
@@ -207,6 +645,8 @@ def get_log(name: str, cr_mark_after: str = "-#") -> Logger:
         - SmartLineBreakHandler
         - TruncateNameFilter
     Уровень логирования зависит от переменной окружения DEBUG
+    Режим очереди обработчика (фоновый вывод пачками) зависит от переменной окружения LOG_QUEUED
+    Вывод DEBUG-записей только для упавших тестов (`TailLogBuffer`) зависит от переменной окружения LOG_TAIL_ON_FAILURE
     ВАЖНО:
         - Уровень обработчика должен совпадать с уровнем логгера
         - Список `names` содержит имена логгеров, не имеющих доступа для настройки переноса строки после записи в лог
@@ -252,7 +692,7 @@ def get_log(name: str, cr_mark_after: str = "-#") -> Logger:
         debug_mode = str2bool(getenv("DEBUG", "False"))
         log_level = DEBUG if debug_mode else INFO
         log.setLevel(log_level)
-        handler = SmartLineBreakHandler(cr_mark_after=cr_mark_after)
+        handler = SmartLineBreakHandler(cr_mark_after=cr_mark_after, queued=str2bool(getenv("LOG_QUEUED", "False")))
         handler.setLevel(log_level)
         formatter = ColoredFormatter(
             "%(asctime)s [%(levelname)-8s] [%(name)-21s] %(message)s",
@@ -260,6 +700,8 @@ def get_log(name: str, cr_mark_after: str = "-#") -> Logger:
         )
         handler.setFormatter(formatter)
         handler.addFilter(TruncateNameFilter(formatter, names_linesep_before, names_linesep_after))
+        if str2bool(getenv("LOG_TAIL_ON_FAILURE", "False")):
+            add_tail_buffer(handler)
         log.addHandler(handler)
 
     return log
@@ -1,11 +1,90 @@
 import functools
+import hashlib
+import json
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import JSONDecodeError
-from typing import Any, Callable, MutableMapping
+from typing import Any, Callable, Iterator, MutableMapping
 
 import allure
 from requests import Response
 
+from Config import (
+    ALLURE_ATTACH_ASYNC,
+    ALLURE_ATTACH_MAX_SIZE,
+    ALLURE_ATTACH_SAMPLE_AFTER,
+    ALLURE_ATTACH_SAMPLE_EVERY,
+    ALLURE_ATTACH_TEST_BUDGET,
+)
 from Helpers.DataCollector import DataCollector
+from libs import get_log
+
+LOG = get_log(__name__)
+
+TRUNCATED_KEY = '...'  # ключ последнего элемента `iter_flatten`, если сработал лимит элементов или размера
+
+# Лимиты разбора тела ответа для вложений отчета
+REPORT_FLATTEN_MAX_DEPTH = 32
+REPORT_FLATTEN_MAX_ITEMS = 5000
+REPORT_FLATTEN_MAX_BYTES = ALLURE_ATTACH_MAX_SIZE
+
+
+def iter_flatten(
+        d: MutableMapping,
+        parent_key: str = '',
+        sep: str = '_',
+        max_depth: int | None = None,
+        max_items: int | None = None,
+        max_bytes: int | None = None,
+        transform: Callable[[Any], Any] | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """
+    Потоковое (генератор) реформатирование словаря из вложенной структуры в плоскую:
+     - обход в глубину по стеку итераторов: без рекурсии и без промежуточных словарей и списков на каждом уровне
+     - ключи как у `get_flatten_dict`: `parent{sep}key` для словарей, `key_{i}` для элементов списков
+     - `max_depth` - контейнер глубже лимита выводится одним значением: Ex: '<dict: 12>'
+     - `max_items`/`max_bytes` - после лимита элементов или суммарного размера ключей и значений (в символах)
+       выводится `(TRUNCATED_KEY, 'обрезано: ...')` и обход прекращается
+    :param d: Словарь для переборки
+    :param parent_key: Имя родительского ключа
+    :param sep: Разделитель имени
+    :param max_depth: Максимальная глубина вложенности (None - без ограничения)
+    :param max_items: Максимальное количество элементов (None - без ограничения)
+    :param max_bytes: Максимальный суммарный размер ключей и значений (None - без ограничения)
+    :param transform: Преобразование значения до учета размера: Ex: обрезка длинных строк
+    :return: Итератор пар (ключ, значение)
+    """
+    items = size = 0
+    stack = [(_iter_children(d, parent_key, sep), 0)]
+    while stack:
+        children, depth = stack[-1]
+        for key, value in children:
+            if isinstance(value, (MutableMapping, list)):
+                if max_depth is None or depth < max_depth:
+                    stack.append((_iter_children(value, key, sep), depth + 1))
+                    break
+                value = f'<{type(value).__name__}: {len(value)}>'
+            elif transform is not None:
+                value = transform(value)
+            if max_items is not None and items >= max_items:
+                yield TRUNCATED_KEY, f'обрезано: лимит {max_items} элементов'
+                return
+            if max_bytes is not None:
+                size += len(str(key)) + len(str(value))
+                if size > max_bytes:
+                    yield TRUNCATED_KEY, f'обрезано: лимит {max_bytes} символов после {items} элементов'
+                    return
+            items += 1
+            yield key, value
+        else:
+            stack.pop()
+
+
+def _iter_children(container: MutableMapping | list, key: str, sep: str) -> Iterator[tuple[str, Any]]:
+    """Дочерние элементы контейнера с полными ключами"""
+    if isinstance(container, list):
+        return ((f'{key}_{i}', item) for i, item in enumerate(container))
+    return (((f'{key}{sep}{child}' if key else child), value) for child, value in container.items())
 
 
 def get_flatten_dict(d: MutableMapping, parent_key: str = '', sep: str = '_') -> dict:
@@ -16,17 +95,7 @@ def get_flatten_dict(d: MutableMapping, parent_key: str = '', sep: str = '_') ->
     :param sep: Разделитель имени
     :return: Одноуровневый словарь
     """
-    items = []
-    for key, value in d.items():
-        new_key = f'{parent_key}{sep}{key}' if parent_key else key
-        if isinstance(value, MutableMapping):
-            items.extend(get_flatten_dict(value, new_key, sep=sep).items())
-        elif isinstance(value, list):
-            for i, item in enumerate(value):
-                items.extend(get_flatten_dict({f'{key}_{i}': item}, parent_key, sep=sep).items())
-        else:
-            items.append((new_key, value))
-    return dict(items)
+    return dict(iter_flatten(d, parent_key, sep))
 
 
 def reformat_longest_str_in_response(entity: Response):
@@ -36,15 +105,36 @@ def reformat_longest_str_in_response(entity: Response):
     """
     try:
         if entity.text:
-            response = get_flatten_dict(entity.json())
-            for key, value in response.items():
-                if len(str(value)) > 50:
-                    response[key] = f"{value[:20]}.....{value[25:50]}"
-            return response
+            return reformat_longest_str(entity.json())
     except JSONDecodeError:
         return entity.text
 
 
+def reformat_longest_str(response_json: Any) -> dict:
+    """
+    Обрезка середины у длинных значений распарсенного тела ответа
+     - тело разбирается `iter_flatten` с лимитами `REPORT_FLATTEN_*`: большие ответы обрезаются при разборе
+    :param response_json: Тело ответа в формате json/dict
+    :return: Одноуровневый словарь
+    """
+    if not isinstance(response_json, MutableMapping):
+        response_json = {'': response_json}
+    return dict(iter_flatten(
+        response_json,
+        max_depth=REPORT_FLATTEN_MAX_DEPTH,
+        max_items=REPORT_FLATTEN_MAX_ITEMS,
+        max_bytes=REPORT_FLATTEN_MAX_BYTES,
+        transform=_shorten,
+    ))
+
+
+def _shorten(value: Any) -> Any:
+    """Обрезка середины у значения длиннее 50 символов"""
+    if len(text := str(value)) > 50:
+        return f"{text[:20]}.....{text[25:50]}"
+    return value
+
+
 def allure_attachment_request_data(entity: Response) -> None:
     """
     Формирование отображения данных запроса в отчете
@@ -70,13 +160,214 @@ def allure_attachment_request_data(entity: Response) -> None:
     allure.attach(attachment_data_parsed, "Parsed data", allure.attachment_type.HTML)
 
 
+def render_request_data(endpoint: str, request_body: Any, status_code: int, response: Any) -> str:
+    """HTML-вложение "Request data" (формат `allure_attachment_request_data`)"""
+    return (
+        """
+            <p><strong>Endpoint:</strong> {}</p>
+            <p><strong>Payload:</strong> {}</p>
+            <p><strong>Status_code:</strong>&nbsp;{}</p>
+            <p><strong>Response:</strong> {}</p>
+        """
+    ).format(endpoint, request_body, str(status_code), response)
+
+
+def render_parsed_data(collected: dict) -> str:
+    """HTML-вложение "Parsed data" (формат `allure_attachment_request_data`)"""
+    return "\n".join(f"<p><strong>{key}:</strong> {value}</p>" for key, value in collected.items())
+
+
+def cap_attachment(body: str, max_size: int) -> str:
+    """
+    Ограничение размера вложения: тело длиннее `max_size` байт (UTF-8) обрезается с пометкой
+    :param body: Тело вложения
+    :param max_size: Максимальный размер (байт)
+    :return: Тело вложения
+    """
+    encoded = body.encode("utf-8")
+    if len(encoded) <= max_size:
+        return body
+    return (
+        f"{encoded[:max_size].decode('utf-8', errors='ignore')}"
+        f"<p><strong>... вложение обрезано:</strong> {len(encoded)} байт, лимит {max_size} байт</p>"
+    )
+
+
+class AttachmentPipeline:
+    """
+    Конвейер Allure-вложений запросов:
+        - Время запроса не включает построение отчета: разбор тела ответа (`get_flatten_dict`) и рендер HTML
+          выполняются фоновым потоком; в потоке теста снимаются только ссылки на данные ответа
+          и рендерится "Parsed data" (состояние DataCollector на момент запроса)
+        - Allure регистрирует вложение в контексте потока теста: готовые вложения добавляются в отчет
+          в `drain()` (хуки pytest: конец фаз call и teardown теста) в порядке запросов
+        - Ограничения:
+            - `max_size` - размер одного вложения (байт), длинные вложения обрезаются
+            - `test_budget` - суммарный размер вложений теста (байт), вложения сверх бюджета пропускаются
+            - `sample_after`/`sample_every` - после `sample_after` запросов теста вкладывается каждый
+              `sample_every`-й запрос; ответы с ошибкой (status_code >= 400) вкладываются всегда
+        - Дедупликация по содержимому (blake2b): одинаковые тела ответов разбираются один раз (LRU-кеш),
+          одинаковые вложения теста добавляются один раз
+        - Пропущенные вложения перечисляются во вложении "Attachments summary"
+        - Ошибка построения вложений запроса логируется и учитывается в сводке (причина "error"):
+          тест не падает, остальные вложения добавляются
+        - `background=False` - построение и добавление вложений в потоке запроса (ограничения сохраняются)
+
+    Ex:
+        pipeline = AttachmentPipeline.get()
+        pipeline.submit(response)
+        pipeline.drain(end_of_test=True)
+    """
+
+    _instance: "AttachmentPipeline | None" = None
+    cache_size: int = 256  # разобранных тел ответов в LRU-кеше
+
+    def __init__(
+            self,
+            background: bool = True,
+            max_size: int = 1 << 16,
+            test_budget: int = 1 << 20,
+            sample_after: int = 20,
+            sample_every: int = 10,
+    ):
+        self.background = background
+        self.max_size = max_size
+        self.test_budget = test_budget
+        self.sample_after = sample_after
+        self.sample_every = max(sample_every, 1)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="allure-attach") if background else None
+        self._pending: list[Future] = []
+        self._rendered: OrderedDict[str, Any] = OrderedDict()
+        self._requests = 0  # запросов текущего теста
+        self._used = 0  # байт вложений текущего теста
+        self._seen: set[str] = set()  # дайджесты вложений текущего теста
+        self.skipped: Counter = Counter()  # пропущенные вложения текущего теста по причине
+
+    @classmethod
+    def get(cls) -> "AttachmentPipeline":
+        """Общий конвейер процесса с настройками из Config"""
+        if cls._instance is None:
+            cls._instance = cls(
+                background=ALLURE_ATTACH_ASYNC,
+                max_size=ALLURE_ATTACH_MAX_SIZE,
+                test_budget=ALLURE_ATTACH_TEST_BUDGET,
+                sample_after=ALLURE_ATTACH_SAMPLE_AFTER,
+                sample_every=ALLURE_ATTACH_SAMPLE_EVERY,
+            )
+        return cls._instance
+
+    def submit(self, entity: Response) -> None:
+        """
+        Постановка вложений запроса в очередь
+        :param entity: сущность объекта Response
+        """
+        self._requests += 1
+        overflow = self._requests - self.sample_after
+        if entity.status_code < 400 and overflow > 0 and overflow % self.sample_every:
+            self.skipped["sampling"] += 1
+            return
+        # Снимок данных в потоке теста: DataCollector (включая вложенные значения) изменяется следующими запросами
+        parsed_data = render_parsed_data(DataCollector._data_dict)
+        snapshot = (entity.url, entity.request.body, entity.status_code, entity.content, parsed_data)
+        if self._executor is None:
+            try:
+                attachments = self._build(*snapshot)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._skip_failed(e)
+            else:
+                self._attach(attachments)
+        else:
+            self._pending.append(self._executor.submit(self._build, *snapshot))
+
+    def drain(self, end_of_test: bool = False) -> None:
+        """
+        Добавление готовых вложений в отчет (вызывается в потоке теста)
+        :param end_of_test: Тест завершен: сводка пропущенных вложений и сброс бюджета теста
+        """
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                attachments = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._skip_failed(e)
+            else:
+                self._attach(attachments)
+        if not end_of_test:
+            return
+        if self.skipped:
+            summary = "\n".join(["Пропущено вложений запросов:"] + [
+                f"{reason}: {count}" for reason, count in sorted(self.skipped.items())
+            ])
+            allure.attach(summary, "Attachments summary", allure.attachment_type.TEXT)
+        self._requests, self._used = 0, 0
+        self._seen.clear()
+        self.skipped.clear()
+
+    def _build(
+            self, endpoint: str, request_body: Any, status_code: int, content: bytes, parsed_data: str
+    ) -> list[tuple[str, str, str]]:
+        """
+        Построение вложений запроса (фоновый поток)
+        :return: [(имя вложения, HTML, дайджест HTML)]
+        """
+        response = self._reformat(content)
+        attachments = [
+            ("Request data", render_request_data(endpoint, request_body, status_code, response)),
+            ("Parsed data", parsed_data),
+        ]
+        result = []
+        for name, body in attachments:
+            body = cap_attachment(body, self.max_size)
+            result.append((name, body, hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()))
+        return result
+
+    def _skip_failed(self, error: Exception) -> None:
+        """Вложения запроса пропущены из-за ошибки построения"""
+        LOG.error(f'Ошибка построения вложений запроса: {repr(type(error))} : {str(error)}')
+        self.skipped["error"] += 1
+
+    def _reformat(self, content: bytes) -> Any:
+        """Разобранное тело ответа (`reformat_longest_str`) из LRU-кеша по дайджесту содержимого"""
+        if not content:
+            return None
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+        if digest in self._rendered:
+            self._rendered.move_to_end(digest)
+            return self._rendered[digest]
+        try:
+            response = reformat_longest_str(json.loads(content))
+        except (JSONDecodeError, UnicodeDecodeError):
+            response = content.decode("utf-8", errors="replace")
+        self._rendered[digest] = response
+        if len(self._rendered) > self.cache_size:
+            self._rendered.popitem(last=False)
+        return response
+
+    def _attach(self, attachments: list[tuple[str, str, str]]) -> None:
+        """Добавление вложений в отчет с учетом дедупликации и бюджета теста (поток теста)"""
+        for name, body, digest in attachments:
+            if digest in self._seen:
+                self.skipped["duplicate"] += 1
+                continue
+            size = len(body.encode("utf-8"))
+            if self._used + size > self.test_budget:
+                self.skipped["budget"] += 1
+                continue
+            self._seen.add(digest)
+            self._used += size
+            allure.attach(body, name, allure.attachment_type.HTML)
+
+
 def allure_attach_response(method: Callable) -> Callable:
-    """Декоратор для парсинга запроса и добавления данных к отчету"""
+    """
+    Декоратор для парсинга запроса и добавления данных к отчету
+     - вложения строятся фоновым потоком `AttachmentPipeline` (env.ALLURE_ATTACH_ASYNC)
+    """
 
     @functools.wraps(method)
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
         response: Response = method(self, *args, **kwargs)
-        allure_attachment_request_data(response)
+        AttachmentPipeline.get().submit(response)
         return response
 
     return wrapper
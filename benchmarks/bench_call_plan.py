@@ -0,0 +1,145 @@
+"""bench_call_plan.py"""
+
+# Usage: python -m benchmarks.bench_call_plan [количество вызовов]
+
+import inspect
+import sys
+import timeit
+from functools import wraps
+from types import FrameType, MethodType
+from typing import Any
+
+from libs import get_log
+from libs.api.airflow.decorators import handle_api_errors, inject_request_timeout, log_method_args
+from libs.api.airflow.helpers import log_and_raise, make_text_ansi_name
+
+
+def legacy_get_method_name(instance: object, max_depth: int = 5) -> str | None:
+    """`get_method_name` до перехода на `CallPlan`: поиск имени метода в стеке вызовов"""
+    frame: FrameType = inspect.currentframe()
+    class_methods = [m for m in dir(instance) if callable(getattr(instance, m)) and not m.startswith("__")]
+
+    try:
+        for _ in range(max_depth):
+            frame = frame.f_back  # type: ignore
+            if not frame:
+                break
+            method_name = frame.f_code.co_name
+            if method_name in class_methods:
+                return method_name
+
+    finally:
+        del frame
+
+    log_and_raise(
+        RuntimeError,
+        "Original method name not found in call stack",
+        logger_name=__name__,
+        log_level="error",
+    )
+
+
+def legacy_process_kwargs_timeout(method: MethodType, local_vars: dict[str, Any]) -> dict[str, Any]:
+    """`process_kwargs_timeout` до перехода на `CallPlan`: плоский `kwargs` из `locals()` метода"""
+    if not inspect.ismethod(method):
+        log_and_raise(
+            ValueError,
+            "Метод должен быть связан с экземпляром класса",
+            logger_name=__name__,
+            log_level="error",
+        )
+
+    instance = method.__self__
+    logger = get_log(f'{method.__self__.__class__.__name__}.{method.__name__}')
+    excluded_keys = {"self", "local_vars"}
+    raw_kwargs = {key: value for key, value in local_vars.items() if key not in excluded_keys}
+    nested_kwargs = raw_kwargs.pop("kwargs", {})
+    kwargs = {**raw_kwargs, **nested_kwargs}
+    instance_timeout = getattr(instance, "_request_timeout", None) or getattr(instance, "request_timeout", None)
+    kwargs["_request_timeout"] = kwargs.pop("_request_timeout", instance_timeout)
+    logger.debug(f'Параметры запроса в API: {{"kwargs": {kwargs}}}')
+    return kwargs
+
+
+def legacy_log_method_args(exclude_keys: list | None = None):
+    """`log_method_args` до перехода на `CallPlan`: `inspect.signature()` и `bind()` на каждом вызове"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not getattr(self, "debug", False):
+                return func(self, *args, **kwargs)
+            sig = inspect.signature(func)
+            try:
+                bound_args = sig.bind(self, *args, **kwargs)
+            except TypeError:
+                bound_args = sig.bind_partial(self, *args, **kwargs)
+            bound_args.apply_defaults()
+            exclude = exclude_keys or []
+            filtered_args = {
+                k: "******" if k in exclude else v
+                for k, v in bound_args.arguments.items()
+                if k != "self" and not k.startswith("_") and v is not None
+            }
+            method = f'{self.__class__.__name__}.{func.__name__}'
+            logger = get_log(method)
+            logger.debug(f'Вызов метода из теста: {make_text_ansi_name(method)} с параметрами: {filtered_args}')
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _Client:
+    """Клиент с методами в стиле `AirflowAPIClient` (без сетевого вызова)"""
+
+    def __init__(self, debug: bool):
+        self.debug = debug
+        self._request_timeout = (30, 60)
+        self.ping = lambda **kwargs: kwargs
+
+    @legacy_log_method_args()
+    @handle_api_errors
+    def get_dags_legacy(self, limit: int | None = 1000, offset: int | None = 0, order_by: str | None = "dag_id",
+                        **kwargs):
+        """Интроспекция на каждом вызове: `get_method_name()` + `process_kwargs_timeout(locals())`"""
+        kwargs = legacy_process_kwargs_timeout(getattr(self, legacy_get_method_name(self)), locals())
+        return self.ping(**kwargs)
+
+    @log_method_args()
+    @handle_api_errors
+    @inject_request_timeout
+    def get_dags(self, limit: int | None = 1000, offset: int | None = 0, order_by: str | None = "dag_id", **kwargs):
+        """План вызова строится при декорировании"""
+        return self.ping(limit=limit, offset=offset, order_by=order_by, **kwargs)
+
+    def get_dags_plain(self, limit: int | None = 1000, offset: int | None = 0, order_by: str | None = "dag_id",
+                       **kwargs):
+        """Без декораторов (нижняя граница)"""
+        kwargs.setdefault("_request_timeout", self._request_timeout)
+        return self.ping(limit=limit, offset=offset, order_by=order_by, **kwargs)
+
+
+def bench_call_plan(count: int = 20_000) -> dict[str, float]:
+    """
+    Накладные расходы декораторов на один вызов метода клиента (мкс)
+
+    :param count: Количество вызовов
+    :return: dict с результатами (мкс на вызов) при выключенном и включенном `debug`
+    """
+    result = {}
+    for debug in (False, True):
+        client = _Client(debug)
+        assert client.get_dags(limit=10) == client.get_dags_legacy(limit=10) == client.get_dags_plain(limit=10)
+        suffix = "debug" if debug else "no_debug"
+        for name, method in (
+                ("legacy", client.get_dags_legacy), ("plan", client.get_dags), ("plain", client.get_dags_plain)
+        ):
+            elapsed = min(timeit.repeat(lambda: method(limit=10, dag_id_pattern="person"), number=count, repeat=3))
+            result[f'{name}_{suffix}_us'] = round(elapsed / count * 1e6, 3)
+    return result
+
+
+if __name__ == "__main__":
+    print(bench_call_plan(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
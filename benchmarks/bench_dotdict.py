@@ -0,0 +1,97 @@
+"""bench_dotdict.py"""
+
+# Usage: python -m benchmarks.bench_dotdict [количество DAG Run в ответе]
+
+import sys
+import time
+import timeit
+from typing import Any
+
+from Utils.DotDict import DotDict as EagerDotDict
+from Utils.UpdatableDotDict import DotDict as UpdatableDotDict
+from Utils.UpdatableDotDict import LazyDotDict
+
+
+def _make_config(sections: int = 200, keys: int = 50) -> dict[str, Any]:
+    """Конфиг: `sections` разделов по `keys` вложенных настроек"""
+    return {
+        f"section_{i}": {
+            "host": {"name": f"host-{i}.example", "port": 8080, "schema": "https"},
+            "options": {f"option_{j}": {"enabled": True, "value": j} for j in range(keys)},
+        }
+        for i in range(sections)
+    }
+
+
+def _make_response(count: int) -> dict[str, Any]:
+    """Ответ `GET /dags/~/dagRuns` из `count` DAG Run"""
+    return {
+        "dag_runs": [
+            {
+                "dag_id": f"person_hdfs_s3_{i % 50}",
+                "dag_run_id": f"manual__{i}",
+                "state": "success",
+                "conf": {"source": {"path": f"/data/raw/{i}", "format": "parquet"}},
+            }
+            for i in range(count)
+        ],
+        "total_entries": count,
+    }
+
+
+def _construct(cls: type, data: dict[str, Any], repeat: int = 3) -> float:
+    """Время конструирования (мс, минимум из `repeat`)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cls(data)
+        best = min(best, time.perf_counter() - started)
+    return round(best * 1000, 3)
+
+
+def _access(getter) -> float:
+    """Время чтения (мкс на обращение): количество обращений подбирается `autorange()` (от 0.2 с на серию)"""
+    timer = timeit.Timer(getter)
+    number, _ = timer.autorange()
+    return round(min(timer.repeat(repeat=3, number=number)) / number * 1e6, 3)
+
+
+def bench_dotdict(count: int = 10_000) -> dict[str, dict[str, float]]:
+    """
+    Конструирование и чтение `Utils.DotDict.DotDict` (eager), `UpdatableDotDict.DotDict` (eager)
+    и `LazyDotDict` на большом конфиге и ответе API:
+        - construct_ms - конструирование
+        - config_read_us - чтение `config.section_7.host.port` (обертки уже закешированы)
+        - response_read_us - чтение `response.dag_runs[100].conf.source.path`
+          (`Utils.DotDict.DotDict` не конвертирует словари в списках: `response.dag_runs[100]["conf"]...`)
+        - first_read_ms - конструирование + одно чтение из ответа (сценарий "получить ответ и проверить поле")
+
+    :param count: Количество DAG Run в ответе
+    :return: dict с результатами по реализациям
+    """
+    config_data, response_data = _make_config(), _make_response(count)
+    result = {}
+    readers = {
+        "eager": lambda data: data.dag_runs[100]["conf"]["source"]["path"],
+        "updatable": lambda data: data.dag_runs[100].conf.source.path,
+        "lazy": lambda data: data.dag_runs[100].conf.source.path,
+    }
+    for name, cls in (("eager", EagerDotDict), ("updatable", UpdatableDotDict), ("lazy", LazyDotDict)):
+        read = readers[name]
+        config, response = cls(config_data), cls(response_data)
+        started = time.perf_counter()
+        assert read(cls(response_data)) == "/data/raw/100"
+        first_read = time.perf_counter() - started
+        result[name] = {
+            "config_construct_ms": _construct(cls, config_data),
+            "response_construct_ms": _construct(cls, response_data),
+            "config_read_us": _access(lambda: config.section_7.host.port),
+            "response_read_us": _access(lambda: read(response)),
+            "first_read_ms": round(first_read * 1000, 3),
+        }
+    return result
+
+
+if __name__ == "__main__":
+    for implementation, values in bench_dotdict(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000).items():
+        print(implementation, values)
@@ -0,0 +1,100 @@
+"""bench_flatten.py"""
+
+# Usage: python -m benchmarks.bench_flatten [размер ответа в МБ]
+
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, MutableMapping
+
+from helpers.report import get_flatten_dict, reformat_longest_str
+
+
+def recursive_flatten_dict(d: MutableMapping, parent_key: str = '', sep: str = '_') -> dict:
+    """Рекурсивный `get_flatten_dict` до перехода на `iter_flatten` (эталон для сравнения)"""
+    items = []
+    for key, value in d.items():
+        new_key = f'{parent_key}{sep}{key}' if parent_key else key
+        if isinstance(value, MutableMapping):
+            items.extend(recursive_flatten_dict(value, new_key, sep=sep).items())
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                items.extend(recursive_flatten_dict({f'{key}_{i}': item}, parent_key, sep=sep).items())
+        else:
+            items.append((new_key, value))
+    return dict(items)
+
+
+def recursive_reformat_longest_str(response_json: dict) -> dict:
+    """`reformat_longest_str` до перехода на `iter_flatten`: полный разбор, затем обрезка значений"""
+    response = recursive_flatten_dict(response_json)
+    for key, value in response.items():
+        if len(str(value)) > 50:
+            response[key] = f"{value[:20]}.....{value[25:50]}"
+    return response
+
+
+def _make_response(size_mb: float) -> dict[str, Any]:
+    """Ответ `GET /dags/~/dagRuns` с вложенными `conf` и задачами размером около `size_mb` МБ"""
+    dag_runs, size, i = [], 0, 0
+    while size < size_mb * 1024 * 1024:
+        dag_run = {
+            "dag_id": f"person_hdfs_s3_{i % 50}",
+            "dag_run_id": f"manual__2025-01-31T12:{i % 60:02d}:00+00:00",
+            "state": "success",
+            "conf": {"source": {"path": f"/data/raw/{i}", "format": "parquet"}, "options": {"retries": 3}},
+            "tasks": [
+                {"task_id": f"task_{j}", "state": "success", "try_number": 1, "log_url": "http://airflow/log" * 3}
+                for j in range(8)
+            ],
+        }
+        dag_runs.append(dag_run)
+        size += len(json.dumps(dag_run))
+        i += 1
+    return {"dag_runs": dag_runs, "total_entries": len(dag_runs)}
+
+
+def _measure(func, *args) -> tuple[float, float, Any]:
+    """Время (с, без tracemalloc) и пик памяти (МБ, отдельный вызов под tracemalloc) вызова"""
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def bench_flatten(size_mb: float = 5.0) -> dict[str, float]:
+    """
+    Разбор ответа размером `size_mb` МБ в плоский словарь:
+        - Полный разбор: рекурсивный `get_flatten_dict` и `get_flatten_dict` на `iter_flatten`
+        - Разбор для вложения отчета: `reformat_longest_str` без лимитов и с лимитами `REPORT_FLATTEN_*`
+
+    :param size_mb: Размер ответа (МБ JSON)
+    :return: dict с результатами (с, МБ)
+    """
+    response = _make_response(size_mb)
+    recursive_s, recursive_mb, expected = _measure(recursive_flatten_dict, response)
+    iterative_s, iterative_mb, result = _measure(get_flatten_dict, response)
+    assert result == expected
+    report_s, report_mb, _ = _measure(recursive_reformat_longest_str, response)
+    bounded_s, bounded_mb, bounded = _measure(reformat_longest_str, response)
+    return {
+        "keys": len(expected),
+        "recursive_s": round(recursive_s, 3),
+        "recursive_peak_mb": round(recursive_mb, 1),
+        "iterative_s": round(iterative_s, 3),
+        "iterative_peak_mb": round(iterative_mb, 1),
+        "report_recursive_s": round(report_s, 3),
+        "report_recursive_peak_mb": round(report_mb, 1),
+        "report_bounded_s": round(bounded_s, 4),
+        "report_bounded_peak_mb": round(bounded_mb, 2),
+        "report_bounded_keys": len(bounded),
+    }
+
+
+if __name__ == "__main__":
+    print(bench_flatten(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0))
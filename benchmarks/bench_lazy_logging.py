@@ -0,0 +1,57 @@
+"""bench_lazy_logging.py"""
+
+# Usage: python -m benchmarks.bench_lazy_logging [количество вызовов]
+
+import sys
+import timeit
+
+from libs.logging import StructLog, get_log
+
+LOG = get_log("bench_lazy_logging")  # уровень INFO (DEBUG выключен)
+SLOG = StructLog(LOG)
+
+METHOD = "POST"
+URL = "https://airflow.example/api/v1/dags/person_hdfs_s3/dagRuns"
+PARAMS = {"limit": 100, "offset": 0, "order_by": "-execution_date"}
+JSON = {"dag_run_id": "manual__2025-01-31T12:00:00+00:00", "logical_date": "2025-01-31T12:00:00Z", "conf": {}}
+HEADERS = {"Accept": "application/json", "Content-Type": "application/json", "User-Agent": "OpenAPI-Generator/2.6.0"}
+TIMEOUT = (30, 60)
+
+
+def eager_request_logging() -> None:
+    """Логирование запроса до миграции: словарь и f-строки строятся при каждом вызове"""
+    log_info = {"method": METHOD, "url": URL}
+    if PARAMS is not None:
+        log_info["params"] = PARAMS
+    if JSON is not None:
+        log_info["json"] = JSON
+    LOG.debug(f'Send Request | {log_info} ')
+    LOG.debug(f'Timeouts|Retries - Default: {TIMEOUT}; Used: {TIMEOUT}; (retries): {3}')
+    LOG.debug(f'Отправляемые заголовки: {HEADERS}')
+
+
+def lazy_request_logging() -> None:
+    """Логирование запроса после миграции (`StructLog`)"""
+    SLOG.debug("Send Request", method=METHOD, url=URL, params=PARAMS, json=JSON)
+    SLOG.debug("Timeouts|Retries", default=TIMEOUT, used=TIMEOUT, retries=3)
+    SLOG.debug("Отправляемые заголовки", headers=HEADERS)
+
+
+def bench_lazy_logging(count: int = 200_000) -> dict[str, float]:
+    """
+    CPU на логирование одного запроса клиента при выключенном DEBUG
+
+    :param count: Количество вызовов
+    :return: dict с результатами (мкс на запрос)
+    """
+    eager = min(timeit.repeat(eager_request_logging, number=count, repeat=3)) / count * 1e6
+    lazy = min(timeit.repeat(lazy_request_logging, number=count, repeat=3)) / count * 1e6
+    return {
+        "eager_us": round(eager, 3),
+        "lazy_us": round(lazy, 3),
+        "saved_us": round(eager - lazy, 3),
+    }
+
+
+if __name__ == "__main__":
+    print(bench_lazy_logging(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000))
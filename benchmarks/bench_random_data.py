@@ -0,0 +1,69 @@
+"""bench_random_data.py"""
+
+# Usage: python -m benchmarks.bench_random_data [количество payload]
+
+import random
+import sys
+import timeit
+from typing import Any
+from uuid import uuid4
+
+from faker import Faker
+
+from Utils.RandomData import RandomData
+
+
+class _LegacyRandomData:
+    """Вызов Faker / `random` на каждое значение (реализация до пулов)"""
+
+    def __init__(self):
+        self.fakers = {'ru': Faker('ru_RU'), 'en': Faker('en')}
+
+    def words(self, lang: str = 'ru', nb: int = 2, capitalize: bool = True, uuid: bool = False) -> str:
+        rand = ' '.join([_.capitalize() if capitalize else _ for _ in self.fakers[lang].words(nb=nb)])
+        return rand + (f' {uuid4()}' if uuid else '')
+
+    @staticmethod
+    def ints(length: int = 16) -> int:
+        return random.randint(10 ** (length - 1), 10**length - 1)
+
+
+def _payload(faker: Any) -> dict[str, Any]:
+    """Payload `tests/pet/conftest.py::swagger_data` (context='max')"""
+    return {
+        'name': faker.words(),
+        'photoUrls': [
+            f"https://img.freepik.com/free-photo/{_}.jpg"
+            for _ in faker.words(lang='en', capitalize=False, nb=faker.ints(length=1)).split()
+        ],
+        'category': {'id': faker.ints(length=4), 'name': faker.words(nb=1)},
+        'tags': [{'id': faker.ints(length=3), 'name': f'#{_}'} for _ in faker.words(nb=faker.ints(length=1)).split()],
+        'api_key': faker.words(nb=1, lang='en', uuid=True),
+    }
+
+
+def bench_random_data(count: int = 2000) -> dict[str, float]:
+    """
+    Пропускная способность генерации payload (payload/с) и стоимость seed теста (мкс)
+
+    :param count: Количество payload в замере
+    :return: dict с результатами
+    """
+    legacy, pooled = _LegacyRandomData(), RandomData()
+    result = {}
+    for name, faker in (("legacy", legacy), ("pooled", pooled)):
+        elapsed = min(timeit.repeat(lambda: _payload(faker), number=count, repeat=3))
+        result[f'{name}_payload_per_s'] = round(count / elapsed)
+
+    def seeded_test() -> dict[str, Any]:
+        pooled.seed_test("tests/pet/test_pet_POST.py::TestPetPOST::test_pet_post_positive")
+        return _payload(pooled)
+
+    assert seeded_test() == seeded_test(), "payload теста не воспроизводится при одинаковом seed"
+    elapsed = min(timeit.repeat(seeded_test, number=count // 10, repeat=3))
+    result["seed_and_first_payload_us"] = round(elapsed / (count // 10) * 1e6, 1)
+    return result
+
+
+if __name__ == "__main__":
+    print(bench_random_data(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,50 @@
+"""bench_session_data.py"""
+
+# Usage: python -m benchmarks.bench_session_data [количество тестов]
+
+import sys
+import time
+import tracemalloc
+
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.utils import convert_to_serializable
+
+
+def bench_session_data(count: int = 100_000) -> dict[str, float]:
+    """
+    Накладные расходы модели данных сессии на один тест:
+        - add_test + timing.start/stop + status (как в `SessionDataCollector.mark_test_start/stop`)
+        - Память на один тест (tracemalloc, без учета строк nodeid)
+        - Экспорт всей сессии (`convert_to_serializable`)
+
+    :param count: Количество тестов
+    :return: dict с результатами
+    """
+    nodeids = [f'tests/airflow/test_module_{i % 40}.py::TestClass{i % 7}::test_case_{i}' for i in range(count)]
+
+    tracemalloc.start()
+    session_data = SessionData()
+    started = time.perf_counter()
+    for nodeid in nodeids:
+        test_data = session_data.add_test(nodeid)
+        test_data.timing.start()
+        test_data.timing.stop()
+        test_data.status = "passed"
+    elapsed = time.perf_counter() - started
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    convert_to_serializable(session_data)
+    export = time.perf_counter() - started
+
+    return {
+        "tests": count,
+        "per_test_us": round(elapsed / count * 1e6, 2),
+        "per_test_bytes": round(memory / count),
+        "export_s": round(export, 3),
+    }
+
+
+if __name__ == "__main__":
+    print(bench_session_data(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,78 @@
+"""bench_session_serializer.py"""
+
+# Usage: python -m benchmarks.bench_session_serializer [количество тестов]
+
+import json
+import sys
+import time
+
+from libs.api.airflow import session_serializer
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.utils import convert_to_serializable
+
+
+def _make_session(count: int) -> SessionData:
+    """Сессия из `count` завершенных тестов с шагами и метаданными"""
+    session_data = SessionData()
+    session_data.session.start()
+    for i in range(count):
+        test_data = session_data.add_test(f'tests/airflow/test_module_{i % 40}.py::TestClass{i % 7}::test_case_{i}')
+        test_data.timing.start()
+        test_data.steps.extend(f'Шаг {step}: проверка DAG example_{i}' for step in range(3))
+        test_data.meta["owner"] = "airflow"
+        test_data.timing.stop()
+        test_data.status = "passed"
+    session_data.session.stop()
+    return session_data
+
+
+def _measure(encode, decode) -> dict[str, float]:
+    """Время кодирования/декодирования и размер результата"""
+    started = time.perf_counter()
+    payload = encode()
+    encoded = time.perf_counter() - started
+    started = time.perf_counter()
+    decode(payload)
+    decoded = time.perf_counter() - started
+    return {"encode_s": round(encoded, 3), "decode_s": round(decoded, 3), "size_mb": round(len(payload) / 2 ** 20, 2)}
+
+
+def bench_session_serializer(count: int = 100_000) -> dict[str, dict[str, float]]:
+    """
+    Сериализация данных большой сессии:
+        - baseline: `convert_to_serializable` + `json.dumps(indent=2)` / `json.loads`
+        - specialized_json: `session_to_dict` + стандартный json, загрузка в `SessionData`
+        - specialized_<backend>: то же с быстрым бэкендом (orjson, если установлен)
+
+    :param count: Количество тестов
+    :return: dict с результатами по вариантам
+    """
+    session_data = _make_session(count)
+    results = {
+        "baseline": _measure(
+            lambda: json.dumps(convert_to_serializable(session_data), indent=2, ensure_ascii=False).encode("utf-8"),
+            json.loads,
+        ),
+    }
+
+    backend = session_serializer.orjson
+    try:
+        session_serializer.orjson = None
+        results["specialized_json"] = _measure(
+            lambda: session_serializer.dumps(session_serializer.session_to_dict(session_data), indent=True),
+            lambda payload: session_serializer.session_from_dict(session_serializer.loads(payload)),
+        )
+    finally:
+        session_serializer.orjson = backend
+
+    if backend is not None:
+        results[f'specialized_{session_serializer.JSON_BACKEND}'] = _measure(
+            lambda: session_serializer.dumps(session_serializer.session_to_dict(session_data), indent=True),
+            lambda payload: session_serializer.session_from_dict(session_serializer.loads(payload)),
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in bench_session_serializer(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000).items():
+        print(name, result)
@@ -0,0 +1,91 @@
+"""bench_swagger_payload.py"""
+
+# Usage: python -m benchmarks.bench_swagger_payload [количество payload]
+
+import random
+import sys
+import time
+from typing import Any
+
+from libs.api.airflow.swagger_payload import PayloadFactory, get_payload_factory
+from libs.api.airflow.swagger_validator import get_schema_validators
+
+# Фрагмент спецификации Petstore (Swagger 2.0): тело POST /pet
+PETSTORE_SPEC = {
+    "swagger": "2.0",
+    "paths": {
+        "/pet": {"post": {"parameters": [{"in": "body", "name": "body", "schema": {"$ref": "#/definitions/Pet"}}]}},
+    },
+    "definitions": {
+        "Category": {"type": "object", "properties": {
+            "id": {"type": "integer", "format": "int64"}, "name": {"type": "string"},
+        }},
+        "Tag": {"type": "object", "properties": {
+            "id": {"type": "integer", "format": "int64"}, "name": {"type": "string"},
+        }},
+        "Pet": {"type": "object", "required": ["name", "photoUrls"], "properties": {
+            "id": {"type": "integer", "format": "int64"},
+            "category": {"$ref": "#/definitions/Category"},
+            "name": {"type": "string", "example": "doggie"},
+            "photoUrls": {"type": "array", "items": {"type": "string"}},
+            "tags": {"type": "array", "items": {"$ref": "#/definitions/Tag"}},
+            "status": {"type": "string", "enum": ["available", "pending", "sold"]},
+        }},
+    },
+}
+
+
+def _hand_built(rng: random.Random) -> dict[str, Any]:
+    """Payload "max", собранный вручную (как `context_min | context_max` до фабрики)"""
+    def word() -> str:
+        return "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=8))
+
+    return {
+        "name": word(),
+        "photoUrls": [f"https://img.freepik.com/free-photo/{word()}.jpg" for _ in range(rng.randint(1, 3))],
+        "category": {"id": rng.randint(1000, 9999), "name": word()},
+        "tags": [{"id": rng.randint(100, 999), "name": f"#{word()}"} for _ in range(rng.randint(1, 3))],
+    }
+
+
+def _rate(build, count: int) -> float:
+    """Payload в секунду"""
+    started = time.perf_counter()
+    build(count)
+    return round(count / (time.perf_counter() - started))
+
+
+def bench_swagger_payload(count: int = 50_000) -> dict[str, float]:
+    """
+    Стоимость компиляции фабрики и пропускная способность построения payload (payload/с)
+
+    :param count: Количество payload в замере
+    :return: dict с результатами
+    """
+    started = time.perf_counter()
+    factory = PayloadFactory(PETSTORE_SPEC)
+    factory["Pet"]
+    result = {"compile_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+    for key in ("first_lookup_us", "cached_lookup_us"):  # хеш спецификации, затем тот же объект без хеша (SpecCache)
+        started = time.perf_counter()
+        get_payload_factory(PETSTORE_SPEC)
+        result[key] = round((time.perf_counter() - started) * 1e6, 1)
+
+    rng = random.Random(0)
+    validators = get_schema_validators(PETSTORE_SPEC)
+    for mode in ("min", "max"):
+        for payload in factory.build_many("Pet", 100, mode, rng):
+            validators.validate("Pet", payload)
+
+    result["hand_built_per_s"] = _rate(lambda n: [_hand_built(rng) for _ in range(n)], count)
+    result["factory_min_per_s"] = _rate(lambda n: factory.build_many("Pet", n, "min", rng), count)
+    result["factory_max_per_s"] = _rate(lambda n: factory.build_many("Pet", n, "max", rng), count)
+    result["factory_boundary_per_s"] = _rate(
+        lambda n: [factory.boundary_payloads("Pet", rng) for _ in range(n // 15)], count // 15 * 15
+    )
+    return result
+
+
+if __name__ == "__main__":
+    print(bench_swagger_payload(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000))
@@ -6,12 +6,13 @@ import pytest
 from simple_settings import settings as cfg
 
 from libs.api.airflow.client import AirflowApiClient
+from libs.api.airflow.data_collector import SessionDataCollector
 
 
 @pytest.fixture(scope="session", name="airflow_client")
 def airflow_api_session() -> Iterator[AirflowApiClient]:
-    """Сессия REST-клиента airflow"""
-    session = AirflowApiClient()
+    """Сессия REST-клиента airflow (длительности запросов регистрируются в данных сессии)"""
+    session = AirflowApiClient(latency_hook=SessionDataCollector().record_latency)
 
     yield session
 
@@ -10,6 +10,7 @@ from simple_settings import settings as cfg
 
 from libs import get_log
 from .pytest_hook import *
+from .scheduling_hook import *
 
 LOG = get_log(__name__)
 
@@ -1,7 +1,15 @@
-__all__ = ['get_allure_decorator', 'log_dispatcher', 'pytest_configure']
+__all__ = [
+    'get_allure_decorator',
+    'log_dispatcher',
+    'pytest_configure',
+    'pytest_runtest_logfinish',
+    'pytest_runtest_logreport',
+    'pytest_runtest_logstart',
+]
 
 from datetime import datetime
-from os import linesep
+from os import getenv, linesep, path
+from socket import gethostname
 from typing import Any, Callable
 
 import pytest
@@ -9,30 +17,44 @@ import requests as r
 from validators import hostname as valid_hostname
 from validators import url as valid_url
 
-from Config import Config
+from Config import LOG_PATH, Config
 from Helpers.RequestsHelper import TestTimeout
+from Helpers.swagger_payload import get_payload_factory
+from Helpers.swagger_validator import get_schema_validators
 from tests import change_handler
+from Utils.IdAllocator import IdAllocator
 from Utils.RandomData import RandomData
+from Utils.report import AttachmentPipeline
 
-from .logger_hook import get_allure_decorator, log_dispatcher, pytest_configure
+from .logger_hook import (  # isort:skip
+    get_allure_decorator,
+    log_dispatcher,
+    pytest_configure,
+    pytest_runtest_logfinish,
+    pytest_runtest_logreport,
+    pytest_runtest_logstart,
+)  # isort:skip
 
 
 @pytest.fixture(scope='session', name='test_data')
-def preconditions_teardown(config: Config, faker: RandomData) -> Callable:
+def preconditions_teardown(config: Config, id_allocator: IdAllocator) -> Callable:
     """
     Фикстура выполняет следующие действия:
     preconditions:
         - Создает тестовые данные/объекты
         - Возвращает текущие тестовые данные/объекты тестовому классу
+        - Запрашивает SWAGGER один раз за сессию
+        - Возвращает валидаторы ответов, скомпилированные из `definitions` SWAGGER (кеш по хешу схемы)
+        - Возвращает фабрику payload, скомпилированную из `definitions` SWAGGER (кеш по хешу схемы)
     teardown:
-        - Очищает созданные тестами сущности
+        - Очищает созданные тестами сущности (только ID, выданные текущему процессу)
     :param config: Config: фикстура инициализации config
-    :param faker: RandomData: фикстура подготовки случайных данных
+    :param id_allocator: IdAllocator: фикстура выделения уникальных ID тестовых сущностей
     :return: Callable: параметризованную функцию, которая может быть вызвана в теле теста или другой фикстуры
     """
 
-    teardown_params = []
     query_data = {}
+    swagger_data = {}
 
     def _preconditions_teardown(pool, handler, method) -> dict:
         api_key = config.api_key
@@ -50,37 +72,39 @@ def preconditions_teardown(config: Config, faker: RandomData) -> Callable:
         query_data['headers'] = headers
         query_data['timeout'] = TestTimeout()
 
-        now = datetime.now().strftime('%H:%M:%S')
-        prefix = f"URL неверен: проверьте данные в config{linesep}Time: {now}"
+        if not swagger_data:
+            now = datetime.now().strftime('%H:%M:%S')
+            prefix = f"URL неверен: проверьте данные в config{linesep}Time: {now}"
 
-        swagger = r.get(**query_data) if valid_hostname(host.name) and valid_url(query_data['url']) else None
+            swagger = r.get(**query_data) if valid_hostname(host.name) and valid_url(query_data['url']) else None
 
-        if not swagger or swagger.status_code != 200:
-            raise ConnectionError(
-                f"SWAGGER_{prefix}{linesep}{swagger.text}{linesep}{swagger.request.method} "
-                f"{swagger.status_code} {swagger.url}{linesep}{query_data}{linesep}{swagger.request.headers}"
-                if swagger
-                else f"{prefix}{linesep}{query_data}"
-            )
-        print(f"{linesep}Time: {now}{linesep}Swagger version: {swagger.json()['swagger']} - OK!")
-        meta = swagger.json()['paths'][handler][method.lower()]
-        query_data['url'] = change_handler(query_data['url'], handler)
+            if not swagger or swagger.status_code != 200:
+                raise ConnectionError(
+                    f"SWAGGER_{prefix}{linesep}{swagger.text}{linesep}{swagger.request.method} "
+                    f"{swagger.status_code} {swagger.url}{linesep}{query_data}{linesep}{swagger.request.headers}"
+                    if swagger
+                    else f"{prefix}{linesep}{query_data}"
+                )
+            spec = swagger.json()
+            print(f"{linesep}Time: {now}{linesep}Swagger version: {spec['swagger']} - OK!")
+            swagger_data.update(spec=spec, validators=get_schema_validators(spec), payloads=get_payload_factory(spec))
 
-        test_ids = []
-        for _ in range(pool):
-            test_ids.append(faker.ints())
+        meta = swagger_data['spec']['paths'][handler][method.lower()]
+        query_data['url'] = change_handler(query_data['url'], handler)
 
-        teardown_params.append(test_ids)
+        test_ids = id_allocator.take(pool)
 
         return {
             'meta': meta,
             'query_data': query_data,
             'test_ids': test_ids,
+            'validators': swagger_data['validators'],
+            'payloads': swagger_data['payloads'],
         }
 
     yield _preconditions_teardown
 
-    teardown_params = [_ for __ in teardown_params for _ in __]
+    teardown_params = id_allocator.issued
 
     print(
         f"{linesep}Список идентификаторов тестовых сущностей `test_ids`, подлежащих удалению при `teardown`:{linesep}"
@@ -88,13 +112,14 @@ def preconditions_teardown(config: Config, faker: RandomData) -> Callable:
         else linesep
     )
 
+    base_url = query_data['url']
     for param in teardown_params:
         print(f"\t`{param}`")
-        query_data['url'] += f"/{param}"
+        url = f"{base_url}/{param}"
 
-        res = r.delete(**query_data)
+        res = r.delete(**{**query_data, 'url': url})
         assert any([res.status_code == 200, res.status_code == 404])
-        res = r.get(**query_data)
+        res = r.get(**{**query_data, 'url': url})
         assert res.status_code == 404
         assert res.json()['message'] == 'Pet not found' or 'null for uri' in res.json()['message']
 
@@ -109,6 +134,21 @@ def config() -> Config:
     return Config()
 
 
+@pytest.fixture(scope='session')
+def id_allocator() -> IdAllocator:
+    """
+    Фикстура распределителя уникальных ID тестовых сущностей между воркерами xdist
+     - выданные ID записываются в журнал `.log/test_ids_<host>_<timestamp>[_<worker>].txt`
+    :return: экземпляр IdAllocator
+    """
+
+    worker_id = getenv('PYTEST_XDIST_WORKER')
+    journal_name = f"test_ids_{gethostname()}_{RandomData.timestamp()}{f'_{worker_id}' if worker_id else ''}.txt"
+    allocator = IdAllocator(journal_path=path.join(LOG_PATH, journal_name))
+    yield allocator
+    allocator.close()
+
+
 @pytest.fixture(scope='session')
 def faker() -> RandomData:
     """
@@ -133,6 +173,48 @@ def expected_value(request) -> Any:
     return request.param
 
 
+def pytest_report_header(config):
+    """
+    Заголовок сессии: базовый seed случайных данных для воспроизведения прогона
+    :param config: служебная фикстура pytest
+    """
+
+    return f"random data: RANDOM_SEED={RandomData().base_seed}"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Хук фазы setup: seed случайных данных теста (базовый seed сессии + nodeid) до подготовки фикстур
+    :param item: тест
+    """
+
+    RandomData().seed_test(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True, trylast=True)
+def pytest_runtest_call(item):
+    """
+    Хук фазы call: готовые вложения запросов `AttachmentPipeline` добавляются в отчет теста
+    :param item: тест
+    """
+
+    yield
+    AttachmentPipeline.get().drain()
+
+
+@pytest.hookimpl(hookwrapper=True, trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """
+    Хук фазы teardown: оставшиеся вложения запросов, сводка пропущенных вложений, сброс бюджета теста
+    :param item: тест
+    :param nextitem: следующий тест
+    """
+
+    yield
+    AttachmentPipeline.get().drain(end_of_test=True)
+
+
 def pytest_emoji_passed(config):
     """PASSED"""
 
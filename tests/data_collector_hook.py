@@ -8,6 +8,8 @@ __all__ = [
     "pytest_runtest_logreport",
     "pytest_runtest_protocol",
     "pytest_sessionfinish",
+    "pytest_terminal_summary",
+    "pytest_testnodedown",
     # "pytest_sessionstart", TODO: уточнить
     # "pytest_unconfigure" TODO: устранить ошибки
 ]
@@ -20,9 +22,14 @@ import pytest
 from _pytest.reports import TestReport
 from _pytest.runner import runtestprotocol
 from libs.api.airflow.data_collector import SessionDataCollector
+from libs.api.airflow.perf_regression import PerfBaseline, Regression
+from libs.api.airflow.session_history import SessionHistory
 from libs.api.airflow.helpers import (
     get_debug_flag,
     get_local_time,
+    get_worker_file_path,
+    get_xdist_worker_id,
+    is_xdist_controller,
     make_text_ansi_name,
     make_text_ansi_error,
     make_text_ansi_warning,
@@ -35,11 +42,19 @@ LOG = get_log("pytest_hook", cr_mark_after="-#-")
 debug = get_debug_flag()
 
 
+def _flush_log() -> None:
+    """Вывод записей из очереди логгера (`LOG_QUEUED=True`) до прямой записи в `stdout` и отчетов Pytest"""
+    for handler in LOG.handlers:
+        handler.flush()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def data_collector() -> Iterator[SessionDataCollector]:
+def data_collector(request) -> Iterator[SessionDataCollector]:
     """
     Фикстура для сбора данных тестовой сессии:
         - Сохраняет собранные данные в JSON-файл после завершения сессии
+        - При `SESSION_DATA_STREAMING=True` записывает каждый тест строкой в JSONL-файл по мере выполнения
+        - В воркере pytest-xdist пишет в собственный файл воркера (Ex: `test_results.gw0.jsonl`)
 
     Ex: Задание имени JSON-файла:
         session_file = sdc.stop_session(filename=path.join(PROJECT_ROOT_DIR, "Path"))
@@ -61,6 +76,15 @@ def data_collector() -> Iterator[SessionDataCollector]:
     """
     sdc = SessionDataCollector()
     sdc.start_session()
+    if cfg.SESSION_DATA_STREAMING:
+        filename = path.join(request.config.rootpath, "log", "test_results.jsonl")
+        if worker_id := get_xdist_worker_id(request.config):
+            filename = get_worker_file_path(filename, worker_id)
+        sdc.start_streaming(
+            filename,
+            fsync_every=cfg.SESSION_DATA_FSYNC_EVERY,
+            fsync_interval=cfg.SESSION_DATA_FSYNC_INTERVAL,
+        )
 
     yield sdc
 
@@ -150,6 +174,7 @@ def pytest_runtest_logreport(report):
         - Окончание теста фиксируется по условию любого окончания фазы `call` для теста
     :param report: pytest log report
     """
+    _flush_log()
     sdc = SessionDataCollector()
 
     if report.when == "setup" and report.passed:
@@ -189,6 +214,7 @@ def pytest_report_teststatus(report):
     if report.when == "teardown":
         # Проверяем, что IO идет из/в TTY (`Interactive Terminal`), а не в IDE (из окна CODE в окно RUN)
         if stdin.isatty() and stdout.isatty() and debug:
+            _flush_log()
             stdout.write(linesep * 2 + cfg.LINE_SEPARATOR + linesep)
             stdout.flush()
 
@@ -205,12 +231,107 @@ def pytest_sessionstart(session):  # TODO: разобраться
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """Хук для завершения всей сессии тестов"""
+    """
+    Хук для завершения всей сессии тестов
+        - Без xdist: данные сессии сохраняются в `log/test_results.json`
+        - Воркер xdist: данные сохраняются в файл воркера, путь передается контроллеру через `workeroutput`
+        - Контроллер xdist: файлы воркеров объединяются в `log/test_results.json` со статистикой воркеров,
+          без данных воркеров сохраняются данные контроллера
+        - При заданном `PERF_BASELINE_FILE` прогон сравнивается с базовой линией (`_check_performance()`)
+        - При заданном `SESSION_HISTORY_DB` итоговый файл сессии загружается в базу истории таймингов
+    """
+    _flush_log()
     if stdin.isatty() and stdout.isatty() and debug:
         stdout.write(cfg.LINE_TEAR_DOWN + linesep + cfg.LINE_SEPARATOR + linesep)
         stdout.flush()
     sdc = SessionDataCollector()
-    sdc.save_session_data(path.join(session.path, "log", "test_results.json"))
+    filename = path.join(session.path, "log", "test_results.json")
+
+    if worker_id := get_xdist_worker_id(session.config):
+        worker_file = get_worker_file_path(filename, worker_id)
+        if cfg.SESSION_DATA_STREAMING:
+            worker_file = worker_file.with_suffix(".jsonl")
+        if sdc.save_session_data(worker_file):
+            session.config.workeroutput["session_data_file"] = str(worker_file)
+        return
+    if is_xdist_controller(session.config):
+        sdc.merge_worker_sessions()
+    if cfg.PERF_BASELINE_FILE:
+        _check_performance(session, sdc)
+    saved = sdc.save_session_data(filename)
+
+    if saved and cfg.SESSION_HISTORY_DB:
+        with SessionHistory(cfg.SESSION_HISTORY_DB) as history:
+            history.ingest(sdc.session_file)
+
+
+def _check_performance(session, sdc: SessionDataCollector) -> None:
+    """
+    Сравнение длительностей тестов и запросов прогона с базовой линией `PERF_BASELINE_FILE`:
+        - Отчет сохраняется в данные сессии (`performance` в JSON) и выводится в `pytest_terminal_summary`
+        - При превышении бюджета `PERF_REGRESSION_BUDGET` успешная сессия завершается с кодом TESTS_FAILED
+        - При `PERF_BASELINE_UPDATE=True` значения прогона добавляются в базовую линию
+    :param session: pytest session
+    :param sdc: SessionDataCollector
+    """
+    baseline_file = path.join(session.path, cfg.PERF_BASELINE_FILE)
+    baseline = PerfBaseline.load(baseline_file)
+    durations = sdc.test_durations()
+    report = baseline.compare(
+        durations,
+        sdc.data.latencies,
+        threshold=cfg.PERF_REGRESSION_Z,
+        min_delta=cfg.PERF_REGRESSION_MIN_DELTA,
+        min_ratio=cfg.PERF_REGRESSION_MIN_RATIO,
+        budget=cfg.PERF_REGRESSION_BUDGET,
+    )
+    sdc.data.performance = report.to_dict()
+    for regression in report.regressions:
+        LOG.warning(f'Регрессия производительности | {regression}')
+    if report.budget_exceeded and session.exitstatus == pytest.ExitCode.OK:
+        LOG.error(f'Превышен бюджет замедления: {report.total_delta}s > {report.budget}s')
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if cfg.PERF_BASELINE_UPDATE:
+        baseline.update(durations, sdc.data.latencies)
+        baseline.save(baseline_file)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Хук выводит в итоги сессии регрессии производительности из отчета `_check_performance()`
+    :param terminalreporter: pytest TerminalReporter
+    """
+    if get_xdist_worker_id(config) or (performance := SessionDataCollector().data.performance) is None:
+        return
+    regressions = performance["regressions"]
+    terminalreporter.section("performance regressions", red=bool(regressions), green=not regressions)
+    terminalreporter.write_line(
+        f'Сравнено тестов: {performance["compared_tests"]} | '
+        f'эндпоинтов: {performance["compared_endpoints"]} | '
+        f'Регрессий: {len(regressions)} | '
+        f'Замедление: {performance["total_delta"]}s | '
+        f'Бюджет: {performance["budget"] if performance["budget"] is not None else "N/A"}'
+    )
+    for regression in regressions:
+        terminalreporter.write_line(str(Regression(**regression)), red=True)
+    if performance["budget_exceeded"]:
+        terminalreporter.write_line("Бюджет замедления превышен: сессия завершена с ошибкой", red=True, bold=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Хук pytest-xdist: завершение воркера (на контроллере)
+        - Регистрирует файл данных сессии воркера для объединения в `pytest_sessionfinish`
+    :param node: WorkerController
+    :param error: Ошибка воркера (None при штатном завершении)
+    """
+    worker_file = getattr(node, "workeroutput", {}).get("session_data_file")
+    if worker_file:
+        SessionDataCollector().add_worker_file(node.gateway.id, worker_file)
+    elif error:
+        LOG.warning(f'Воркер {node.gateway.id} завершился без данных сессии: {error}')
 
 
 def pytest_unconfigure(config):  # TODO: разобраться
@@ -3,12 +3,13 @@
 import logging
 import re
 import warnings
-from os import getenv, linesep, path
+from os import environ, getenv, linesep, path
 
 import pytest
 from _socket import gethostname
 
-from Config import DEBUG, LOG_PATH
+from Config import DEBUG, LOG_PATH, LOG_TAIL_CAPACITY, LOG_TAIL_ON_FAILURE
+from Utils.logging import TailLogBuffer, add_tail_buffer
 from Utils.RandomData import RandomData as Faker
 
 from Utils.functions import (  # isort:skip
@@ -32,6 +33,8 @@ def pytest_configure(config: pytest.Config):
      - распределяет лог-файлы между workers при запуске прогона с опцией xdist
      - удаляет пустые лог-файлы от прошлых прогонов (возможно с опцией xdist)
      - определяет цвет отображения меток `log_level`: [INFO] в консоли
+     - подключает к логу консоли и файла буфер DEBUG-записей теста при env.LOG_TAIL_ON_FAILURE
+     - передает воркерам xdist базовый seed случайных данных сессии (env.RANDOM_SEED)
      - scope: session
     :param config: служебная фикстура pytest
     """
@@ -43,6 +46,8 @@ def pytest_configure(config: pytest.Config):
 
     if worker_id:
         logfile_name = f"{logfile_name}_{worker_id}"
+    else:
+        environ.setdefault('RANDOM_SEED', Faker().base_seed)
     logfile_path = path.join(LOG_PATH, f"{logfile_name}.log")
 
     logging_plugin = config.pluginmanager.get_plugin("logging-plugin")
@@ -55,6 +60,42 @@ def pytest_configure(config: pytest.Config):
         add_color(logging.WARNING, 'bold', 'black', 'Yellow')
         add_color(logging.ERROR, 'invert', 'red', 'Black')
 
+    if LOG_TAIL_ON_FAILURE:
+        add_tail_buffer(logging_plugin.log_file_handler)
+        add_tail_buffer(logging_plugin.log_cli_handler)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """
+    Хук начала теста: DEBUG-записи теста откладываются в кольцевой буфер `TailLogBuffer` (env.LOG_TAIL_ON_FAILURE)
+    :param nodeid: идентификатор теста
+    :param location: расположение теста
+    """
+
+    if LOG_TAIL_ON_FAILURE:
+        TailLogBuffer.start(LOG_TAIL_CAPACITY)
+
+
+def pytest_runtest_logreport(report: pytest.TestReport):
+    """
+    Хук отчета фазы теста: при падении (setup/call/teardown) отложенные DEBUG-записи выводятся в лог
+     - записи после падения выводятся сразу, без буферизации
+    :param report: отчет фазы теста
+    """
+
+    if report.failed:
+        TailLogBuffer.flush()
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """
+    Хук завершения теста: отложенные DEBUG-записи прошедшего теста отбрасываются
+    :param nodeid: идентификатор теста
+    :param location: расположение теста
+    """
+
+    TailLogBuffer.stop()
+
 
 @pytest.fixture()
 def log_dispatcher(caplog, get_allure_decorator, request):
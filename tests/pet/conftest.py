@@ -5,18 +5,22 @@ import pytest
 from tests import change_handler
 from Utils import lookup_report
 
-swagger_missing_info = {  # TODO #1 - добавить в Swagger.json эти параметры для HANDLER: /pet METHOD: POST
-    "parameters": [
-        {
-            "name": "status",
-            "items": {
-                "default": "available",
-                "enum": ["available", "pending", "sold"],
-                "type": "string",
-            },
-        }
-    ]
-}
+
+def pet_text(faker) -> Callable:
+    """
+    Строковые значения payload схем Pet, Category, Tag для `PayloadFactory` (данные в стиле RandomData)
+    :param faker: фикстура подготовки случайных данных
+    :return: Callable: `text(schema, key)`
+    """
+
+    def _pet_text(schema: str, key: str) -> str:
+        if key == 'photoUrls':
+            return f"https://img.freepik.com/free-photo/{faker.words(lang='en', capitalize=False, nb=1)}.jpg"
+        if schema == 'Tag':
+            return f'#{faker.words(nb=1)}'
+        return faker.words(nb=2 if schema == 'Pet' else 1)
+
+    return _pet_text
 
 
 @pytest.fixture(scope='class', name='pet_data')
@@ -35,18 +39,9 @@ def swagger_data(test_data, faker) -> Callable:
         _url = swagger_data['query_data']['url']
         swagger_data['query_data']['url'] = change_handler(_url) if '/{' in handler else _url
 
-        if 'items' in swagger_data['meta']['parameters'][0].keys():
-            swagger_var_params = swagger_data['meta']['parameters']
-        elif handler == '/pet' and method == 'POST':  # TODO #1 убрать после решения
-            swagger_var_params = swagger_missing_info['parameters']
-        else:
-            swagger_var_params = []
-
-        var_params = {}
-        if swagger_var_params:
-            for param in swagger_var_params:
-                var_params[param['name']] = param['items']
-
+        payloads = swagger_data['payloads']
+        var_params = payloads.operation_enums(handler, method)
+        if var_params:
             count = len([enum for param in var_params for enum in var_params[param]['enum']])
             assert teardown_pool >= count, (
                 f"Необходимо установить число выделяемых слотов (сейчас это {teardown_pool}) "
@@ -56,32 +51,9 @@ def swagger_data(test_data, faker) -> Callable:
 
         swagger_data['variables'] = var_params
 
-        context_min = {
-            'name': faker.words(),
-            'photoUrls': [
-                f"https://img.freepik.com/free-photo/{_}.jpg"
-                for _ in faker.words(lang='en', capitalize=False, nb=faker.ints(length=1)).split()
-            ],
-        }
-
-        context_max = {
-            'category': {
-                'id': faker.ints(length=4),
-                'name': faker.words(nb=1),
-            },
-            'tags': [
-                {
-                    'id': faker.ints(length=3),
-                    'name': f'#{_}',
-                }
-                for _ in faker.words(nb=faker.ints(length=1)).split()
-            ],
-        }
-
-        if context == 'min':
-            swagger_data['payload'] = context_min
-        if context == 'max':
-            swagger_data['payload'] = context_min | context_max
+        payload = payloads.build('Pet', mode=context, rng=faker.rng, text=pet_text(faker))
+        payload.pop('id', None)  # `id` создаваемых сущностей берется из `test_ids` (очистка при teardown)
+        swagger_data['payload'] = payload
 
         return swagger_data
 
@@ -33,7 +33,7 @@ class TestCheckPetPOST:
             POST /<HANDLER>
             - создание записи с полным перечнем параметров
             - создание записи со всеми вариантами списочных параметров (Swagger.json)
-            - параметры ответа (HTTP 200, JSON)
+            - параметры ответа (HTTP 200, JSON, схема `Pet` из Swagger.json)
             - проверка идемпотентности
             - постпроверка параметров записи методом GET
         :param data: фикстура подготовки тестовых данных для этого класса тестов
@@ -51,6 +51,7 @@ class TestCheckPetPOST:
                 new_pet = r.post(**query_data)
                 assert new_pet.status_code == 200
                 assert new_pet.json() == query_data['json']
+                data['validators'].validate('Pet', new_pet.json())
 
                 twice_new_pet = r.post(**query_data)
                 assert twice_new_pet.status_code == 200  # 400 TODO #2 - !!!нет идемпотентности у POST!!!
@@ -0,0 +1,72 @@
+"""scheduling_hook"""
+
+__all__ = [
+    "pytest_collection_modifyitems",
+]
+
+from os import path
+
+import pytest
+from libs.api.airflow.helpers import get_xdist_worker_id, make_text_ansi_name
+from libs.api.airflow.test_scheduler import load_durations, plan_lpt
+from simple_settings import settings as cfg
+
+from libs import get_log
+
+LOG = get_log("scheduling_hook")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Хук планирования тестов по исторической длительности для pytest-xdist (`TEST_SCHEDULING_LPT=True`):
+        - Выполняется в каждом воркере до добавления xdist суффиксов групп: план детерминирован,
+          поэтому порядок сбора во всех воркерах совпадает
+        - Тесты упорядочиваются LPT-first по единицам `TEST_SCHEDULING_SCOPE` (класс/модуль - общие фикстуры):
+          планировщики `load`, `loadscope`, `loadfile` раздают самые длинные единицы первыми
+        - При `--dist loadgroup` единицы дополнительно распределяются по воркерам (`xdist_group("lpt_<N>")`);
+          тесты с собственной `xdist_group` сохраняют свою группу
+        - Длительности: база истории `SESSION_HISTORY_DB`, иначе `log/test_results.json` прошлой сессии
+    :param session: pytest session
+    :param config: pytest config
+    :param items: Собранные тесты (изменяется на месте)
+    """
+    worker_id = get_xdist_worker_id(config)
+    if not cfg.TEST_SCHEDULING_LPT or worker_id is None or not items:
+        return
+
+    durations = load_durations(
+        history_db=cfg.SESSION_HISTORY_DB or None,
+        session_file=path.join(config.rootpath, "log", "test_results.json"),
+        percentile=cfg.TEST_SCHEDULING_PERCENTILE,
+    )
+    groups = {}
+    for item in items:
+        if (mark := item.get_closest_marker("xdist_group")) is not None:
+            groups[item.nodeid] = mark.args[0] if mark.args else mark.kwargs.get("name", "default")
+
+    plan = plan_lpt(
+        [item.nodeid for item in items],
+        durations,
+        workers=config.workerinput.get("workercount", 1),
+        scope=cfg.TEST_SCHEDULING_SCOPE,
+        groups=groups,
+    )
+    by_nodeid = {item.nodeid: item for item in items}
+    items[:] = [by_nodeid[nodeid] for nodeid in plan.order]
+
+    if config.getvalue("dist") == "loadgroup":
+        for index, units in enumerate(plan.bins):
+            for unit in units:
+                for nodeid in plan.units[unit]:
+                    by_nodeid[nodeid].add_marker(pytest.mark.xdist_group(f'lpt_{index}'))
+
+    if worker_id == "gw0":
+        LOG.info(
+            f'Планирование LPT | '
+            f'Тестов: {make_text_ansi_name(len(items))} | '
+            f'С историей: {make_text_ansi_name(sum(nodeid in durations for nodeid in by_nodeid))} | '
+            f'Единиц: {make_text_ansi_name(len(plan.units))} | '
+            f'Оценка makespan: {make_text_ansi_name(plan.makespan)} (с) | '
+            f'Загрузка воркеров: {plan.bin_loads}'
+        )
@@ -0,0 +1,143 @@
+"""api_decorators_unit_tests"""
+
+import inspect
+import logging
+
+import pytest
+
+from libs.api.airflow.decorators import (
+    CallPlan, get_call_plan, handle_api_errors, inject_request_timeout, log_method_args,
+)
+
+
+class _Collect(logging.Handler):
+    """Обработчик, сохраняющий сообщения"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def capture_log():
+    """Сообщения логгера `<Class>.<method>` на уровне DEBUG"""
+    attached = []
+
+    def capture(logger: logging.Logger) -> list[str]:
+        handler = _Collect()
+        attached.append((logger, handler, logger.level))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        return handler.messages
+
+    yield capture
+    for logger, handler, level in attached:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+
+class _Client:
+    """Клиент с методами в стиле `AirflowAPIClient`"""
+
+    def __init__(self, debug: bool = True, timeout: tuple | None = (30, 60)):
+        self.debug = debug
+        self._request_timeout = timeout
+
+    @log_method_args(exclude_keys=["password"])
+    @handle_api_errors
+    @inject_request_timeout
+    def get_dags(self, limit: int | None = 1000, offset: int | None = 0, password: str | None = None, **kwargs):
+        return {"limit": limit, "offset": offset, "password": password, **kwargs}
+
+    @handle_api_errors
+    def fail(self, **kwargs):
+        raise ValueError("bad value")
+
+
+def _f_simple(self, a, b=2, *args, c, d=4, **kwargs):
+    return None
+
+
+def _f_positional_only(self, a, /, b=None):
+    return None
+
+
+def _f_no_var(self, limit=10, offset=0):
+    return None
+
+
+_CALLS = [
+    (_f_simple, (object(), 1), {"c": 3}),
+    (_f_simple, (object(), 1, 5, 6, 7), {"c": 3, "e": 8, "d": None}),
+    (_f_simple, (object(),), {"a": 1, "c": 3, "b": 0}),
+    (_f_positional_only, (object(), 1), {}),
+    (_f_positional_only, (object(), 1, 2), {}),
+    (_f_no_var, (object(),), {"offset": 5}),
+    (_f_no_var, (object(), 1, 2), {}),
+]
+
+
+class TestCallPlan:
+
+    @pytest.mark.parametrize("func, args, kwargs", _CALLS)
+    def test_bind_equals_signature(self, func, args, kwargs):
+        """`CallPlan.bind()` совпадает с `inspect.Signature.bind()` + `apply_defaults()`: значения и порядок"""
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        assert list(CallPlan(func).bind(args, kwargs).items()) == list(bound.arguments.items())
+
+    def test_plan_shared_by_decorators(self):
+        """План строится один раз и общий для всех декораторов метода"""
+        plan = get_call_plan(_Client.get_dags)
+        assert get_call_plan(inspect.unwrap(_Client.get_dags)) is plan
+        assert plan.var_keyword == "kwargs" and plan.positional == ("self", "limit", "offset", "password")
+
+    def test_method_logger_cached_per_class(self):
+        """Имя метода и логгер - по классу экземпляра, кешируются"""
+        plan = get_call_plan(_Client.get_dags)
+        subclass = type("_SubClient", (_Client,), {})
+        assert plan.method(_Client())[0] == "_Client.get_dags"
+        assert plan.method(subclass())[0] == "_SubClient.get_dags"
+        assert plan.method(_Client()) is plan.method(_Client())
+
+
+class TestDecorators:
+
+    def test_inject_request_timeout(self):
+        """Таймаут экземпляра подставляется, если не задан при вызове"""
+        assert _Client().get_dags(limit=1)["_request_timeout"] == (30, 60)
+        assert _Client().get_dags(_request_timeout=5)["_request_timeout"] == 5
+
+    def test_inject_request_timeout_requires_kwargs(self):
+        """Метод без `**kwargs` отклоняется при декорировании"""
+        with pytest.raises(TypeError, match="должен принимать \\*\\*kwargs"):
+            inject_request_timeout(_f_no_var)
+
+    def test_debug_logs(self, capture_log):
+        """При DEBUG логируются вызов метода (с маскированием) и параметры запроса плоским словарем"""
+        client = _Client()
+        messages = capture_log(get_call_plan(_Client.get_dags).method(client)[1])
+        client.get_dags(5, password="secret", dag_id_pattern="person")
+        assert messages[0].endswith(
+            "с параметрами: {'limit': 5, 'offset': 0, 'password': '******', 'kwargs': {'dag_id_pattern': 'person'}}"
+        )
+        assert messages[1] == (
+            'Параметры запроса в API: {"kwargs": {\'limit\': 5, \'offset\': 0, \'password\': \'secret\', '
+            '\'dag_id_pattern\': \'person\', \'_request_timeout\': (30, 60)}}'
+        )
+
+    def test_no_debug_logs(self, capture_log):
+        """Без флага `debug` вызов метода не логируется"""
+        client = _Client(debug=False)
+        messages = capture_log(get_call_plan(_Client.get_dags).method(client)[1])
+        client.get_dags()
+        assert not any("Вызов метода" in message for message in messages)
+
+    def test_handle_api_errors(self):
+        """Ошибка метода пробрасывается с исходным исключением в `__cause__`"""
+        with pytest.raises(ValueError, match="bad value") as error:
+            _Client().fail()
+        assert isinstance(error.value.__cause__, ValueError)
@@ -0,0 +1,102 @@
+"""checker_unit_tests"""
+
+import pytest
+
+from libs.api.airflow.checker import Checker, PathSelector
+from libs.api.airflow.json_column import JsonColumn
+
+DAGS = {"dags": [{"schedule_interval": {"value": "x"}}, {"schedule_interval": None}, {}]}
+
+
+class TestColumns:
+
+    def test_null_parent_keeps_positions(self):
+        """null или отсутствующий промежуточный сегмент дает None в колонке на каждый элемент `[*]`"""
+        column = Checker.get_column(DAGS, "dags.[*].schedule_interval.value")
+        assert column.values == ["x", None, None], f"Некорректная колонка: {column.values}"
+
+    def test_null_parent_nested_wildcard(self):
+        """None получают все пути поддерева, в т.ч. под вложенным `[*]` и индексом"""
+        data = {"dags": [{"tags": [{"name": "a"}]}, {"tags": None}, {"tags": "x"}]}
+        columns = Checker.get_columns(data, ["dags.[*].tags.[*].name", "dags.[*].tags.[0].name"])
+        assert columns["dags.[*].tags.[*].name"].values == ["a", None, None]
+        assert columns["dags.[*].tags.[0].name"].values == ["a", None, None]
+
+    def test_not_null_fails_on_null_parent(self):
+        """`not_null` не проходит, если промежуточный сегмент null"""
+        with pytest.raises(AssertionError, match="Элемент #2"):
+            Checker.validate_columns(DAGS, not_null="dags.[*].schedule_interval.value")
+
+    def test_get_value_skips_null(self):
+        """Без keep_null отсутствующие значения пропускаются (`get_value`)"""
+        assert Checker.get_value(DAGS, "dags.[*].schedule_interval.value") == ["x"]
+
+    def test_get_value_unique_objects(self):
+        """`unique=True` для dict/list значений - сравнение на равенство, порядок первого вхождения"""
+        data = {"dags": [
+            {"tags": [{"name": "a"}], "owners": ["x"], "id": 1},
+            {"tags": [{"name": "b"}], "owners": ["x"], "id": 1},
+            {"tags": [{"name": "a"}], "owners": ["y"], "id": 2},
+        ]}
+        assert Checker.get_value(data, "dags.[*].tags.[*]", unique=True) == [{"name": "a"}, {"name": "b"}]
+        assert Checker.get_value(data, "dags.[*].owners", unique=True) == [["x"], ["y"]]
+        assert Checker.get_value(data, "dags.[*].{id}", unique=True) == [{"id": 1}, {"id": 2}]
+
+
+class TestJsonColumn:
+
+    def test_unhashable_unique(self):
+        """Уникальность dict/list значений проверяется без хеширования"""
+        assert JsonColumn("p", [{"a": 1}, {"a": 2}, [1]]).is_unique()
+        column = JsonColumn("p", [{"a": 1}, [1], {"a": 1}])
+        assert not column.is_unique()
+        assert column.duplicates() == [({"a": 1}, 2)]
+
+    def test_unhashable_not_in(self):
+        """Недопустимые dict/list значения возвращаются без повторов"""
+        column = JsonColumn("p", [{"a": 1}, {"a": 2}, {"a": 2}, None])
+        assert column.not_in([{"a": 1}, None]) == [{"a": 2}]
+        assert JsonColumn("p", ["a", "b"]).not_in({"a"}) == {"b"}
+
+    def test_validate_columns_unhashable(self):
+        """`validate_columns` проверяет unique и allowed_values для dict-значений"""
+        with pytest.raises(AssertionError, match="не уникальны"):
+            Checker.validate_columns(DAGS, unique="dags.[*].schedule_interval")
+        with pytest.raises(AssertionError, match="Недопустимые значения"):
+            Checker.validate_columns(DAGS, allowed_values={"dags.[*].schedule_interval": [None]})
+
+
+class TestPathSelector:
+
+    ITEMS = {"items": [
+        {"id": "a", "v": 1}, {"id": "b", "v": True}, {"id": "c", "v": 1.0}, {"id": "d", "v": "1.5"},
+        {"id": "e", "v": 1.5}, {"id": "f", "v": None}, {"id": "g", "v": "null"}, {"id": "h", "v": "a|b"},
+    ]}
+
+    @pytest.mark.parametrize("selector, expected", [
+        ("[?v=1]", ["a", "c"]),
+        ("[?v=true]", ["b"]),
+        ("[?v=1.5]", ["d", "e"]),
+        ('[?v="1.5"]', ["d"]),
+        ("[?v=null]", ["f"]),
+        ("[?v='null']", ["g"]),
+        ('[?v="a|b"|1]', ["a", "c", "h"]),
+        ("[?v!=1]", ["b", "d", "e", "f", "g", "h"]),
+        ("[?v]", ["a", "b", "c", "d", "e", "g", "h"]),
+    ])
+    def test_filter_literals(self, selector, expected):
+        """Фильтр сравнивает значения с учетом типа: bool не равен числу, строка в кавычках - только строке"""
+        assert Checker.get_value(self.ITEMS, f"items.{selector}.id") == expected, f"Фильтр {selector}"
+
+    def test_slice_and_projection(self):
+        """Срезы и проекции"""
+        assert Checker.get_value(self.ITEMS, "items.[1:6:2].id") == ["b", "d", "f"]
+        assert Checker.get_value(self.ITEMS, "items.[-2:].id") == ["g", "h"]
+        assert Checker.get_value(self.ITEMS, "items.[0].{id,missing}") == {"id": "a", "missing": None}
+
+    def test_invalid_selector(self):
+        """Некорректный селектор и нулевой шаг среза"""
+        with pytest.raises(ValueError, match="Шаг среза"):
+            PathSelector("[::0]")
+        with pytest.raises(ValueError, match="Некорректный селектор"):
+            PathSelector("{}")
@@ -0,0 +1,71 @@
+"""data_collector_unit_tests"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from libs.api.airflow import session_serializer
+from libs.api.airflow.data_collector import SessionDataCollector
+from libs.api.airflow.helpers import get_worker_file_path, is_xdist_controller
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.utils import UpdatableSingleton
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    """Новый экземпляр SessionDataCollector (без общего singleton сессии)"""
+    monkeypatch.delitem(UpdatableSingleton._instances, SessionDataCollector, raising=False)
+    yield SessionDataCollector()
+    UpdatableSingleton._instances.pop(SessionDataCollector, None)
+
+
+def _config(worker: bool = False, **option) -> SimpleNamespace:
+    """pytest config с опциями pytest-xdist"""
+    config = SimpleNamespace(option=SimpleNamespace(**option))
+    if worker:
+        config.workerinput = {"workerid": "gw0"}
+    return config
+
+
+class TestXdistController:
+
+    @pytest.mark.parametrize("config, expected", [
+        (_config(dist="load", numprocesses=2, tx=["popen", "popen"]), True),
+        (_config(dist="loadscope", tx=["ssh=host//python=python3"]), True),
+        (_config(dist="load", numprocesses=0, tx=[]), False),
+        (_config(dist="load"), False),
+        (_config(dist="no", numprocesses=None, tx=[]), False),
+        (_config(), False),
+        (_config(worker=True, dist="load", numprocesses=2, tx=["popen", "popen"]), False),
+    ])
+    def test_is_xdist_controller(self, config, expected):
+        """Контроллер - только при наличии воркеров (`-n 0` и `--dist` без воркеров - обычный запуск)"""
+        assert is_xdist_controller(config) is expected
+
+
+class TestMergeWorkerSessions:
+
+    def test_merge_and_remove_files(self, collector, tmp_path):
+        """Файлы воркеров объединяются и удаляются после сохранения"""
+        filename = tmp_path / "test_results.json"
+        for worker_id in ("gw0", "gw1"):
+            data = SessionData()
+            data.add_test(f"tests/test_api.py::test_{worker_id}").status = "passed"
+            session_serializer.dump_session(data, get_worker_file_path(filename, worker_id))
+            collector.add_worker_file(worker_id, get_worker_file_path(filename, worker_id))
+
+        assert collector.merge_worker_sessions()
+        assert collector.save_session_data(filename)
+        merged = session_serializer.load_session(filename)
+        assert sorted(merged.tests) == ["tests/test_api.py::test_gw0", "tests/test_api.py::test_gw1"]
+        assert sorted(merged.workers) == ["gw0", "gw1"]
+        assert not list(tmp_path.glob("*.gw*.json")), "Файлы воркеров не удалены"
+
+    def test_no_worker_files_keeps_controller_data(self, collector, tmp_path):
+        """Без файлов воркеров данные контроллера сохраняются как при запуске без xdist"""
+        collector.mark_test_start("tests/test_api.py::test_local")
+        assert not collector.merge_worker_sessions()
+        assert collector.save_session_data(tmp_path / "test_results.json")
+        assert list(session_serializer.load_session(tmp_path / "test_results.json").tests) == [
+            "tests/test_api.py::test_local"
+        ]
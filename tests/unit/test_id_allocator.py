@@ -0,0 +1,67 @@
+"""id_allocator_unit_tests"""
+
+import threading
+import time
+from multiprocessing import Pool
+from pathlib import Path
+
+from Utils.IdAllocator import IdAllocator
+
+
+def _take_ids(args: tuple[str, str]) -> list[int]:
+    """Воркер: выдача ID блоками разного размера"""
+    state_path, journal_path = args
+    allocator = IdAllocator(state_path, block_size=50, journal_path=journal_path)
+    ids = []
+    for idx in range(600):
+        ids += allocator.take(1 + idx % 3)
+    allocator.close()
+    assert ids == allocator.issued
+    return ids
+
+
+class TestIdAllocator:
+
+    def test_unique_across_processes(self, tmp_path):
+        """ID уникальны между 8 процессами с общим файлом счетчика, журналы содержат все выданные ID"""
+        state_path = str(tmp_path / "ids.state")
+        journals = [str(tmp_path / f"test_ids_gw{idx}.txt") for idx in range(8)]
+        with Pool(8) as pool:
+            results = pool.map(_take_ids, [(state_path, journal) for journal in journals])
+        ids = [test_id for result in results for test_id in result]
+        assert len(ids) == len(set(ids)) == 8 * 1200, "ID повторяются между процессами"
+        assert all(result == sorted(result) for result in results), "ID процесса не возрастают"
+        journaled = [int(line) for journal in journals for line in Path(journal).read_text(encoding="utf-8").split()]
+        assert sorted(journaled) == sorted(ids)
+        assert int(Path(state_path).read_text(encoding="utf-8")) > max(ids)
+
+    def test_unique_across_threads(self, tmp_path):
+        """ID уникальны между потоками одного распределителя"""
+        allocator = IdAllocator(str(tmp_path / "ids.state"), block_size=10)
+        results = [[] for _ in range(8)]
+        threads = [
+            threading.Thread(target=lambda out: [out.extend(allocator.take(2)) for _ in range(200)], args=(result,))
+            for result in results
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ids = [test_id for result in results for test_id in result]
+        assert len(ids) == len(set(ids)) == 3200 and sorted(ids) == sorted(allocator.issued)
+
+    def test_monotonic_across_sessions(self, tmp_path):
+        """ID 16-значные и возрастают между сессиями, в том числе после удаления файла счетчика"""
+        state_path = tmp_path / "state" / "ids.state"
+        first = IdAllocator(str(state_path)).next()
+        second = IdAllocator(str(state_path)).next()
+        state_path.unlink()
+        time.sleep(0.01)
+        third = IdAllocator(str(state_path)).next()
+        assert len(str(first)) == 16 and first < second < third
+
+    def test_block_larger_than_size(self, tmp_path):
+        """Запрос больше размера блока выдается одним непрерывным диапазоном"""
+        allocator = IdAllocator(str(tmp_path / "ids.state"), block_size=4)
+        ids = allocator.take(10)
+        assert ids == list(range(ids[0], ids[0] + 10))
@@ -0,0 +1,75 @@
+"""json_snapshot_unit_tests"""
+
+import pytest
+
+from libs.api.airflow.checker import Checker
+from libs.api.airflow.json_snapshot import JsonSnapshot, assert_snapshot, diff_json
+
+DAGS = {
+    "dags": [
+        {"dag_id": "etl", "is_paused": False, "tags": [{"name": "a"}], "last_parsed_time": "t1"},
+        {"dag_id": "123", "is_paused": True, "tags": [], "last_parsed_time": "t1"},
+        {"dag_id": 7, "is_paused": True, "tags": [], "last_parsed_time": "t1"},
+    ],
+    "total_entries": 3,
+}
+OPTIONS = {"ignore": ["dags.[*].last_parsed_time"], "list_keys": {"dags": "dag_id"}}
+
+
+def _changed(**changes) -> dict:
+    """Копия DAGS с изменениями DAG по dag_id и перевернутым порядком DAGs"""
+    dags = [{**dag, **changes.get(str(dag["dag_id"]), {})} for dag in DAGS["dags"]]
+    return {**DAGS, "dags": dags[::-1]}
+
+
+class TestJsonSnapshot:
+
+    def test_digest_ignores_order_and_ignored_paths(self):
+        """Хеш не зависит от порядка ключей, порядка элементов с list_keys и игнорируемых путей"""
+        actual = _changed(etl={"last_parsed_time": "t2"})
+        assert JsonSnapshot(DAGS, **OPTIONS) == JsonSnapshot(actual, **OPTIONS)
+        assert JsonSnapshot(DAGS) != JsonSnapshot(actual)
+
+    def test_keyed_paths_requery(self):
+        """Пути различий по list_keys запрашиваются через Checker.get_value (в т.ч. числовые строки)"""
+        actual = _changed(**{"123": {"is_paused": False}, "7": {"is_paused": False}})
+        entries = diff_json(DAGS, actual, **OPTIONS)
+        assert [entry.path for entry in entries] == ['dags.[?dag_id="123"].is_paused', "dags.[?dag_id=7].is_paused"]
+        for entry in entries:
+            assert Checker.get_value(actual, entry.path) == [entry.actual], f"Путь не запрашивается: {entry.path}"
+
+    def test_unkeyed_items_by_index(self):
+        """Элементы без поля-идентификатора адресуются индексом"""
+        expected = {"dags": [{"dag_id": "etl"}, {"x": 1}]}
+        entries = diff_json(expected, {"dags": [{"dag_id": "etl"}, {"x": 2}]}, list_keys={"dags": "dag_id"})
+        assert [entry.path for entry in entries] == ["dags.[1].x"]
+
+    def test_numeric_equality(self):
+        """1 и 1.0 равны, True и 1 - нет"""
+        assert not diff_json({"v": 1, "w": [2]}, {"v": 1.0, "w": [2.0]})
+        assert JsonSnapshot({"v": 1}) == JsonSnapshot({"v": 1.0})
+        entries = diff_json({"v": 1}, {"v": True})
+        assert [(entry.path, entry.kind) for entry in entries] == [("v", "changed")]
+
+    def test_added_removed_repr(self):
+        """added/removed различия и читаемое отсутствующее значение"""
+        entries = diff_json({"a": 1}, {"b": 2})
+        assert [(entry.path, entry.kind) for entry in entries] == [("a", "removed"), ("b", "added")]
+        assert "<нет значения>" in repr(entries[0]) and "object at" not in repr(entries[0])
+        assert str(entries[1]) == 'ADDED: "b" | Фактически: 2'
+
+    def test_type_change(self):
+        """Смена типа контейнера"""
+        entries = diff_json({"a": [1]}, {"a": {"0": 1}})
+        assert [(entry.path, entry.kind) for entry in entries] == [("a", "type")]
+
+
+class TestAssertSnapshot:
+
+    def test_create_and_compare(self, tmp_path):
+        """Эталон создается при отсутствии файла, различия выводятся путями"""
+        file_path = str(tmp_path / "dags.json")
+        assert_snapshot(DAGS, file_path, **OPTIONS)
+        assert_snapshot(_changed(etl={"last_parsed_time": "t3"}), file_path, **OPTIONS)
+        with pytest.raises(AssertionError, match=r'dags\.\[\?dag_id="etl"\]\.is_paused'):
+            assert_snapshot(_changed(etl={"is_paused": True}), file_path, **OPTIONS)
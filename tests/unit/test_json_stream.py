@@ -0,0 +1,102 @@
+"""json_stream_unit_tests"""
+
+import json
+import random
+
+import pytest
+
+from libs.api.airflow.checker import Checker, PathTrie
+from libs.api.airflow.json_stream import JsonStreamWalker
+
+PATHS = ["dags", "dags.[*].dag_id", "dags.[*].tags.[*].name", "dags.[0].owners", "total_entries"]
+
+
+def _chunks(text: str, size: int) -> list[bytes]:
+    """Тело ответа частями по `size` байт (в т.ч. с разрывом многобайтовых символов UTF-8)"""
+    data = text.encode()
+    return [data[idx:idx + size] for idx in range(0, len(data), size)]
+
+
+def _document(rng: random.Random) -> dict:
+    """Случайный ответ `GET /dags`"""
+    return {
+        "dags": [
+            {
+                "dag_id": rng.choice(["dag_ё", "d\"ag", "даг"]) + str(idx) if rng.random() > 0.2 else None,
+                "tags": [{"name": rng.choice(["a", "б", "c\\d"])} for _ in range(rng.randint(0, 3))],
+                "owners": rng.choice([["airflow"], [], None]),
+                "extra": {"nested": [1, 2.5, True, None, "}]"]},
+            }
+            for idx in range(rng.randint(0, 6))
+        ],
+        "total_entries": rng.randint(0, 10),
+    }
+
+
+class _StreamResponse:
+    """requests.Response с `stream=True`"""
+
+    def __init__(self, text: str, status_code: int = 200):
+        self.status_code = status_code
+        self.url = "http://airflow/api/v1/dags"
+        self.text = text
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        return iter(_chunks(self.text, chunk_size))
+
+    def close(self):
+        self.closed = True
+
+
+class TestJsonStreamWalker:
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_equivalent_to_trie_walk(self, seed):
+        """Потоковый обход находит те же значения путей, что и `PathTrie.walk()` по объекту целиком"""
+        rng = random.Random(seed)
+        document = _document(rng)
+        expected: dict[str, list] = {path: [] for path in PATHS}
+        streamed: dict[str, list] = {path: [] for path in PATHS}
+        PathTrie(PATHS).walk(document, lambda path, value: expected[path].append(value))
+        walker = JsonStreamWalker(
+            _chunks(json.dumps(document, ensure_ascii=False), rng.randint(1, 7)),
+            PathTrie(PATHS), lambda path, value: streamed[path].append(value), materialize=True,
+        )
+        walker.walk()
+        expected["dags"] = [[]]  # узел с потомками передается пустым контейнером
+        assert streamed == expected, f"Расхождение с PathTrie.walk для seed={seed}"
+
+    def test_invalid_json(self):
+        """Невалидный JSON приводит к ValueError"""
+        with pytest.raises(ValueError):
+            JsonStreamWalker([b'{"dags": [1, 2'], PathTrie(PATHS), lambda *_: None).walk()
+
+
+class TestValidateResponseStream:
+
+    def test_counts_and_release(self):
+        """Возвращает количество найденных значений и закрывает ответ"""
+        response = _StreamResponse('{"dags": [{"dag_id": "a"}, {"dag_id": "b"}], "total_entries": 2}')
+        counts = Checker.validate_response_stream(
+            response, required_keys=["dags.[*].dag_id", "total_entries"], key_types={"dags": list}, chunk_size=4
+        )
+        assert counts == {"dags": 1, "dags.[*].dag_id": 2, "total_entries": 1}
+        assert response.closed, "Соединение не освобождено"
+
+    def test_type_error_stops_reading(self):
+        """Несоответствие типа прерывает чтение и закрывает ответ"""
+        response = _StreamResponse('{"dags": [{"dag_id": 1}, {"dag_id": "b"}]}')
+        with pytest.raises(AssertionError, match='Ошибка проверки типа для пути "dags.\\[\\*\\].dag_id"'):
+            Checker.validate_response_stream(response, key_types={"dags.[*].dag_id": str})
+        assert response.closed
+
+    def test_missing_required_key(self):
+        """Отсутствующий обязательный ключ"""
+        with pytest.raises(AssertionError, match='Путь "total_entries" не найден'):
+            Checker.validate_response_stream(_StreamResponse('{"dags": []}'), required_keys="total_entries")
+
+    def test_status_code(self):
+        """Неожиданный статус-код"""
+        with pytest.raises(AssertionError, match="Expected HTTP 200, got 404"):
+            Checker.validate_response_stream(_StreamResponse('{"detail": "not found"}', 404))
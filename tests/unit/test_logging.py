@@ -0,0 +1,278 @@
+"""logging_unit_tests"""
+
+import io
+import logging
+import threading
+import time
+
+import pytest
+
+from Utils import logging as log_module
+from Utils.logging import (
+    LazyFields, QueuedLogWriter, SampledLog, SmartLineBreakHandler, StructLog, TailLogBuffer, add_tail_buffer,
+)
+
+
+class _ListHandler(logging.Handler):
+    """Обработчик, сохраняющий выведенные сообщения"""
+
+    def __init__(self, level: int = logging.DEBUG):
+        super().__init__(level)
+        self.messages: list[str] = []
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+        self.records.append(record)
+
+
+@pytest.fixture
+def list_logger():
+    """Логгер уровня INFO с обработчиком, сохраняющим сообщения"""
+    logger = logging.getLogger("unit.list")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = _ListHandler()
+    logger.handlers = [handler]
+    yield logger, handler
+    logger.handlers = []
+
+
+@pytest.fixture
+def tail_logger():
+    """Логгер с двумя обработчиками (файл и консоль) и буфером DEBUG-записей теста"""
+    logger = logging.getLogger("unit.tail")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handlers = [add_tail_buffer(_ListHandler()), add_tail_buffer(_ListHandler())]
+    logger.handlers = list(handlers)
+    yield logger, handlers
+    TailLogBuffer.stop()
+    logger.handlers = []
+
+
+def _emit_records(handler: logging.Handler, count: int) -> None:
+    """Записи с флагами переноса строк и маркером отмены переноса из нескольких потоков по очереди"""
+    for idx in range(count):
+        message = f"record {idx}" + ("-#" if idx % 3 == 0 else "")
+        record = logging.makeLogRecord({"msg": message, "levelno": logging.INFO})
+        record.linesep_before = idx % 2 == 0
+        record.linesep_after = idx % 5 == 0
+        thread = threading.Thread(target=handler.handle, args=(record,))
+        thread.start()
+        thread.join()
+
+
+class TestQueuedLogWriter:
+
+    @pytest.fixture
+    def writer(self, monkeypatch):
+        """Отдельный экземпляр фонового потока вывода в буфер"""
+        writer = QueuedLogWriter(io.StringIO())
+        monkeypatch.setattr(QueuedLogWriter, "_instance", writer)
+        return writer
+
+    def test_queued_output_equals_direct(self, writer, monkeypatch):
+        """Вывод через очередь совпадает с прямым выводом: порядок, переносы строк и маркер отмены переноса"""
+        direct = io.StringIO()
+        monkeypatch.setattr(log_module, "stdout", direct)
+        _emit_records(SmartLineBreakHandler(), 50)
+
+        handler = SmartLineBreakHandler(queued=True)
+        _emit_records(handler, 50)
+        handler.flush()
+        assert writer.stream.getvalue() == direct.getvalue(), "Вывод через очередь отличается от прямого вывода"
+
+    def test_batched_write(self, writer, monkeypatch):
+        """Записи выводятся пачкой по истечении `flush_interval` без явного `flush()`"""
+        monkeypatch.setattr(QueuedLogWriter, "flush_interval", 0.05)
+        handler = SmartLineBreakHandler(queued=True)
+        _emit_records(handler, 3)
+        for _ in range(100):
+            if writer.stream.getvalue():
+                break
+            threading.Event().wait(0.02)
+        assert writer.stream.getvalue().count("record") == 3
+
+    def test_message_fixed_in_calling_thread(self, writer):
+        """Сообщение фиксируется в вызывающем потоке: фоновый поток не читает аргументы после вызова"""
+        logger = logging.getLogger("unit.queued")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        handler = SmartLineBreakHandler(queued=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.handlers = [handler]
+        data, state = {"cookie": "first"}, ["queued"]
+        StructLog(logger).debug("DataCollector", data=data, state=lambda: state[0])
+        data["cookie"], state[0] = "second", "running"
+        handler.flush()
+        logger.handlers = []
+        expected = f"{log_module.linesep}DataCollector | data: {{'cookie': 'first'}} | state: queued"
+        assert writer.stream.getvalue() == expected
+
+    def test_render_error_does_not_stop_writer(self, writer, monkeypatch):
+        """Ошибка сообщения записи обрабатывается `handleError` в вызывающем потоке, следующие записи выводятся"""
+        monkeypatch.setattr(logging, "raiseExceptions", False)
+        handler = SmartLineBreakHandler(queued=True)
+        handler.handle(logging.makeLogRecord({"msg": "%s %s", "args": (1,)}))
+        handler.handle(logging.makeLogRecord({"msg": "after"}))
+        handler.flush()
+        assert writer.stream.getvalue() == f"{log_module.linesep}after"
+
+
+class TestStructLog:
+
+    def test_lazy_fields_format(self):
+        """Формат "<event> | <key>: <value>", поля None пропускаются, callable вычисляется"""
+        fields = LazyFields("Send Request", {"method": "GET", "params": None, "body": lambda: "{}"})
+        assert str(fields) == "Send Request | method: GET | body: {}"
+
+    def test_disabled_level_not_rendered(self, list_logger):
+        """При выключенном уровне callable-поля не вычисляются и запись не создается"""
+        logger, handler = list_logger
+        calls = []
+        StructLog(logger).debug("Response", body=lambda: calls.append(1))
+        assert not calls and not handler.messages
+
+    def test_enabled_level_rendered_on_emit(self, list_logger):
+        """При включенном уровне сообщение собирается при выводе записи, место вызова - вызывающая функция"""
+        logger, handler = list_logger
+        records = []
+        logger.addFilter(lambda record: records.append(record) or True)
+        StructLog(logger).info("Response", status=200, body=lambda: "ok")
+        logger.filters.clear()
+        assert handler.messages == ["Response | status: 200 | body: ok"]
+        assert records[0].funcName == "test_enabled_level_rendered_on_emit", "Место вызова в записи не совпадает"
+
+
+class _Clock:
+    """Управляемое время `time.monotonic()` модуля логирования"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def __getattr__(self, name: str):
+        return getattr(time, name)
+
+
+class TestSampledLog:
+
+    @pytest.fixture
+    def sampled(self, list_logger, monkeypatch):
+        """SampledLog с управляемым временем"""
+        logger, handler = list_logger
+        clock = _Clock()
+        monkeypatch.setattr(log_module, "time", clock)
+        return SampledLog(logger), handler, clock
+
+    @staticmethod
+    def _poll(sampled, clock, states: list[tuple[float, str]]) -> None:
+        log, _, _ = sampled
+        for now, state in states:
+            clock.now = now
+            log.info("task", state, f"state {state}")
+
+    def test_repeats_suppressed(self, sampled):
+        """Повторы состояния подавляются, смена состояния выводится со свернутыми повторами"""
+        _, handler, clock = sampled
+        self._poll(sampled, clock, [(0, "QUEUED"), (1, "QUEUED"), (2, "QUEUED"), (3, "RUNNING")])
+        assert handler.messages == ["state QUEUED", 'state RUNNING | Свернуто: "QUEUED" x2 за 3 s']
+
+    def test_heartbeat(self, sampled):
+        """Неизменное состояние выводится раз в `heartbeat` секунд с количеством проверок"""
+        _, handler, clock = sampled
+        self._poll(sampled, clock, [(0, "RUNNING"), (30, "RUNNING"), (61, "RUNNING")])
+        assert handler.messages == ["state RUNNING", "state RUNNING | Без изменений: 2 проверок за 61 s"]
+
+    def test_rate_limit_keeps_transitions(self, sampled):
+        """Смена состояния сверх `rate` строк в секунду не теряется: выводится в свернутой строке `flush()`"""
+        log, handler, clock = sampled
+        self._poll(sampled, clock, [(0, "QUEUED"), (0.2, "RUNNING"), (0.4, "SUCCESS")])
+        log.flush("task")
+        assert handler.messages == ["state QUEUED", 'Свернуто: "RUNNING" x1 за 0 s -> "SUCCESS" x1 за 0 s']
+        assert not log._keys, "Ключ не удален после flush()"
+
+    def test_flush_without_repeats(self, sampled):
+        """`flush()` без подавленных повторов ничего не выводит"""
+        log, handler, clock = sampled
+        self._poll(sampled, clock, [(0, "SUCCESS")])
+        log.flush("task")
+        log.flush("unknown")
+        assert handler.messages == ["state SUCCESS"]
+
+    def test_disabled_level(self, sampled):
+        """Записи выключенного уровня не учитываются"""
+        log, handler, _ = sampled
+        log.debug("task", "QUEUED", "state QUEUED")
+        assert not handler.messages and not log._keys
+
+
+class TestTailLogBuffer:
+
+    def test_passed_test_drops_records(self, tail_logger):
+        """Записи прошедшего теста отбрасываются, INFO выводится сразу"""
+        logger, handlers = tail_logger
+        TailLogBuffer.start(10)
+        logger.debug("debug")
+        logger.info("info")
+        assert all(handler.messages == ["info"] for handler in handlers)
+        assert TailLogBuffer.stop() == 1, "Запись хранится в буфере один раз для всех обработчиков"
+
+    def test_flush_each_handler_once(self, tail_logger):
+        """При падении каждая отложенная запись выводится каждым обработчиком один раз, в исходном порядке"""
+        logger, handlers = tail_logger
+        TailLogBuffer.start(10)
+        for idx in range(3):
+            logger.debug("debug %s", idx)
+        TailLogBuffer.flush()
+        logger.debug("after")
+        assert all(handler.messages == ["debug 0", "debug 1", "debug 2", "after"] for handler in handlers)
+
+    def test_capacity_counts_records(self, tail_logger):
+        """Емкость и количество отброшенных записей не зависят от количества обработчиков"""
+        logger, handlers = tail_logger
+        TailLogBuffer.start(4)
+        for idx in range(6):
+            logger.debug("debug %s", idx)
+        TailLogBuffer.flush()
+        for handler in handlers:
+            assert handler.messages[0].startswith("Ранние DEBUG-записи теста отброшены: 2 (емкость буфера: 4)")
+            assert handler.messages[1:] == [f"debug {idx}" for idx in range(2, 6)]
+
+    def test_message_fixed_at_capture(self, tail_logger):
+        """Сообщение отложенной записи фиксируется при логировании: изменения аргументов после вызова не видны"""
+        logger, handlers = tail_logger
+        data, state = {"cookie": "first"}, ["queued"]
+        TailLogBuffer.start(10)
+        StructLog(logger).debug("DataCollector", data=data, state=lambda: state[0])
+        logger.debug("args %s", data)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.debug("error", exc_info=True)
+        data["cookie"], state[0] = "second", "running"
+        TailLogBuffer.flush()
+        assert handlers[0].messages[:2] == [
+            "DataCollector | data: {'cookie': 'first'} | state: queued", "args {'cookie': 'first'}",
+        ]
+        assert handlers[1].records[-1].exc_info is None and "ValueError: boom" in handlers[1].records[-1].exc_text
+
+    def test_message_error_not_buffered(self, tail_logger):
+        """Запись с ошибкой сообщения не откладывается: ошибка - при выводе записи обработчиком сразу"""
+        logger, _ = tail_logger
+        TailLogBuffer.start(10)
+        with pytest.raises(TypeError, match="not enough arguments"):
+            logger.debug("%s %s", 1)
+        assert TailLogBuffer.stop() == 0
+
+    def test_handler_level_respected(self, tail_logger):
+        """Запись откладывается только для обработчиков, уровень которых ее пропускает"""
+        logger, handlers = tail_logger
+        handlers[1].setLevel(logging.INFO)
+        TailLogBuffer.start(10)
+        logger.debug("debug")
+        TailLogBuffer.flush()
+        assert handlers[0].messages == ["debug"] and handlers[1].messages == []
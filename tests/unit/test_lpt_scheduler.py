@@ -0,0 +1,80 @@
+"""test_scheduler_unit_tests"""
+
+import pytest
+
+from libs.api.airflow import session_data, session_serializer
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.test_scheduler import get_schedule_unit, load_durations, plan_lpt, strip_group_suffix
+
+NODEIDS = [
+    "tests/test_a.py::test_fast",
+    "tests/test_a.py::TestDags::test_1",
+    "tests/test_a.py::TestDags::test_2",
+    "tests/test_b.py::test_slow",
+    "tests/test_b.py::test_new",
+]
+DURATIONS = {
+    "tests/test_a.py::test_fast": 1.0,
+    "tests/test_a.py::TestDags::test_1": 3.0,
+    "tests/test_a.py::TestDags::test_2": 4.0,
+    "tests/test_b.py::test_slow": 10.0,
+}
+
+
+class TestScheduleUnits:
+
+    @pytest.mark.parametrize("scope, expected", [
+        ("class", "tests/test_a.py::TestDags"),
+        ("module", "tests/test_a.py"),
+        ("test", "tests/test_a.py::TestDags::test_1[x]"),
+    ])
+    def test_unit(self, scope, expected):
+        """Единица планирования по scope, суффикс `@group` отбрасывается"""
+        assert get_schedule_unit("tests/test_a.py::TestDags::test_1[x]@lpt_0", scope) == expected
+
+    def test_strip_group_suffix(self):
+        """Суффикс группы не путается с параметрами теста"""
+        assert strip_group_suffix("tests/test_a.py::test_x[a@b]") == "tests/test_a.py::test_x[a@b]"
+        assert strip_group_suffix("tests/test_a.py::test_x[a]@lpt_1") == "tests/test_a.py::test_x[a]"
+
+
+class TestPlanLpt:
+
+    def test_longest_first(self):
+        """Единицы по убыванию длительности, тесты класса подряд в порядке сбора"""
+        plan = plan_lpt(NODEIDS, DURATIONS, workers=2)
+        assert plan.order == [
+            "tests/test_b.py::test_slow",
+            "tests/test_a.py::TestDags::test_1",
+            "tests/test_a.py::TestDags::test_2",
+            "tests/test_b.py::test_new",
+            "tests/test_a.py::test_fast",
+        ]
+        assert plan.unit_durations["tests/test_b.py::test_new"] == 3.5, "Тест без истории - медиана известных"
+
+    def test_bins_balanced(self):
+        """LPT-распределение по воркерам и оценка длительности сессии"""
+        plan = plan_lpt(NODEIDS, DURATIONS, workers=2)
+        assert plan.bins == [["tests/test_b.py::test_slow", "tests/test_a.py::test_fast"],
+                             ["tests/test_a.py::TestDags", "tests/test_b.py::test_new"]]
+        assert plan.bin_loads == [11.0, 10.5] and plan.makespan == 11.0
+
+    def test_fixed_groups_and_determinism(self):
+        """Тесты с собственной xdist_group не распределяются, план детерминирован"""
+        groups = {"tests/test_b.py::test_slow": "db"}
+        plan = plan_lpt(NODEIDS, DURATIONS, workers=3, groups=groups)
+        assert plan.fixed == ["@db"] and all("@db" not in unit for units in plan.bins for unit in units)
+        assert plan == plan_lpt(list(NODEIDS), dict(DURATIONS), workers=3, groups=groups)
+
+
+class TestLoadDurations:
+
+    def test_from_session_file(self, tmp_path):
+        """Длительности завершенных тестов из файла последней сессии"""
+        data = SessionData()
+        data.add_test("tests/test_a.py::test_fast@lpt_0").timing = session_data.TestTiming.from_dict(
+            {"start_timestamp": 1.0, "end_timestamp": 2.5, "duration": 1.5})
+        data.add_test("tests/test_a.py::test_unfinished")
+        session_serializer.dump_session(data, tmp_path / "test_results.json")
+        assert load_durations(session_file=tmp_path / "test_results.json") == {"tests/test_a.py::test_fast": 1.5}
+        assert load_durations(history_db=tmp_path / "missing.sqlite") == {}
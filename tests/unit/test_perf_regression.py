@@ -0,0 +1,98 @@
+"""perf_regression_unit_tests"""
+
+import random
+
+import pytest
+
+from libs.api.airflow import session_serializer
+from libs.api.airflow.perf_regression import PerfBaseline, robust_stats
+from libs.api.airflow.session_data import LatencySketch, SessionData
+
+
+def _sketch(samples: list[float]) -> LatencySketch:
+    sketch = LatencySketch()
+    for sample in samples:
+        sketch.add(sample)
+    return sketch
+
+
+class TestLatencySketch:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_quantiles_within_relative_error(self, seed):
+        """Квантили совпадают с точными с относительной погрешностью 1%, память - по числу корзин"""
+        rng = random.Random(seed)
+        samples = [rng.lognormvariate(-3, 0.8) for _ in range(20_000)]
+        sketch = _sketch(samples)
+        ordered = sorted(samples)
+        for q in (50, 90, 99):
+            exact = ordered[round(q / 100 * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011, abs=1e-4), f"p{q}"
+        assert sketch.count == len(samples) and sketch.max == max(samples)
+        assert len(sketch.buckets) < 1000, "Количество корзин не должно зависеть от количества запросов"
+
+    def test_merge_is_exact(self):
+        """Объединение статистик равно статистике всех длительностей"""
+        rng = random.Random(1)
+        first, second = [rng.random() for _ in range(500)], [rng.random() * 2 for _ in range(300)]
+        merged = _sketch(first)
+        merged.merge(_sketch(second))
+        assert merged.buckets == _sketch(first + second).buckets
+        assert merged.median == _sketch(first + second).median
+
+    def test_round_trip_and_legacy_list(self):
+        """to_dict/from_dict и список длительностей из файлов до LatencySketch"""
+        sketch = _sketch([0.0, 0.03, 0.031, 0.5])
+        assert LatencySketch.from_dict(sketch.to_dict()) == sketch
+        assert LatencySketch.from_dict([0.0, 0.03, 0.031, 0.5]) == sketch
+        assert LatencySketch().median == 0.0
+
+    def test_session_merge_and_serialize(self, tmp_path):
+        """Статистика запросов объединяется по воркерам и сохраняется в файле сессии"""
+        sessions = {}
+        for worker_id, samples in {"gw0": [0.1, 0.2], "gw1": [0.3]}.items():
+            sessions[worker_id] = SessionData()
+            sessions[worker_id].latencies["GET get_dag_by_id"] = _sketch(samples)
+        merged = SessionData.merge(sessions)
+        assert merged.latencies["GET get_dag_by_id"].count == 3
+
+        session_serializer.dump_session(merged, tmp_path / "test_results.json")
+        loaded = session_serializer.load_session(tmp_path / "test_results.json")
+        assert loaded.latencies == merged.latencies
+
+
+class TestPerfBaseline:
+
+    def test_robust_stats(self):
+        """Медиана и MAD устойчивы к выбросу"""
+        assert robust_stats([1.0, 1.1, 0.9, 1.0, 50.0]) == pytest.approx((1.0, 0.1))
+
+    def test_compare_flags_regressions(self):
+        """Регрессия - значимый z-score при достаточном абсолютном и относительном замедлении"""
+        baseline = PerfBaseline(
+            tests={"t::slow": [1.0, 1.1, 0.9, 1.0], "t::noise": [1.0, 1.1, 0.9, 1.0], "t::new": [1.0]},
+            endpoints={"GET get_dags_list": [0.05, 0.05, 0.06]},
+        )
+        report = baseline.compare(
+            {"t::slow": 3.0, "t::noise": 1.3, "t::new": 9.0},
+            {"GET get_dags_list": _sketch([0.2, 0.21, 0.19])},
+            budget=1.0,
+        )
+        assert [(regression.kind, regression.name) for regression in report.regressions] == [
+            ("test", "t::slow"), ("endpoint", "GET get_dags_list")
+        ]
+        assert report.compared_tests == 2 and report.compared_endpoints == 1
+        assert report.budget_exceeded and report.to_dict()["total_delta"] == report.total_delta
+
+    def test_update_window_and_save(self, tmp_path):
+        """Окно базовой линии ограничено `window`, эндпоинты хранят медиану прогона"""
+        baseline = PerfBaseline(window=3)
+        for run in range(5):
+            baseline.update({"t::a": float(run)}, {"GET get_dags_list": _sketch([0.1, 0.1, 0.3])})
+        assert baseline.tests["t::a"] == [2.0, 3.0, 4.0]
+        assert baseline.endpoints["GET get_dags_list"] == pytest.approx([0.1] * 3, rel=0.01)
+
+        baseline.save(tmp_path / "perf_baseline.json")
+        loaded = PerfBaseline.load(tmp_path / "perf_baseline.json", window=3)
+        assert loaded.tests == baseline.tests and loaded.endpoints == baseline.endpoints
+        assert PerfBaseline.load(tmp_path / "missing.json").tests == {}
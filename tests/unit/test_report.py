@@ -0,0 +1,153 @@
+"""report_unit_tests"""
+
+import random
+from types import SimpleNamespace
+from typing import Any, MutableMapping
+
+import pytest
+
+from Helpers.DataCollector import DataCollector
+from Utils import report
+from Utils.report import AttachmentPipeline, TRUNCATED_KEY, get_flatten_dict, iter_flatten
+
+
+def recursive_flatten_dict(d: MutableMapping, parent_key: str = '', sep: str = '_') -> dict:
+    """Рекурсивный `get_flatten_dict` до перехода на `iter_flatten` (эталон)"""
+    items = []
+    for key, value in d.items():
+        new_key = f'{parent_key}{sep}{key}' if parent_key else key
+        if isinstance(value, MutableMapping):
+            items.extend(recursive_flatten_dict(value, new_key, sep=sep).items())
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                items.extend(recursive_flatten_dict({f'{key}_{i}': item}, parent_key, sep=sep).items())
+        else:
+            items.append((new_key, value))
+    return dict(items)
+
+
+def _random_document(rng: random.Random, depth: int = 0) -> Any:
+    """Случайный JSON-документ: вложенные словари и списки, включая пустые"""
+    kind = rng.choice(["dict", "list", "scalar"] if depth < 5 else ["scalar"])
+    if kind == "dict":
+        return {rng.choice("abcxyz") + str(idx): _random_document(rng, depth + 1) for idx in range(rng.randint(0, 4))}
+    if kind == "list":
+        return [_random_document(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return rng.choice([None, True, 0, 1.5, "", "text", "x" * 60])
+
+
+def _response(content: bytes = b'{"id": 1}', status_code: int = 200, url: str = "http://host/pet") -> SimpleNamespace:
+    """Минимальный Response для конвейера вложений"""
+    return SimpleNamespace(url=url, request=SimpleNamespace(body=None), status_code=status_code, content=content)
+
+
+class TestIterFlatten:
+
+    @pytest.mark.parametrize("seed", range(200))
+    def test_equals_recursive(self, seed):
+        """`get_flatten_dict` на `iter_flatten` совпадает с рекурсивной версией: ключи, значения и порядок"""
+        rng = random.Random(seed)
+        document = {"root": _random_document(rng), "items": [_random_document(rng) for _ in range(3)]}
+        sep = rng.choice(["_", "."])
+        expected = recursive_flatten_dict(document, sep=sep)
+        result = get_flatten_dict(document, sep=sep)
+        assert list(result.items()) == list(expected.items())
+
+    def test_deep_document(self):
+        """Вложенность глубже лимита рекурсии разбирается без RecursionError"""
+        document = value = {}
+        for _ in range(5000):
+            value["a"] = value = {}
+        value["a"] = 1
+        assert get_flatten_dict(document) == {"_".join(["a"] * 5001): 1}
+
+    def test_max_depth(self):
+        """Контейнер глубже `max_depth` выводится одним значением"""
+        document = {"a": {"b": {"c": 1}, "list": [1, 2]}}
+        assert dict(iter_flatten(document, max_depth=1)) == {"a_b": "<dict: 1>", "a_list": "<list: 2>"}
+
+    def test_max_items_and_bytes(self):
+        """После лимита элементов или размера выводится `TRUNCATED_KEY` и обход прекращается"""
+        document = {"items": list(range(10))}
+        assert list(iter_flatten(document, max_items=3)) == [
+            ("items_0", 0), ("items_1", 1), ("items_2", 2), (TRUNCATED_KEY, "обрезано: лимит 3 элементов"),
+        ]
+        assert list(iter_flatten(document, max_bytes=16))[-1] == (
+            TRUNCATED_KEY, "обрезано: лимит 16 символов после 2 элементов",
+        )
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    """Вложения, добавленные в отчет: [(имя, тело)]"""
+    result = []
+    monkeypatch.setattr(report.allure, "attach", lambda body, name, attachment_type: result.append((name, body)))
+    DataCollector.reset_atr()
+    yield result
+    DataCollector.reset_atr()
+
+
+@pytest.fixture(params=[True, False], ids=["background", "sync"])
+def pipeline(request):
+    """Конвейер в фоновом режиме и в режиме потока запроса"""
+    return AttachmentPipeline(background=request.param, sample_after=100)
+
+
+class TestAttachmentPipeline:
+
+    def test_attachments_in_request_order(self, pipeline, attached):
+        """Вложения добавляются в отчет в порядке запросов"""
+        for idx in range(5):
+            pipeline.submit(_response(b'{"id": %d}' % idx))
+        pipeline.drain(end_of_test=True)
+        requests = [body for name, body in attached if name == "Request data"]
+        assert [f"'id': {idx}" in body for idx, body in enumerate(requests)] == [True] * 5
+        assert [name for name, _ in attached][-2:] == ["Request data", "Attachments summary"]
+        assert "duplicate: 4" in attached[-1][1], "Одинаковые вложения \"Parsed data\" не дедуплицированы"
+
+    def test_failed_build_does_not_lose_attachments(self, pipeline, attached, monkeypatch):
+        """Ошибка построения вложений одного запроса учитывается в сводке, остальные вложения добавляются"""
+        build = pipeline._build
+
+        def failing_build(endpoint, *args):
+            if endpoint.endswith("/fail"):
+                raise ValueError("broken body")
+            return build(endpoint, *args)
+
+        monkeypatch.setattr(pipeline, "_build", failing_build)
+        pipeline.submit(_response(b'{"id": 1}'))
+        pipeline.submit(_response(b'{"id": 2}', url="http://host/fail"))
+        pipeline.submit(_response(b'{"id": 3}'))
+        pipeline.drain(end_of_test=True)
+        assert [name for name, _ in attached].count("Request data") == 2
+        assert attached[-1][0] == "Attachments summary" and "error: 1" in attached[-1][1]
+
+    def test_parsed_data_snapshot(self, pipeline, attached):
+        """"Parsed data" - состояние DataCollector на момент запроса, включая вложенные значения"""
+        DataCollector({"cookie": {"session": "first"}})
+        pipeline.submit(_response())
+        DataCollector._data_dict["cookie"]["session"] = "second"
+        pipeline.drain()
+        parsed = dict(attached)["Parsed data"]
+        assert "first" in parsed and "second" not in parsed, "Снимок DataCollector изменен следующим запросом"
+
+    def test_duplicates_and_budget(self, attached):
+        """Одинаковые вложения теста добавляются один раз, вложения сверх бюджета пропускаются"""
+        pipeline = AttachmentPipeline(background=False, test_budget=600)
+        pipeline.submit(_response())
+        pipeline.submit(_response())
+        pipeline.submit(_response(b'{"id": "%s"}' % b"x" * 40))
+        pipeline.drain(end_of_test=True)
+        assert pipeline.skipped == {}, "Счетчики пропущенных вложений не сброшены в конце теста"
+        summary = attached[-1][1]
+        assert "duplicate: 3" in summary and "budget: 1" in summary
+
+    def test_sampling_keeps_errors(self, attached):
+        """После `sample_after` запросов вкладывается каждый `sample_every`-й запрос и все ответы с ошибкой"""
+        pipeline = AttachmentPipeline(background=False, sample_after=2, sample_every=3)
+        for idx in range(8):
+            pipeline.submit(_response(b'{"id": %d}' % idx, status_code=500 if idx == 3 else 200))
+        pipeline.drain(end_of_test=True)
+        requests = [body for name, body in attached if name == "Request data"]
+        assert [int(body.split("'id': ")[1][0]) for body in requests] == [0, 1, 3, 4, 7]
+        assert "sampling: 3" in attached[-1][1]
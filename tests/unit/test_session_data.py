@@ -0,0 +1,42 @@
+"""session_data_unit_tests"""
+
+from libs.api.airflow import session_data
+from libs.api.airflow.session_data import SessionData, WorkerStats
+
+
+class TestSessionDataModel:
+
+    def test_lazy_fields(self):
+        """meta, steps и tags создаются при первом обращении, статус - в UPPERCASE"""
+        test = SessionData().add_test("tests/dags/test_api.py::TestDags::test_list[1]")
+        assert (test.module, test.class_name, test.test_name) == ("test_api", "TestDags", "test_list[1]")
+        assert test._meta is None and test._steps is None and test._tags is None
+        test.steps.append("step")
+        test.status = "passed"
+        assert test.to_dict()["steps"] == ["step"] and test.status == "PASSED"
+
+    def test_timing_round_trip(self):
+        """Длительность сохраняется при восстановлении таймингов из to_dict()"""
+        timing = session_data.TestTiming(start_timestamp=100.0, end_timestamp=101.5)
+        timing._start_monotonic, timing._end_monotonic = 10.0, 11.5
+        restored = session_data.TestTiming.from_dict(timing.to_dict())
+        assert restored.duration == 1.5 and restored.start_time == timing.start_time
+        assert session_data.TestTiming().to_dict()["start_time"] is None
+
+    def test_merge_workers(self):
+        """Объединение сессий воркеров: время от раннего старта до позднего окончания, статистика воркеров"""
+        sessions = {}
+        for worker_id, (start, end) in {"gw0": (100.0, 110.0), "gw1": (102.0, 120.0)}.items():
+            data = SessionData()
+            data.session = session_data.SessionTiming.from_dict(
+                {"start_timestamp": start, "end_timestamp": end, "duration": end - start}
+            )
+            test = data.add_test(f"tests/test_api.py::test_{worker_id}")
+            test.timing = session_data.TestTiming.from_dict({"start_timestamp": start, "end_timestamp": end,
+                                                             "duration": 5.0})
+            sessions[worker_id] = data
+
+        merged = SessionData.merge(sessions)
+        assert merged.session.duration == 20.0 and len(merged.tests) == 2
+        assert merged.workers["gw1"] == WorkerStats(1, 102.0, 120.0, 18.0, 5.0)
+        assert merged.utilization == 0.25
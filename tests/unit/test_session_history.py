@@ -0,0 +1,73 @@
+"""session_history_unit_tests"""
+
+from libs.api.airflow import session_data, session_serializer
+from libs.api.airflow.helpers import get_worker_file_path
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.session_history import SessionHistory, percentile
+
+DAY = 86_400.0
+
+
+def _session(start: float, results: dict[str, tuple[str, float]]) -> SessionData:
+    """Сессия с тестами {nodeid: (статус, длительность)}"""
+    data = SessionData()
+    data.session = session_data.SessionTiming.from_dict({"start_timestamp": start, "end_timestamp": start + 60,
+                                                         "duration": 60.0})
+    for nodeid, (status, duration) in results.items():
+        test = data.add_test(nodeid)
+        test.timing = session_data.TestTiming.from_dict({"start_timestamp": start, "end_timestamp": start + duration,
+                                                         "duration": duration})
+        test.status = status
+    return data
+
+
+class TestSessionHistory:
+
+    def test_percentile(self):
+        """Линейная интерполяция перцентиля"""
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([5.0], 95) == 5.0
+
+    def test_ingest_idempotent(self, tmp_path):
+        """Повторная загрузка сессии пропускается"""
+        file_path = tmp_path / "test_results.json"
+        session_serializer.dump_session(_session(1000.0, {"tests/test_a.py::test_x": ("passed", 1.0)}), file_path)
+        with SessionHistory(tmp_path / "history.sqlite") as history:
+            assert history.ingest(file_path) == 1
+            assert history.ingest(file_path) == 0
+
+    def test_ingest_dir_skips_worker_files(self, tmp_path):
+        """Файлы воркеров xdist не загружаются повторно вместе с объединенным файлом"""
+        filename = tmp_path / "test_results.json"
+        tests = {"tests/test_a.py::test_x": ("passed", 1.0), "tests/test_a.py::test_y": ("passed", 2.0)}
+        session_serializer.dump_session(_session(1000.0, tests), filename)
+        session_serializer.dump_session(_session(1001.0, {"tests/test_a.py::test_x": ("passed", 1.0)}),
+                                        get_worker_file_path(filename, "gw0"))
+        session_serializer.dump_session(_session(1002.0, {"tests/test_a.py::test_y": ("passed", 2.0)}),
+                                        get_worker_file_path(filename, "gw1"))
+        with SessionHistory(tmp_path / "history.sqlite") as history:
+            assert history.ingest_dir(tmp_path) == 2
+            assert history.duration_percentiles()["tests/test_a.py::test_x"]["runs"] == 1
+            assert history.ingest_dir(tmp_path, workers=True) == 2
+
+    def test_queries(self, tmp_path):
+        """Перцентили, флакинесс и тренд по завершенным прогонам"""
+        with SessionHistory(tmp_path / "history.sqlite") as history:
+            for idx, status in enumerate(["passed", "failed", "passed", "passed"]):
+                history.ingest_session(_session(idx * DAY, {
+                    "tests/test_a.py::test_flaky": (status, float(idx + 1)),
+                    "tests/test_a.py::test_stable": ("passed", 1.0),
+                    "tests/test_a.py::test_skipped": ("skipped", 0.0),
+                }))
+            stats = history.duration_percentiles(percentiles=(50,))
+            assert stats["tests/test_a.py::test_flaky"] == {"runs": 4, "p50": 2.5, "max": 4.0}
+            assert "tests/test_a.py::test_skipped" not in stats
+
+            flaky = history.flakiness(min_runs=3)
+            assert list(flaky)[0] == "tests/test_a.py::test_flaky"
+            assert flaky["tests/test_a.py::test_flaky"]["flip_rate"] == round(2 / 3, 3)
+            assert flaky["tests/test_a.py::test_stable"]["failure_rate"] == 0.0
+
+            trend = history.trend(nodeid="tests/test_a.py::test_flaky")
+            assert [day["runs"] for day in trend] == [1, 1, 1, 1]
+            assert [day["failure_rate"] for day in trend] == [0.0, 1.0, 0.0, 0.0]
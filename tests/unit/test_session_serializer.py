@@ -0,0 +1,51 @@
+"""session_serializer_unit_tests"""
+
+import json
+
+from libs.api.airflow import session_data, session_serializer
+from libs.api.airflow.session_data import SessionData
+from libs.api.airflow.utils import convert_to_serializable
+
+
+def _session() -> SessionData:
+    """Сессия с завершенным, незавершенным тестом и статистикой воркера"""
+    data = SessionData(debug=True)
+    data.session = session_data.SessionTiming.from_dict({"start_timestamp": 100.0, "end_timestamp": 130.0,
+                                                         "duration": 30.0})
+    finished = data.add_test("tests/test_api.py::TestDags::test_list")
+    finished.timing = session_data.TestTiming.from_dict({"start_timestamp": 101.0, "end_timestamp": 103.0,
+                                                         "duration": 2.0})
+    finished.status = "failed"
+    finished.meta["owner"] = "тест"
+    finished.tags.append("smoke")
+    data.add_test("tests/test_api.py::test_unfinished")
+    data.workers["gw0"] = session_data.WorkerStats(2, 100.0, 130.0, 30.0, 2.0)
+    return data
+
+
+class TestSessionSerializer:
+
+    def test_same_layout_as_generic_walk(self):
+        """Формат совпадает с `convert_to_serializable` (None-значения и пустые workers/latencies не выводятся)"""
+        data = _session()
+        data.workers.clear()
+        generic = {key: value for key, value in convert_to_serializable(data).items() if value != {}}
+        assert session_serializer.session_to_dict(data) == generic
+
+    def test_round_trip(self, tmp_path):
+        """dump_session → load_session восстанавливает данные сессии"""
+        data = _session()
+        file_path = tmp_path / "test_results.json"
+        size = session_serializer.dump_session(data, file_path)
+        assert size == file_path.stat().st_size
+        assert "тест" in file_path.read_text(encoding="utf-8"), "Не-ASCII символы не должны экранироваться"
+
+        loaded = session_serializer.load_session(file_path)
+        assert session_serializer.session_to_dict(loaded) == session_serializer.session_to_dict(data)
+        assert loaded.tests["tests/test_api.py::TestDags::test_list"].timing.duration == 2.0
+
+    def test_dumps_compact(self):
+        """Компактный вывод без отступов, с отступом при indent=True"""
+        assert json.loads(session_serializer.dumps({"a": [1, None]})) == {"a": [1, None]}
+        assert b"\n" not in session_serializer.dumps({"a": 1})
+        assert b'\n  "a"' in session_serializer.dumps({"a": 1}, indent=True)
@@ -0,0 +1,66 @@
+"""session_writer_unit_tests"""
+
+import json
+
+import pytest
+
+from libs.api.airflow import session_serializer
+from libs.api.airflow.data_collector import SessionDataCollector
+from libs.api.airflow.session_writer import JsonlWriter
+from libs.api.airflow.utils import UpdatableSingleton
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    """Новый экземпляр SessionDataCollector (без общего singleton сессии)"""
+    monkeypatch.delitem(UpdatableSingleton._instances, SessionDataCollector, raising=False)
+    yield SessionDataCollector()
+    UpdatableSingleton._instances.pop(SessionDataCollector, None)
+
+
+class TestJsonlWriter:
+
+    def test_sync_every(self, tmp_path):
+        """Буфер синхронизируется каждые `fsync_every` записей"""
+        file_path = tmp_path / "log" / "results.jsonl"
+        with JsonlWriter(file_path, fsync_every=2, fsync_interval=3600) as writer:
+            writer.write({"n": 1})
+            assert file_path.read_bytes() == b"", "Запись до синхронизации не должна быть на диске"
+            writer.write({"n": 2, "text": "тест"})
+            assert file_path.read_text(encoding="utf-8").splitlines() == ['{"n":1}', '{"n":2,"text":"тест"}']
+        assert writer.closed and writer.records == 2
+
+    def test_iter_jsonl_skips_truncated_tail(self, tmp_path):
+        """Неполная последняя строка пропускается, некорректная строка в середине - ошибка"""
+        file_path = tmp_path / "results.jsonl"
+        file_path.write_bytes(b'{"n": 1}\n\n{"n": 2}\n{"n": ')
+        assert list(session_serializer.iter_jsonl(file_path)) == [{"n": 1}, {"n": 2}]
+        file_path.write_bytes(b'{"n": 1}\n{"n": \n{"n": 3}\n')
+        with pytest.raises(ValueError):
+            list(session_serializer.iter_jsonl(file_path))
+
+
+class TestStreaming:
+
+    def test_tests_streamed_and_dropped(self, collector, tmp_path):
+        """Завершенные тесты записываются строками JSONL и удаляются из памяти, итоги - в конце файла"""
+        file_path = tmp_path / "results.jsonl"
+        collector.start_session(debug=False)
+        collector.start_streaming(file_path, fsync_every=1)
+        for idx in range(3):
+            nodeid = f"tests/test_api.py::TestDags::test_{idx}"
+            collector.mark_test_start(nodeid)
+            collector.mark_test_stop(nodeid, "passed")
+        collector.mark_test_start("tests/test_api.py::test_unfinished")
+        assert len(collector.data.tests) == 1, "Завершенные тесты не удалены из памяти"
+        assert len(collector.test_durations()) == 3
+
+        collector.stop_session()
+        assert collector.save_session_data(None) is True
+        records = [json.loads(line) for line in file_path.read_text(encoding="utf-8").splitlines()]
+        assert [record["record"] for record in records] == ["session_start", *["test"] * 4, "session"]
+        assert records[-1]["tests_count"] == 4
+
+        loaded = session_serializer.load_session(file_path)
+        assert list(loaded.tests) == [record["nodeid"] for record in records[1:-1]]
+        assert loaded.tests["tests/test_api.py::TestDags::test_0"].status == "PASSED"
@@ -0,0 +1,128 @@
+"""swagger_payload_unit_tests"""
+
+import random
+
+import pytest
+
+from benchmarks.bench_swagger_payload import PETSTORE_SPEC
+from libs.api.airflow import swagger_payload
+from libs.api.airflow.swagger_payload import PayloadFactory, get_payload_factory
+from libs.api.airflow.swagger_validator import SchemaValidators
+
+# OpenAPI 3.x: ограничения значений, allOf/oneOf, рекурсивная схема
+OPENAPI_SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/dags": {"get": {"parameters": [
+            {"name": "order_by", "in": "query", "schema": {"type": "string", "enum": ["dag_id", "-dag_id"]}},
+            {"name": "tags", "in": "query", "schema": {"type": "array", "items": {"type": "string", "enum": ["a"]}}},
+            {"name": "limit", "in": "query", "schema": {"type": "integer"}},
+        ]}},
+        "/dags/{dag_id}": {"patch": {"requestBody": {"content": {
+            "application/json": {"schema": {"type": "object", "properties": {
+                "is_paused": {"type": "boolean"}, "state": {"type": "string", "enum": ["queued"]},
+            }}},
+        }}}},
+    },
+    "components": {"schemas": {
+        "Base": {"type": "object", "required": ["id"], "properties": {
+            "id": {"type": "integer", "format": "int32", "minimum": 1, "maximum": 10},
+        }},
+        "Dag": {"allOf": [
+            {"$ref": "#/components/schemas/Base"},
+            {"type": "object", "required": ["name"], "properties": {
+                "name": {"type": "string", "minLength": 3, "maxLength": 5},
+                "owners": {"type": "array", "minItems": 1, "maxItems": 2, "items": {"type": "string"}},
+                "rate": {"type": "number", "minimum": 0.5, "maximum": 1.5},
+                "paused": {"type": "boolean"},
+                "created": {"type": "string", "format": "date-time"},
+                "schedule": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+                "state": {"type": "string", "enum": ["queued", "running"]},
+            }},
+        ]},
+        "Node": {"type": "object", "required": ["name", "children"], "properties": {
+            "name": {"type": "string"},
+            "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+        }},
+    }},
+}
+
+
+def _depth(node: dict) -> int:
+    """Глубина вложенности рекурсивной схемы Node"""
+    return 1 + max((_depth(child) for child in node["children"]), default=0)
+
+
+class TestPayloadFactory:
+
+    @pytest.mark.parametrize("seed", range(50))
+    @pytest.mark.parametrize("spec, names", [
+        (PETSTORE_SPEC, ["Pet", "Category", "Tag"]),
+        (OPENAPI_SPEC, ["Base", "Dag", "Node"]),
+    ], ids=["swagger2", "openapi3"])
+    def test_payloads_match_validators(self, spec, names, seed):
+        """Payload "min", "max" и граничные payload проходят валидацию `SchemaValidators` той же спецификации"""
+        factory, validators, rng = PayloadFactory(spec), SchemaValidators(spec), random.Random(seed)
+        for name in names:
+            for mode in ("min", "max"):
+                validators.validate(name, factory.build(name, mode, rng))
+            for _, payload in factory.boundary_payloads(name, rng):
+                validators.validate(name, payload)
+
+    def test_min_and_max_modes(self):
+        """"min" - только обязательные свойства, "max" - все свойства в пределах ограничений"""
+        factory, rng = PayloadFactory(PETSTORE_SPEC), random.Random(0)
+        assert set(factory.build("Pet", "min", rng)) == {"name", "photoUrls"}
+        for dag in PayloadFactory(OPENAPI_SPEC).build_many("Dag", 200, "max", rng):
+            assert 1 <= dag["id"] <= 10 and 3 <= len(dag["name"]) <= 5 and 1 <= len(dag["owners"]) <= 2
+            assert 0.5 <= dag["rate"] <= 1.5 and dag["state"] in ("queued", "running")
+
+    def test_reproducible_with_seed(self):
+        """Одинаковый seed - одинаковые payload"""
+        factory = PayloadFactory(PETSTORE_SPEC)
+        assert factory.build_many("Pet", 5, rng=random.Random(1)) == factory.build_many("Pet", 5, rng=random.Random(1))
+
+    def test_text_callback(self):
+        """Строковые значения строит `text(schema, key)`"""
+        payload = PayloadFactory(PETSTORE_SPEC).build("Pet", "max", random.Random(0), text=lambda schema, key: key)
+        assert payload["name"] == "name" and payload["category"]["name"] == "name"
+        assert set(payload["photoUrls"]) == {"photoUrls"}
+
+    def test_recursive_schema_depth(self):
+        """Рекурсивная схема строится с ограничением глубины `MAX_DEPTH`"""
+        factory = PayloadFactory(OPENAPI_SPEC)
+        nodes = factory.build_many("Node", 20, "max", random.Random(0))
+        assert max(_depth(node) for node in nodes) <= swagger_payload.MAX_DEPTH + 1
+
+    def test_boundary_payloads(self):
+        """Граничные payload: одно свойство заменено граничным значением"""
+        boundaries = PayloadFactory(OPENAPI_SPEC).boundary_payloads("Dag", random.Random(0))
+        values = {}
+        for path, payload in boundaries:
+            values.setdefault(path, []).append(payload[path])
+        assert values["id"] == [1, 10] and values["name"] == ["xxx", "xxxxx"]
+        assert [len(owners) for owners in values["owners"]] == [1, 2]
+        assert values["paused"] == [True, False] and values["state"] == ["queued", "running"]
+
+    def test_operation_enums(self):
+        """Перечислимые параметры операции и свойства тела запроса"""
+        assert PayloadFactory(PETSTORE_SPEC).operation_enums("/pet", "POST") == {
+            "status": {"type": "string", "enum": ["available", "pending", "sold"]},
+        }
+        factory = PayloadFactory(OPENAPI_SPEC)
+        assert factory.operation_enums("/dags", "GET") == {
+            "order_by": {"type": "string", "enum": ["dag_id", "-dag_id"]}, "tags": {"type": "string", "enum": ["a"]},
+        }
+        assert factory.operation_enums("/dags/{dag_id}", "PATCH") == {"state": {"type": "string", "enum": ["queued"]}}
+
+    def test_unknown_schema(self):
+        """Неизвестная схема - KeyError со списком доступных схем"""
+        with pytest.raises(KeyError, match="Доступные: Category, Tag, Pet"):
+            _ = PayloadFactory(PETSTORE_SPEC)["Order"]
+
+    def test_get_payload_factory_cache(self):
+        """Фабрика кешируется по хешу спецификации (`SpecCache`)"""
+        factory = get_payload_factory(PETSTORE_SPEC)
+        assert get_payload_factory(PETSTORE_SPEC) is factory
+        assert get_payload_factory({**PETSTORE_SPEC}) is factory, "Для равной спецификации построена новая фабрика"
+        assert get_payload_factory(OPENAPI_SPEC) is not factory
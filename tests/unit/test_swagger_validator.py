@@ -0,0 +1,69 @@
+"""swagger_validator_unit_tests"""
+
+import pytest
+
+from libs.api.airflow import swagger_validator
+from libs.api.airflow.swagger_validator import SchemaValidators, SpecCache, get_schema_validators
+
+SPEC = {
+    "definitions": {
+        "Tag": {"type": "object", "required": ["name"], "properties": {"name": {"type": "string"}}},
+        "Pet": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": ["string", "null"]},
+                "tags": {"type": "array", "items": {"$ref": "#/definitions/Tag"}},
+            },
+        },
+    },
+}
+
+
+class TestSchemaValidators:
+
+    def test_validate_path_in_error(self):
+        """Ошибка валидации содержит путь до несоответствия"""
+        validators = SchemaValidators(SPEC)
+        validators.validate("Pet", {"id": 1, "name": "doggie", "tags": [{"name": "a"}]})
+
+        with pytest.raises(AssertionError, match=r'Путь: "tags\.\[1\]\.name"'):
+            validators.validate("Pet", {"name": "doggie", "tags": [{"name": "a"}, {"name": 1}]})
+
+    def test_bool_is_not_integer(self):
+        """bool не проходит проверку типа integer"""
+        with pytest.raises(AssertionError, match="Ожидаемый тип: integer"):
+            SchemaValidators(SPEC).validate("Pet", {"id": True, "name": "doggie"})
+
+    def test_type_list_openapi_31(self):
+        """OpenAPI 3.1: список типов с "null" - объединение типов, допускающее None"""
+        validators = SchemaValidators(SPEC)
+        validators.validate("Pet", {"name": None})
+
+        with pytest.raises(AssertionError, match=r"Ожидаемый тип: string \| Фактический тип: int"):
+            validators.validate("Pet", {"name": 1})
+
+
+class TestSpecCache:
+
+    def test_equal_specs_share_instance(self):
+        """Равные по содержимому спецификации используют общий объект, новый словарь не копится в кеше"""
+        cache = SpecCache(SchemaValidators)
+        first = cache.get(SPEC)
+        second = cache.get({**SPEC})
+
+        assert first is second, "Для равных спецификаций построен новый объект"
+        assert cache._last[0] is not SPEC, "Кеш хранит ссылку не только на последнюю спецификацию"
+
+    def test_last_spec_skips_hash(self, monkeypatch):
+        """Повторная передача последнего объекта спецификации не пересчитывает хеш"""
+        cache = SpecCache(SchemaValidators)
+        validators = cache.get(SPEC)
+        monkeypatch.setattr(swagger_validator, "get_spec_hash", pytest.fail)
+
+        assert cache.get(SPEC) is validators
+
+    def test_get_schema_validators(self):
+        """Модульный кеш валидаторов"""
+        assert get_schema_validators(SPEC) is get_schema_validators({**SPEC})
@@ -0,0 +1,209 @@
+"""updatable_dot_dict_unit_tests"""
+
+import copy
+import json
+import pickle
+import random
+import threading
+from typing import Any
+
+import pytest
+
+from Utils.UpdatableDotDict import Config, DotDict, FrozenDotDict, LazyDotDict, LazyList
+
+
+def _random_document(rng: random.Random, depth: int = 0) -> Any:
+    """Случайный JSON-документ: вложенные словари и списки"""
+    kind = rng.choice(["dict", "list", "scalar"] if depth < 4 else ["scalar"])
+    if kind == "dict":
+        return {f"k{idx}": _random_document(rng, depth + 1) for idx in range(rng.randint(0, 4))}
+    if kind == "list":
+        return [_random_document(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return rng.choice([None, True, 1, 2.5, "text"])
+
+
+def _read_all(value: Any) -> Any:
+    """Полное чтение структуры через обращения `[]` (как в тестах)"""
+    if isinstance(value, dict):
+        return {key: _read_all(value[key]) for key in value}
+    if isinstance(value, list):
+        return [_read_all(value[idx]) for idx in range(len(value))]
+    return value
+
+
+class TestLazyDotDict:
+
+    @pytest.mark.parametrize("seed", range(100))
+    def test_equals_dot_dict(self, seed):
+        """Чтение и `to_dict()` совпадают с DotDict, исходные данные не изменяются"""
+        rng = random.Random(seed)
+        data = {"root": _random_document(rng), "items": [_random_document(rng) for _ in range(3)]}
+        original = copy.deepcopy(data)
+        lazy = LazyDotDict(data)
+        assert _read_all(lazy) == _read_all(DotDict(data)) == original
+        assert lazy.to_dict() == DotDict(data).to_dict() == original
+        assert data == original, "Исходные данные изменены"
+
+    def test_wrap_on_access(self):
+        """Вложенные структуры оборачиваются при первом обращении и кешируются"""
+        lazy = LazyDotDict({"dag_runs": [{"state": "success", "conf": {"a": 1}}], "other": {"b": 2}})
+        assert type(dict.__getitem__(lazy, "dag_runs")) is list
+        run = lazy.dag_runs[0]
+        assert isinstance(lazy.dag_runs, LazyList) and isinstance(run, LazyDotDict)
+        assert lazy.dag_runs[0] is run, "Обертка не кешируется"
+        assert run.state == "success" and run.conf.a == 1
+        assert type(dict.__getitem__(lazy, "other")) is dict, "Необращенные данные обернуты"
+
+    def test_dict_api(self):
+        """`get()`, `values()`, `items()`, итерация и срезы списка возвращают обернутые значения"""
+        lazy = LazyDotDict({"a": {"b": 1}, "c": [[1], {"d": 2}]})
+        assert isinstance(lazy.get("a"), LazyDotDict) and lazy.get("x", 0) == 0
+        assert [type(value) for value in lazy.values()] == [LazyDotDict, LazyList]
+        assert isinstance(lazy.items()[1][1][1], LazyDotDict)
+        assert [type(item) for item in lazy.c] == [LazyList, LazyDotDict]
+        assert isinstance(lazy.c[1:], LazyList) and lazy.c[1:][0].d == 2
+
+    def test_set_and_delete(self):
+        """Установка и удаление ключей как атрибутов"""
+        lazy = LazyDotDict({"a": 1})
+        lazy.b = {"c": 2}
+        del lazy.a
+        assert lazy.b.c == 2 and "a" not in lazy
+        with pytest.raises(AttributeError):
+            del lazy.a
+
+    def test_missing_attribute(self):
+        """Отсутствующий ключ - AttributeError; служебные атрибуты не логируются как ошибка"""
+        lazy = LazyDotDict({"a": 1})
+        with pytest.raises(AttributeError, match="не содержит атрибута"):
+            _ = lazy.missing
+        assert not hasattr(lazy, "__deepcopy_hook__")
+
+    def test_serialization(self):
+        """JSON, pickle и deepcopy сохраняют содержимое"""
+        lazy = LazyDotDict({"a": {"b": [1, {"c": 2}]}})
+        _ = lazy.a.b[1].c
+        assert json.loads(json.dumps(lazy)) == lazy.to_dict()
+        assert pickle.loads(pickle.dumps(lazy)).to_dict() == lazy.to_dict()
+        assert copy.deepcopy(lazy).to_dict() == lazy.to_dict()
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """Новый экземпляр Config (без общего singleton)"""
+    instances = type(Config)._instances
+    monkeypatch.delitem(instances, Config, raising=False)
+    yield Config
+    instances.pop(Config, None)
+
+
+def _run_with_timeout(func, timeout: float = 5.0) -> None:
+    """Вызов в отдельном потоке: зависание (взаимная блокировка) - ошибка теста, а не зависание сессии"""
+    errors = []
+    thread = threading.Thread(target=lambda: errors.extend(_call(func)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"Вызов не завершился за {timeout} s (взаимная блокировка)"
+    if errors:
+        raise errors[0]
+
+
+def _call(func) -> list[Exception]:
+    try:
+        func()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return [e]
+    return []
+
+
+class TestConfig:
+
+    def test_nested_update(self, config):
+        """Создание и обновление с вложенными словарями не захватывает блокировку синглтона повторно"""
+        _run_with_timeout(lambda: (config({"timeout": 5}), config({"rest": {"port": 2}})))
+        _run_with_timeout(lambda: config(rest={"host": "localhost"}))
+        assert config().to_dict() == {"timeout": 5, "rest": {"port": 2, "host": "localhost"}}
+        assert type(dict.__getitem__(config(), "rest")) is DotDict and config().rest.port == 2
+
+    def test_nested_create(self, config):
+        """Создание экземпляра с вложенными словарями"""
+        _run_with_timeout(lambda: config({"rest": {"auth": {"user": "admin"}}, "hosts": [{"name": "a"}]}))
+        assert config().rest.auth.user == "admin" and config().hosts[0].name == "a"
+
+    def test_invalid_update_not_applied(self, config):
+        """Обновление с ошибкой валидации не изменяет конфигурацию и снимок"""
+        config({"timeout": 5, "rest": {"port": 1}})
+        snapshot = config().snapshot
+        with pytest.raises(ValueError, match="timeout"):
+            config({"timeout": 500, "rest": {"port": 2}})
+        assert config().to_dict() == {"timeout": 5, "rest": {"port": 1}}
+        assert config().snapshot is snapshot
+
+    def test_snapshot(self, config):
+        """Снимок неизменяемый, общий до обновления и заменяется после обновления"""
+        config({"timeout": 5})
+        snapshot = config().snapshot
+        assert isinstance(snapshot, FrozenDotDict) and config().snapshot is snapshot
+        config({"timeout": 6})
+        assert snapshot.timeout == 5 and config().snapshot.timeout == 6
+        config()["extra"] = 1
+        assert config().snapshot.extra == 1, "Снимок не пересоздан после установки значения"
+
+    def test_callbacks(self, config):
+        """Подписчики уведомляются после применения обновления"""
+        config({"timeout": 5})
+        seen = []
+        config().add_callback(lambda instance: seen.append(instance.snapshot.timeout))
+        config(timeout=7)
+        assert seen == [7]
+
+    def test_concurrent_readers(self, config):
+        """Читатели снимка не видят частично примененное обновление"""
+        config({"a": 0, "b": {"value": 0}})
+        stop, inconsistent = threading.Event(), []
+
+        def read():
+            while not stop.is_set():
+                snapshot = config().snapshot
+                if snapshot.a != snapshot.b.value:
+                    inconsistent.append(snapshot)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for idx in range(1, 200):
+            config({"a": idx, "b": {"value": idx}})
+        stop.set()
+        for reader in readers:
+            reader.join()
+        assert not inconsistent
+
+
+class TestFrozenDotDict:
+
+    def test_deep_freeze(self):
+        """Вложенные dict - FrozenDotDict, list - tuple; `to_dict()` возвращает изменяемые структуры"""
+        frozen = FrozenDotDict({"a": {"b": [1, {"c": 2}]}}, d=3)
+        assert isinstance(frozen.a, FrozenDotDict) and frozen.a.b == (1, FrozenDotDict({"c": 2}))
+        assert frozen.to_dict() == {"a": {"b": [1, {"c": 2}]}, "d": 3}
+
+    @pytest.mark.parametrize("change", [
+        lambda frozen: frozen.__setitem__("a", 1),
+        lambda frozen: setattr(frozen, "a", 1),
+        lambda frozen: frozen.update(a=1),
+        lambda frozen: frozen.pop("a"),
+        lambda frozen: frozen.a.clear(),
+        lambda frozen: frozen.__delitem__("a"),
+    ])
+    def test_readonly(self, change):
+        """Любое изменение, включая вложенные словари, - TypeError"""
+        frozen = FrozenDotDict({"a": {"b": 1}})
+        with pytest.raises(TypeError, match="только для чтения"):
+            change(frozen)
+        assert frozen == {"a": {"b": 1}}
+
+    def test_pickle_and_copy(self):
+        """pickle и deepcopy сохраняют содержимое и тип"""
+        frozen = FrozenDotDict({"a": {"b": [1, 2]}})
+        for restored in (pickle.loads(pickle.dumps(frozen)), copy.deepcopy(frozen)):
+            assert isinstance(restored, FrozenDotDict) and restored == frozen